@@ -0,0 +1,266 @@
+(function () {
+    const api = window.TMS_API;
+    const storeCode = new URLSearchParams(location.search).get('store') || 'STR001';
+    const app = document.getElementById('app');
+    // Web Mercator map centred on the store, exposing its viewport the way the drawing engine reads it
+    const MAP_DOCUMENT = `<!DOCTYPE html><html><body style="margin:0">
+        <div style="width:100vw;height:100vh;background:#e8eef2"></div>
+        <script>
+            const center = [19.1197, 72.8468];
+            const zoom = 13;
+            const scale = 256 * Math.pow(2, zoom);
+            const project = ([lat, lng]) => {
+                const sin = Math.sin(lat * Math.PI / 180);
+                return [(lng + 180) / 360 * scale, (0.5 - Math.log((1 + sin) / (1 - sin)) / (4 * Math.PI)) * scale];
+            };
+            const unproject = ([x, y]) => [Math.atan(Math.sinh(Math.PI * (1 - 2 * y / scale))) * 180 / Math.PI, x / scale * 360 - 180];
+            const [centerX, centerY] = project(center);
+            const origin = [centerX - innerWidth / 2, centerY - innerHeight / 2];
+            const [north, west] = unproject(origin);
+            const [south, east] = unproject([origin[0] + innerWidth, origin[1] + innerHeight]);
+            window.mapViewport = { north, south, east, west, zoom };
+
+            document.addEventListener('click', (event) => {
+                const [latitude, longitude] = unproject([origin[0] + event.clientX, origin[1] + event.clientY]);
+                window.parent.postMessage({ type: 'vertex', latitude, longitude }, '*');
+            });
+        <\/script></body></html>`;
+
+    let searchTimer = null;
+    let drawnVertices = [];
+    let uploadedCoordinates = null;
+
+    window.addEventListener('message', (event) => {
+        if (event.data && event.data.type === 'vertex') {
+            drawnVertices.push([event.data.latitude, event.data.longitude]);
+        }
+    });
+
+    function url(name, params, query) {
+        const path = api.paths[name].replace(/\{(\w+)\}/g, (_, key) => encodeURIComponent(params[key]));
+        const search = query ? '?' + new URLSearchParams(query) : '';
+        return api.base + path + search;
+    }
+
+    async function request(method, name, params, body, query) {
+        const response = await fetch(url(name, params || {}, query), {
+            method,
+            headers: { 'Content-Type': 'application/json' },
+            body: body ? JSON.stringify(body) : undefined
+        });
+        const payload = await response.json();
+        if (!response.ok) {
+            throw new Error(payload.error || response.statusText);
+        }
+        return payload.data;
+    }
+
+    function escapeHtml(value) {
+        return String(value).replace(/[&<>"']/g, (c) => ({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' }[c]));
+    }
+
+    function describe(polygon) {
+        const attributes = (polygon.polygon && polygon.polygon.attributes) || {};
+        if (attributes.travel_distance !== undefined) {
+            return `Travel Distance: ${attributes.travel_distance} metres`;
+        }
+        if (attributes.travel_time !== undefined) {
+            return `Travel Time: ${attributes.travel_time} mins`;
+        }
+        return 'Manual polygon';
+    }
+
+    function toggle(element) {
+        element.classList.toggle('hidden');
+    }
+
+    async function renderStore() {
+        const store = await request('GET', 'store', { store_code: storeCode });
+        const statusAction = store.status === 'Active' ? 'Set as Inactive' : 'Set as Active';
+
+        app.innerHTML = `
+            <div class="sidebar-header">
+                <h4>Store Details</h4>
+                <h2>${escapeHtml(store.name)}</h2>
+                <span data-testid="components_JMBadge_JMBadge_span">${escapeHtml(store.status)}</span>
+                <span data-testid="StoreDetails_SidebarHeader_SidebarHeader_SvgIcMoreVertical" id="store-menu-toggle">&#8942;</span>
+                <div id="store-menu" class="menu hidden">
+                    <a id="export-data">Export Data</a>
+                    <a target="_self" id="store-status-action">${statusAction}</a>
+                </div>
+            </div>
+            <p>Store polygons</p>
+            <button data-testid="components_JMButton_JMButton_Button" id="create-polygon">Create Polygon</button>
+            <input type="text" placeholder="Search Polygon" aria-label="Search Polygon" id="search-polygon">
+            <div id="polygon-list"></div>`;
+
+        const storeMenu = document.getElementById('store-menu');
+        document.getElementById('store-menu-toggle').addEventListener('click', () => toggle(storeMenu));
+        document.getElementById('export-data').addEventListener('click', () => exportData(storeMenu));
+        document.getElementById('store-status-action').addEventListener('click', async () => {
+            storeMenu.classList.add('hidden');
+            await request('PATCH', 'store_status', { store_code: storeCode }, { status: store.status === 'Active' ? 'Inactive' : 'Active' });
+            await renderStore();
+        });
+        document.getElementById('create-polygon').addEventListener('click', () => { location.hash = '#/create'; });
+
+        const search = document.getElementById('search-polygon');
+        search.addEventListener('input', () => {
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(() => loadPolygons(search.value), 150);
+        });
+
+        await loadPolygons('');
+    }
+
+    async function loadPolygons(searchText) {
+        const polygons = await request('GET', 'polygons', { store_code: storeCode }, null, searchText ? { search: searchText } : null);
+        const list = document.getElementById('polygon-list');
+        list.innerHTML = polygons.map((polygon) => `
+            <div class="polygon-card" data-id="${polygon.id}">
+                <div class="card-header"><h4>${escapeHtml(polygon.name)}</h4></div>
+                <div class="card-body">
+                    <span data-testid="components_JMBadge_JMBadge_span">${escapeHtml(polygon.status)}</span>
+                    <p data-testid="StoreDetails_PolygonCard_PolygonCard_p">${describe(polygon)}</p>
+                    <span data-testid="StoreDetails_PolygonCard_PolygonCard_span"><div class="JMMenu">&#8942;</div></span>
+                    <div class="menu hidden">
+                        <a class="edit-polygon">Edit</a>
+                        <a target="_self" class="polygon-status-action">${polygon.status === 'Active' ? 'Set as Inactive' : 'Set as Active'}</a>
+                    </div>
+                </div>
+            </div>`).join('');
+
+        list.querySelectorAll('.polygon-card').forEach((card) => {
+            const menu = card.querySelector('.menu');
+            const polygon = polygons.find((p) => p.id === card.dataset.id);
+            card.querySelector('.JMMenu').addEventListener('click', () => toggle(menu));
+            card.querySelector('.edit-polygon').addEventListener('click', () => { location.hash = `#/edit/${polygon.id}`; });
+            card.querySelector('.polygon-status-action').addEventListener('click', async () => {
+                menu.classList.add('hidden');
+                await request('PATCH', 'polygon_status', { polygon_id: polygon.id }, { status: polygon.status === 'Active' ? 'Inactive' : 'Active' });
+                await loadPolygons(document.getElementById('search-polygon').value);
+            });
+        });
+    }
+
+    async function exportData(storeMenu) {
+        storeMenu.classList.add('hidden');
+        const polygons = await request('GET', 'polygons', { store_code: storeCode });
+        const rows = [['Polygon Name', 'Status', 'Delivery Type', 'Details']]
+            .concat(polygons.map((p) => [p.name, p.status, p.delivery_type, describe(p)]));
+        const csv = rows.map((row) => row.map((cell) => `"${String(cell).replace(/"/g, '""')}"`).join(',')).join('\n');
+        const link = document.createElement('a');
+        link.href = URL.createObjectURL(new Blob([csv], { type: 'text/csv' }));
+        link.download = `${storeCode}_serviceability.csv`;
+        document.body.appendChild(link);
+        link.click();
+        link.remove();
+    }
+
+    async function renderForm(polygonId) {
+        const editing = polygonId !== undefined;
+        const existing = editing ? await request('GET', 'polygon', { polygon_id: polygonId }) : null;
+        const state = {
+            deliveryType: existing ? existing.delivery_type : null,
+            tab: existing && existing.polygon ? existing.polygon.type : 'travel_time',
+            storeType: existing && existing.meta ? existing.meta.store_type : null
+        };
+        drawnVertices = [];
+        uploadedCoordinates = null;
+
+        app.innerHTML = `
+            <h1>${editing ? 'Edit Polygon' : 'Create New Polygon'}</h1>
+            <input type="text" class="field" placeholder="Add name of polygon" aria-label="Add name of polygon" id="polygon-name">
+            <div>
+                <div class="JMRadioCard" data-delivery="quick_commerce">Quick Commerce</div>
+                <div class="JMRadioCard" data-delivery="slotted_delivery">Slotted Delivery</div>
+            </div>
+            <div>
+                <div class="_item_1hxwt_13" data-tab="travel_time">Travel Time</div>
+                <div class="_item_1hxwt_13" data-tab="travel_distance">Travel Distance</div>
+                <div class="_item_1hxwt_13" data-tab="manual">Manual</div>
+            </div>
+            <div data-panel="travel_time"><input type="number" class="field" id="polygon.attributes.travel_time" aria-label="Travel time"></div>
+            <div data-panel="travel_distance"><input type="number" class="field" id="polygon.attributes.travel_distance" aria-label="Travel distance"></div>
+            <div data-panel="manual">
+                <div id="upload-coordinates">Upload Coordinates</div>
+                <input type="file" accept=".csv" id="coordinates-file" class="hidden">
+                <p>Manual Drawing</p>
+                <iframe title="map"></iframe>
+            </div>
+            <div data-meta="quick_commerce"><input type="number" class="field" id="meta.max_promise_time" aria-label="Maximum promise time"></div>
+            <div data-meta="slotted_delivery">
+                <input type="number" class="field" id="meta.flat_delivery_fee" aria-label="Flat delivery fee">
+                <div class="JMRadioCard" data-store-type="grocery"><div>Grocery</div></div>
+                <div class="JMRadioCard" data-store-type="digital"><div>Digital</div></div>
+            </div>
+            <button id="submit-polygon">${editing ? 'Update' : 'Create'}</button>`;
+
+        app.querySelector('iframe').srcdoc = MAP_DOCUMENT;
+
+        const refresh = () => {
+            app.querySelectorAll('[data-delivery]').forEach((card) => card.classList.toggle('selected', card.dataset.delivery === state.deliveryType));
+            app.querySelectorAll('[data-store-type]').forEach((card) => card.classList.toggle('selected', card.dataset.storeType === state.storeType));
+            app.querySelectorAll('[data-tab]').forEach((tab) => tab.classList.toggle('active', tab.dataset.tab === state.tab));
+            app.querySelectorAll('[data-panel]').forEach((panel) => panel.classList.toggle('hidden', panel.dataset.panel !== state.tab));
+            app.querySelectorAll('[data-meta]').forEach((meta) => meta.classList.toggle('hidden', meta.dataset.meta !== state.deliveryType));
+        };
+
+        app.querySelectorAll('[data-delivery]').forEach((card) => card.addEventListener('click', () => { state.deliveryType = card.dataset.delivery; refresh(); }));
+        app.querySelectorAll('[data-store-type]').forEach((card) => card.addEventListener('click', () => { state.storeType = card.dataset.storeType; refresh(); }));
+        app.querySelectorAll('[data-tab]').forEach((tab) => tab.addEventListener('click', () => { state.tab = tab.dataset.tab; refresh(); }));
+
+        const fileInput = document.getElementById('coordinates-file');
+        document.getElementById('upload-coordinates').addEventListener('click', () => fileInput.click());
+        fileInput.addEventListener('change', async () => {
+            const text = await fileInput.files[0].text();
+            uploadedCoordinates = text.trim().split(/\r?\n/).slice(1).map((line) => line.split(',').map(Number));
+        });
+
+        if (existing) {
+            document.getElementById('polygon-name').value = existing.name;
+            const attributes = (existing.polygon && existing.polygon.attributes) || {};
+            Object.entries(attributes).forEach(([key, value]) => { document.getElementById(`polygon.attributes.${key}`).value = value; });
+        }
+        refresh();
+
+        document.getElementById('submit-polygon').addEventListener('click', async () => {
+            const polygon = { type: state.tab };
+            if (state.tab === 'manual') {
+                polygon.coordinates = uploadedCoordinates || drawnVertices;
+            } else {
+                polygon.attributes = { [state.tab]: Number(document.getElementById(`polygon.attributes.${state.tab}`).value) };
+            }
+
+            const meta = {};
+            const maxPromise = document.getElementById('meta.max_promise_time').value;
+            const deliveryFee = document.getElementById('meta.flat_delivery_fee').value;
+            if (state.deliveryType === 'quick_commerce' && maxPromise) meta.max_promise_time = Number(maxPromise);
+            if (state.deliveryType === 'slotted_delivery' && deliveryFee) meta.flat_delivery_fee = Number(deliveryFee);
+            if (state.storeType) meta.store_type = state.storeType;
+
+            const payload = { name: document.getElementById('polygon-name').value, delivery_type: state.deliveryType, polygon, meta };
+            if (editing) {
+                await request('PUT', 'polygon', { polygon_id: polygonId }, payload);
+            } else {
+                await request('POST', 'polygons', { store_code: storeCode }, payload);
+            }
+            location.hash = '#/store';
+        });
+    }
+
+    function route() {
+        const hash = location.hash || '#/store';
+        const edit = hash.match(/^#\/edit\/(.+)$/);
+        if (edit) {
+            renderForm(edit[1]);
+        } else if (hash === '#/create') {
+            renderForm();
+        } else {
+            renderStore();
+        }
+    }
+
+    window.addEventListener('hashchange', route);
+    route();
+})();
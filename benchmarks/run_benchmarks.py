@@ -0,0 +1,277 @@
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+from playwright.sync_api import sync_playwright, Page
+from pages.store_details_page import StoreDetailsPage
+from pages.create_polygon_page import CreatePolygonPage
+from services.preconditions import Preconditions
+from services.stub_server import TmsStubServer
+from services.tms_api_client import TmsApiClient
+from utils.browser_manager import BrowserManager
+from utils.config_manager import ConfigManager
+from utils.geometry import concave_polygons
+from utils.helpers import generate_polygon_name, generate_timestamp
+from utils.logger import Logger
+from utils.step_report import percentile
+
+BENCHMARK_DIR = Path(__file__).parent
+MOCK_APP_DIR = BENCHMARK_DIR / 'mock_app'
+BASELINE_PATH = BENCHMARK_DIR / 'baseline.json'
+RESULTS_DIR = Path(__file__).parent.parent / 'reports' / 'benchmarks'
+COORDINATES_CSV = Path(__file__).parent.parent / 'testData' / 'lat_long_coordinates.csv'
+
+STORE_CODE = 'STR001'
+STORE_CENTER = (19.1197, 72.8468)
+BATCH_SIZE = 5
+DRAWING_VERTICES = 200
+
+
+class BenchmarkSession:
+
+    def __init__(self, page: Page, server: TmsStubServer):
+        self.page = page
+        self.server = server
+        self.api = TmsApiClient(page.context.request, base_url=server.api_base_url)
+        self.preconditions = Preconditions(self.api)
+        self.store_page = StoreDetailsPage(page)
+        self.create_page = CreatePolygonPage(page)
+
+    def open_store(self) -> None:
+        self.store_page.navigate(f"{self.server.app_url}?store={STORE_CODE}#/store")
+        self.store_page.wait_for_element(StoreDetailsPage.STORE_DETAILS_HEADING)
+
+    def open_create_form(self) -> None:
+        self.open_store()
+        self.store_page.click_create_polygon()
+        self.create_page.wait_for_element(CreatePolygonPage.HEADER_TITLE)
+
+    def seed_polygon(self, prefix: str) -> str:
+        return self.preconditions.qc_polygon(STORE_CODE, prefix, travel_time=15)
+
+
+# Each case prepares the page outside the timed section and returns the action to measure
+def search_polygon(session: BenchmarkSession) -> Callable[[], None]:
+    name = session.seed_polygon('BenchSearch')
+    session.open_store()
+    return lambda: (session.store_page.search_polygon(name), session.store_page.is_polygon_visible(name))
+
+
+def toggle_store_status(session: BenchmarkSession) -> Callable[[], None]:
+    session.open_store()
+
+    def action() -> None:
+        for status in ('Inactive', 'Active'):
+            session.store_page.click_three_dots_menu()
+            session.store_page.set_store_status(status)
+            session.store_page.verify_store_status(status)
+    return action
+
+
+def export_data(session: BenchmarkSession) -> Callable[[], None]:
+    session.open_store()
+
+    def action() -> None:
+        session.store_page.click_three_dots_menu()
+        session.store_page.click_export_data_download_file()
+    return action
+
+
+def set_polygon_inactive(session: BenchmarkSession) -> Callable[[], None]:
+    name = session.seed_polygon('BenchInactive')
+    session.open_store()
+    session.store_page.search_polygon(name)
+    return lambda: session.store_page.set_polygon_inactive(name)
+
+
+def create_qc_polygon_travel_time(session: BenchmarkSession) -> Callable[[], None]:
+    name = generate_polygon_name('BenchQC')
+    session.open_create_form()
+    return lambda: session.create_page.create_qc_polygon_travel_time(name, travel_time=15, max_promise_time=30)
+
+
+def create_slotted_polygon_travel_distance(session: BenchmarkSession) -> Callable[[], None]:
+    name = generate_polygon_name('BenchSlotted')
+    session.open_create_form()
+    return lambda: session.create_page.create_slotted_polygon_travel_distance(
+        name, travel_distance=5000, flat_delivery_fee=40, store_type='grocery'
+    )
+
+
+def create_qc_polygon_manual_csv(session: BenchmarkSession) -> Callable[[], None]:
+    name = generate_polygon_name('BenchCSV')
+    session.open_create_form()
+    return lambda: session.create_page.create_qc_polygon_manual_csv(name, str(COORDINATES_CSV))
+
+
+def create_slotted_polygon_manual_drawing(session: BenchmarkSession) -> Callable[[], None]:
+    name = generate_polygon_name('BenchDrawing')
+    session.open_create_form()
+    return lambda: session.create_page.create_slotted_polygon_manual_drawing(name)
+
+
+def draw_polygon_coordinates(session: BenchmarkSession) -> Callable[[], None]:
+    coordinates = concave_polygons(STORE_CENTER, count=1, vertices=DRAWING_VERTICES, radius_m=1500)[0]
+    session.open_create_form()
+    session.create_page.select_manual_tab()
+    return lambda: session.create_page.draw_polygon_on_map(coordinates=coordinates)
+
+
+def edit_polygon_change_to_travel_distance(session: BenchmarkSession) -> Callable[[], None]:
+    name = session.seed_polygon('BenchEdit')
+    session.open_store()
+    session.store_page.search_polygon(name)
+    session.store_page.click_edit_polygon(name)
+    session.create_page.wait_for_element(CreatePolygonPage.EDIT_HEADER)
+    return lambda: session.create_page.edit_polygon_change_to_travel_distance(travel_distance=3000)
+
+
+def create_polygons_batch(session: BenchmarkSession) -> Callable[[], None]:
+    prefix = generate_polygon_name('BenchBatch')
+    specs = [
+        {'name': f"{prefix}_{index:02d}", 'delivery_type': 'quick_commerce', 'travel_time': 15, 'max_promise_time': 30}
+        if index % 2 else
+        {'name': f"{prefix}_{index:02d}", 'delivery_type': 'slotted_delivery', 'travel_distance': 5000, 'store_type': 'grocery'}
+        for index in range(BATCH_SIZE)
+    ]
+    session.open_create_form()
+
+    def action() -> None:
+        missing = session.create_page.create_polygons(specs)
+        assert not missing, f"Polygons missing after batch: {missing}"
+    return action
+
+
+CASES = {
+    'store_details.search_polygon': search_polygon,
+    'store_details.toggle_store_status': toggle_store_status,
+    'store_details.export_data': export_data,
+    'store_details.set_polygon_inactive': set_polygon_inactive,
+    'create_polygon.create_qc_polygon_travel_time': create_qc_polygon_travel_time,
+    'create_polygon.create_slotted_polygon_travel_distance': create_slotted_polygon_travel_distance,
+    'create_polygon.create_qc_polygon_manual_csv': create_qc_polygon_manual_csv,
+    'create_polygon.create_slotted_polygon_manual_drawing': create_slotted_polygon_manual_drawing,
+    'create_polygon.draw_polygon_coordinates': draw_polygon_coordinates,
+    'create_polygon.edit_polygon_change_to_travel_distance': edit_polygon_change_to_travel_distance,
+    'create_polygon.create_polygons_batch': create_polygons_batch,
+}
+
+
+def run_case(session: BenchmarkSession, case: Callable, warmup: int, iterations: int) -> list[float]:
+    samples = []
+    for iteration in range(warmup + iterations):
+        action = case(session)
+        start = time.perf_counter()
+        action()
+        elapsed = time.perf_counter() - start
+        if iteration >= warmup:
+            samples.append(round(elapsed, 4))
+    return samples
+
+
+def run(case_names: list, warmup: int, iterations: int) -> dict:
+    logger = Logger()
+    results = {}
+    with TmsStubServer(static_dir=MOCK_APP_DIR) as server, sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=True, slow_mo=0)
+        try:
+            for name in case_names:
+                context = browser.new_context(**BrowserManager.CONTEXT_OPTIONS)
+                context.set_default_timeout(ConfigManager().timeout)
+                try:
+                    session = BenchmarkSession(context.new_page(), server)
+                    samples = run_case(session, CASES[name], warmup, iterations)
+                finally:
+                    context.close()
+
+                results[name] = {
+                    'median': round(percentile(samples, 0.5), 4),
+                    'p95': round(percentile(samples, 0.95), 4),
+                    'samples': samples,
+                }
+                logger.info("Benchmark %s: median %.3fs, p95 %.3fs", name, results[name]['median'], results[name]['p95'])
+        finally:
+            browser.close()
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float, min_delta: float) -> list[dict]:
+    rows = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        regressed = (
+            base is not None
+            and result['median'] > base['median'] * (1 + tolerance)
+            and result['median'] - base['median'] >= min_delta
+        )
+        rows.append({
+            'case': name,
+            'median': result['median'],
+            'p95': result['p95'],
+            'baseline_median': base['median'] if base else None,
+            'regressed': regressed,
+        })
+    return rows
+
+
+def format_table(rows: list[dict]) -> str:
+    header = f"{'Case':<60} {'Median':>8} {'p95':>8} {'Base':>8}"
+    lines = [header, '-' * len(header)]
+    for row in rows:
+        baseline = f"{row['baseline_median']:8.3f}" if row['baseline_median'] is not None else f"{'-':>8}"
+        flag = '  REGRESSED' if row['regressed'] else ''
+        lines.append(f"{row['case'][:60]:<60} {row['median']:8.3f} {row['p95']:8.3f} {baseline}{flag}")
+    return '\n'.join(lines)
+
+
+def main(argv: list | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the page-object layer against the offline mock app")
+    parser.add_argument('--case', action='append', choices=sorted(CASES), help="Run only this case (repeatable)")
+    parser.add_argument('--iterations', type=int, default=5, help="Measured iterations per case")
+    parser.add_argument('--warmup', type=int, default=1, help="Unmeasured iterations per case")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="Relative median increase over the baseline that counts as a regression")
+    parser.add_argument('--min-delta', type=float, default=0.1,
+                        help="Minimum absolute median increase in seconds that counts as a regression")
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH, help="Baseline JSON file")
+    parser.add_argument('--update-baseline', action='store_true', help="Write this run's results as the new baseline")
+    parser.add_argument('--require-baseline', action='store_true', default=bool(os.environ.get('CI')),
+                        help="Fail when a case has no baseline entry (default when the CI variable is set)")
+    args = parser.parse_args(argv)
+
+    cases = args.case or list(CASES)
+    baseline = json.loads(args.baseline.read_text(encoding='utf-8')) if args.baseline.exists() else {}
+    # Without a baseline every case passes, so a gate that is meant to catch regressions has to refuse to run
+    unguarded = [name for name in cases if name not in baseline]
+    if args.require_baseline and not args.update_baseline and unguarded:
+        print(f"No baseline in {args.baseline} for: {', '.join(unguarded)}")
+        print("Record one with --update-baseline on the machine that runs the comparison and commit it")
+        return 1
+
+    results = run(cases, args.warmup, args.iterations)
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    results_path = RESULTS_DIR / f"benchmark_{generate_timestamp()}.json"
+    results_path.write_text(json.dumps(results, indent=2), encoding='utf-8')
+
+    rows = compare(results, baseline, args.tolerance, args.min_delta)
+    print(format_table(rows))
+    print(f"Results written to {results_path}")
+
+    if args.update_baseline:
+        baseline.update({name: {'median': r['median'], 'p95': r['p95']} for name, r in results.items()})
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True), encoding='utf-8')
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    regressed = [row for row in rows if row['regressed']]
+    for row in regressed:
+        print(f"Regression: '{row['case']}' median {row['baseline_median']:.3f}s -> {row['median']:.3f}s")
+    return 1 if regressed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,11 +1,31 @@
 import pytest
 from playwright.sync_api import Page, Browser, BrowserContext, Playwright, sync_playwright
 from pathlib import Path
-from datetime import datetime
+from typing import Optional
+import json
+import time
 import allure
+import allure_commons
 from utils.config_manager import ConfigManager
+from utils.artifacts import ArtifactPipeline
+from utils.selector_profiler import SnapshotRecorder
 from utils.logger import Logger
-from utils.helpers import generate_polygon_name
+from utils.browser_manager import BrowserManager
+from utils.auth_cache import AuthCache
+from utils.store_index import StoreIndexCache
+from utils.resource_policy import ResourcePolicy
+from utils.step_timing import StepTimer
+from utils.tracing import StepTracer, trace_dir_for
+from utils.workflow import Workflow, load_checkpoint
+from utils.har_replay import HarReplayer, MODES as HAR_MODES, har_path_for, save_names, load_names
+from utils.helpers import (
+    generate_polygon_name, worker_path, is_xdist_worker,
+    merge_worker_logs, collect_worker_artifacts
+)
+from services.preconditions import Preconditions
+from services.tms_api_client import TmsApiClient
+from services.stub_server import TmsStubServer
+from pages.base_page import BasePage
 from pages.login_page import LoginPage
 from pages.home_page import HomePage
 from pages.store_list_page import StoreListPage
@@ -15,58 +35,217 @@ from pages.create_polygon_page import CreatePolygonPage
 
 config = ConfigManager()
 logger = Logger()
+AIO_TESTS_DIR = Path(__file__).parent / 'tests' / 'aio'
+step_timer: Optional[StepTimer] = None
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--har-mode", action="store", default=None, choices=HAR_MODES,
+        help="Record a HAR per test, replay recorded HARs, or hit the live backend (overrides config.ini)"
+    )
+    parser.addoption(
+        "--resume-from", action="store", default=None, type=int,
+        help="Restart workflow tests at this step from the checkpoint saved by the previous run"
+    )
+    parser.addoption(
+        "--profile", action="store", default=None, choices=config.profile_names,
+        help="Apply a named profile from config/profiles.ini (overrides config.ini and TMS_PROFILE)"
+    )
+    parser.addoption(
+        "--setting", action="append", default=[], metavar="SECTION.key=value",
+        help="Override one config value; wins over the profile and TMS_SECTION__KEY variables (repeatable)"
+    )
+    parser.addoption(
+        "--aio", action="store_true", default=False,
+        help="Run only the async suite in tests/aio; every other run leaves it out"
+    )
 
 @pytest.fixture(scope="session")
 def playwright_instance():
     with sync_playwright() as playwright:
         yield playwright
 
+@pytest.fixture(scope="session")
+def browser_manager(playwright_instance: Playwright) -> BrowserManager:
+    manager = BrowserManager()
+    manager.start(playwright_instance)
+
+    yield manager
+
+    manager.shutdown()
+
 @pytest.fixture(scope="function")
-def browser(playwright_instance: Playwright) -> Browser:
+def browser(browser_manager: BrowserManager) -> Browser:
+    if browser_manager.pooling_enabled:
+        yield browser_manager.get_browser()
+        return
+
     logger.info("Launching browser...")
-    browser_type = getattr(playwright_instance, config.browser)
-    browser = browser_type.launch(
-        headless=config.headless,
-        slow_mo=config.get_int('APP', 'slow_mo', 100)
-    )
+    browser = browser_manager.launch_browser()
 
     yield browser
 
     logger.info("Closing browser...")
     browser.close()
 
+@pytest.fixture(scope="session")
+def har_mode(pytestconfig) -> str:
+    return pytestconfig.getoption('har_mode') or config.har_mode
+
 @pytest.fixture(scope="function")
-def context(browser: Browser) -> BrowserContext:
-    logger.info("Creating browser context...")
+def har_path(request, har_mode: str) -> Optional[Path]:
+    if har_mode == 'off':
+        return None
+
+    path = har_path_for(config.har_dir, request.node.nodeid)
+    if har_mode == 'replay' and not path.exists():
+        pytest.skip(f"No HAR recorded for this test, run with --har-mode=record first: {path}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
 
-    context = browser.new_context(
-        viewport={"width": 1366, "height": 768},
-        accept_downloads=True,
-        permissions=['geolocation'],
-        geolocation={
-            'latitude': 40.7128,
-            'longitude': -74.0060,
-            'accuracy': 100
-        }
+@pytest.fixture(scope="session")
+def tracing_mode(pytestconfig) -> str:
+    # --tracing comes from pytest-playwright; its default "off" defers to config.ini
+    option = pytestconfig.getoption('tracing', 'off')
+    return option if option != 'off' else config.tracing_mode
+
+@pytest.fixture(scope="session")
+def resume_from(pytestconfig) -> Optional[int]:
+    return pytestconfig.getoption('resume_from')
+
+@pytest.fixture(scope="function")
+def resume_checkpoint(request, resume_from: Optional[int]) -> Optional[dict]:
+    if resume_from is None or not config.checkpoints_enabled:
+        return None
+    return load_checkpoint(config.checkpoint_dir, request.node.name, resume_from)
+
+@pytest.fixture(scope="function")
+def storage_state(browser: Browser, request, har_mode: str, resume_checkpoint: Optional[dict]) -> Optional[dict]:
+    if resume_checkpoint is not None:
+        return resume_checkpoint['storage_state']
+    # Recorded HARs include the login flow so that replay never needs the live backend
+    if not config.reuse_auth_session or har_mode != 'off' or request.node.get_closest_marker('fresh_session'):
+        return None
+    return AuthCache().get_storage_state(browser)
+
+@pytest.fixture(scope="function")
+def resource_policy(request) -> ResourcePolicy:
+    allowed = tuple(
+        category
+        for marker in request.node.iter_markers('allow_resources')
+        for category in marker.args
     )
+    return ResourcePolicy.from_config(allowed=allowed)
+
+@pytest.fixture(scope="function")
+def context(
+    request,
+    browser: Browser,
+    browser_manager: BrowserManager,
+    storage_state: Optional[dict],
+    har_mode: str,
+    har_path: Optional[Path],
+    resource_policy: ResourcePolicy,
+    tracing_mode: str
+) -> BrowserContext:
+    logger.info("Creating browser context...")
+    overrides = {}
+    if har_mode == 'record':
+        logger.info("Recording HAR to: %s", har_path)
+        overrides = {'record_har_path': str(har_path), 'record_har_content': 'embed'}
+
+    context = browser_manager.acquire_context(browser, storage_state=storage_state, **overrides)
+
+    replayer = None
+    if har_mode == 'replay':
+        logger.info("Replaying HAR from: %s", har_path)
+        replayer = HarReplayer(har_path)
+        replayer.attach(context)
+
+    # Registered after the HAR replayer so the policy sees requests first and falls back to it
+    resource_policy.apply(context)
 
-    context.set_default_timeout(config.timeout)
+    tracer = None
+    if tracing_mode != 'off':
+        trace_dir = trace_dir_for(worker_path(config.traces_path), request.node.nodeid)
+        tracer = StepTracer(context.tracing, trace_dir, mode=tracing_mode, chunks_kept=config.trace_chunks_kept)
+        tracer.start(request.node.nodeid)
+        allure_commons.plugin_manager.register(tracer)
 
     yield context
 
-    logger.info("Closing browser context...")
-    context.close()
+    if tracer is not None:
+        allure_commons.plugin_manager.unregister(tracer)
+        # A missing call report means setup or the test body never completed
+        report = getattr(request.node, 'rep_call', None)
+        try:
+            traces = tracer.finish(failed=report is None or report.failed)
+            if traces:
+                logger.info("Saved %d trace chunks to %s", len(traces), trace_dir)
+        except Exception as e:
+            logger.error("Failed to save trace: %s", e)
+
+    resource_policy.detach(context)
+    blocked = resource_policy.summary()
+    if blocked:
+        logger.info("Blocked resources: %s", blocked)
+        allure.attach(
+            json.dumps(blocked, indent=2),
+            name="Blocked resources",
+            attachment_type=allure.attachment_type.JSON
+        )
+
+    if replayer is not None:
+        logger.info("HAR replay served %d requests, %d not found", replayer.served, replayer.missed)
+
+    logger.info("Releasing browser context...")
+    browser_manager.release_context(context)
 
 @pytest.fixture(scope="function")
-def page(context: BrowserContext) -> Page:
+def page(context: BrowserContext, storage_state: Optional[dict]) -> Page:
     logger.info("Creating new page...")
     page = context.new_page()
 
     yield page
 
+    # Tests sharing the cached session never log out, so ending on the login page means the session was rejected
+    if storage_state and "/login" in page.url:
+        AuthCache().invalidate()
+
     logger.info("Closing page...")
     page.close()
 
+@pytest.fixture(scope="function")
+def workflow(request, resume_checkpoint: Optional[dict]) -> Workflow:
+    checkpoint_dir = config.checkpoint_dir if config.checkpoints_enabled else None
+    return Workflow(request.node.name, checkpoint_dir=checkpoint_dir, checkpoint=resume_checkpoint)
+
+@pytest.fixture(scope="function")
+def tms_api(context: BrowserContext) -> TmsApiClient:
+    return TmsApiClient(context.request)
+
+@pytest.fixture(scope="function")
+def preconditions(tms_api: TmsApiClient, har_mode: str) -> Optional[Preconditions]:
+    # HAR files only hold browser traffic, so recorded and replayed runs set up through the UI
+    if har_mode != 'off':
+        yield None
+        return
+    preconditions = Preconditions(tms_api)
+    yield preconditions
+    preconditions.restore()
+
+@pytest.fixture(scope="function")
+def store_index(har_mode: str) -> Optional[StoreIndexCache]:
+    # HAR files only hold browser traffic, so recorded and replayed runs keep walking the store list page
+    if not config.store_index_enabled or har_mode != 'off':
+        return None
+    return StoreIndexCache()
+
+@pytest.fixture(scope="session")
+def tms_stub_server() -> TmsStubServer:
+    with TmsStubServer() as server:
+        yield server
+
 @pytest.fixture(scope="function")
 def login_page(page: Page) -> LoginPage:
     return LoginPage(page)
@@ -90,11 +269,44 @@ def create_polygon_page(page: Page) -> CreatePolygonPage:
 @pytest.fixture(scope="function", autouse=True)
 def test_setup_teardown(request):
     test_name = request.node.name
-    logger.info(f"Starting test: {test_name}")
+    logger.set_test(request.node.nodeid)
+    logger.info("Starting test: %s", test_name)
+    BasePage.reset_wait_stats()
+    if step_timer is not None:
+        step_timer.start_test(request.node.nodeid)
 
     yield
 
-    logger.info(f"Finished test: {test_name}")
+    if step_timer is not None:
+        step_timings = step_timer.finish_test()
+        logger.info("Recorded %d step timings to %s", len(step_timings), step_timer.store_path)
+
+    wait_stats = {
+        page_name: {kind: round(seconds, 3) for kind, seconds in kinds.items()}
+        for page_name, kinds in BasePage.wait_stats().items()
+    }
+    if wait_stats:
+        total_wait = sum(sum(kinds.values()) for kinds in wait_stats.values())
+        logger.info("Total wait time for %s: %.3fs", test_name, total_wait)
+        allure.attach(
+            json.dumps(wait_stats, indent=2),
+            name="Wait time per page object (seconds)",
+            attachment_type=allure.attachment_type.JSON
+        )
+
+    logger.info("Finished test: %s", test_name)
+    logger.set_test(None)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    start = time.perf_counter()
+    yield
+    item = getattr(request, '_pyfuncitem', None)
+    if item is not None:
+        if not hasattr(item, 'fixture_setup_times'):
+            item.fixture_setup_times = {}
+        item.fixture_setup_times[fixturedef.argname] = time.perf_counter() - start
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -103,40 +315,45 @@ def pytest_runtest_makereport(item, call):
     rep = outcome.get_result()
     setattr(item, f"rep_{rep.when}", rep)
 
+    if rep.when == "setup" and getattr(item, 'fixture_setup_times', None):
+        setup_times = {name: round(seconds, 3) for name, seconds in item.fixture_setup_times.items()}
+        total_setup = sum(item.fixture_setup_times.values())
+        item.user_properties.append(("fixture_setup_seconds", round(total_setup, 3)))
+        logger.info("Fixture setup for %s took %.3fs: %s", item.name, total_setup, setup_times)
+        allure.attach(
+            json.dumps(setup_times, indent=2),
+            name="Fixture setup time (seconds)",
+            attachment_type=allure.attachment_type.JSON
+        )
+
     # Capture screenshot if test failed and we have a page fixture
     if rep.when == "call" and rep.failed and hasattr(item, 'fixturenames') and 'page' in item.fixturenames:
         try:
-            logger.error(f"Test failed: {item.name}")
+            logger.error("Test failed: %s", item.name)
 
             # Get the page fixture from the item
             page = item._request.getfixturevalue('page')
 
-            screenshot_dir = Path(__file__).parent / 'screenshots'
-            screenshot_dir.mkdir(exist_ok=True)
-
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            screenshot_path = screenshot_dir / f"failure_{item.name}_{timestamp}.png"
-
-            page.screenshot(path=str(screenshot_path))
-            allure.attach.file(
-                str(screenshot_path),
-                name=f"Failure Screenshot - {item.name}",
-                attachment_type=allure.attachment_type.PNG
-            )
-            logger.info(f"Screenshot saved: {screenshot_path}")
+            ArtifactPipeline().screenshot(page, f"Failure Screenshot - {item.name}")
+            logger.info("Failure screenshot captured for %s", item.name)
         except Exception as e:
-            logger.error(f"Failed to capture screenshot: {e}")
+            logger.error("Failed to capture screenshot: %s", e)
 
 @pytest.fixture(scope="function")
-def polygon_names():
-    names = {
-        'qc_travel_time': generate_polygon_name('qc_polygon'),
-        'slotted_delivery': generate_polygon_name('slotted_polygon'),
-        'manual_csv': generate_polygon_name('manual_csv_polygon'),
-        'manual_drawing': generate_polygon_name('manual_drawing_polygon')
-    }
+def polygon_names(har_mode: str, har_path: Optional[Path]):
+    # Replayed responses carry the recorded names, so replay reuses them instead of generating new ones
+    names = load_names(har_path) if har_mode == 'replay' else None
+    if names is None:
+        names = {
+            'qc_travel_time': generate_polygon_name('qc_polygon'),
+            'slotted_delivery': generate_polygon_name('slotted_polygon'),
+            'manual_csv': generate_polygon_name('manual_csv_polygon'),
+            'manual_drawing': generate_polygon_name('manual_drawing_polygon')
+        }
+    if har_mode == 'record':
+        save_names(har_path, names)
 
-    logger.info(f"Generated polygon names: {names}")
+    logger.info("Generated polygon names: %s", names)
     return names
 
 @pytest.fixture(scope="session")
@@ -145,11 +362,22 @@ def test_data_path():
 
 @pytest.fixture(scope="session")
 def downloads_path():
-    path = config.downloads_path
-    path.mkdir(exist_ok=True)
-    return path
+    return worker_path(config.downloads_path)
+
+def pytest_configure(config):
+    global step_timer
+    settings = ConfigManager()
+    overrides = list(config.getoption('setting') or [])
+    # pytest-playwright's --headed is a CLI layer over [APP] headless, which BrowserManager reads
+    if config.getoption('headed', False):
+        overrides.insert(0, 'APP.headless=false')
+    profile = config.getoption('profile') or settings.profile
+    if profile != settings.profile or overrides:
+        settings.load(profile=profile, overrides=overrides)
+        logger.apply_levels()
+    if settings.profile:
+        logger.info("Using config profile: %s", settings.profile)
 
-def pytest_configure():
     base_path = Path(__file__).parent
 
     directories = [
@@ -162,4 +390,63 @@ def pytest_configure():
     for directory in directories:
         directory.mkdir(exist_ok=True)
 
+    if settings.step_timing_enabled and step_timer is None:
+        step_timer = StepTimer(settings.step_timing_dir, settings.browser)
+        allure_commons.plugin_manager.register(step_timer)
+
+    if not allure_commons.plugin_manager.is_registered(logger.context):
+        allure_commons.plugin_manager.register(logger.context)
+
     logger.info("Pytest configuration completed")
+
+def pytest_unconfigure():
+    global step_timer
+    if step_timer is not None:
+        allure_commons.plugin_manager.unregister(step_timer)
+        step_timer = None
+    if allure_commons.plugin_manager.is_registered(logger.context):
+        allure_commons.plugin_manager.unregister(logger.context)
+    logger.flush()
+
+def pytest_collection_modifyitems(session, items):
+    # The sync Playwright session fixture keeps an event loop running on the main thread, so async tests
+    # cannot share a pytest process with sync ones and run in their own invocation with --aio
+    run_aio = session.config.getoption('aio')
+    selected, deselected = [], []
+    for item in items:
+        is_aio = AIO_TESTS_DIR in item.path.parents
+        (selected if is_aio == run_aio else deselected).append(item)
+    if deselected:
+        session.config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+def pytest_sessionstart(session):
+    session.started = time.time()
+
+def pytest_sessionfinish(session):
+    blocked = ResourcePolicy.session_summary()
+    if blocked:
+        total_requests = sum(stats['requests'] for stats in blocked.values())
+        total_bytes = sum(stats['estimated_bytes'] or 0 for stats in blocked.values())
+        logger.info("Resource policy skipped %d requests (about %d bytes where sizes are known): %s",
+                    total_requests, total_bytes, blocked)
+
+    # Worker screenshots, DOM snapshots and logs must be on disk before the controller collects them
+    ArtifactPipeline().wait()
+    SnapshotRecorder().save()
+    logger.flush()
+    if is_xdist_worker():
+        return
+
+    base_path = Path(__file__).parent
+    started = getattr(session, 'started', 0)
+
+    merged_log = merge_worker_logs(base_path / 'logs', since=started)
+    if merged_log is None:
+        return
+    logger.info("Merged worker logs into: %s", merged_log)
+
+    manifest = collect_worker_artifacts([base_path / 'screenshots', config.downloads_path], since=started)
+    manifest_path = merged_log.with_name(merged_log.stem.replace('_merged', '_artifacts') + '.json')
+    manifest_path.write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+    logger.info("Worker artifact manifest written to: %s", manifest_path)
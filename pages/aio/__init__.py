@@ -0,0 +1 @@
+# Async pages package initialization
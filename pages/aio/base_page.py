@@ -0,0 +1,228 @@
+from playwright.async_api import Page, Locator, expect, TimeoutError as PlaywrightTimeoutError
+from utils.artifacts import ArtifactPipeline
+from utils.logger import Logger
+from utils.config_manager import ConfigManager
+from utils.selector_profiler import SnapshotRecorder
+from typing import Optional
+from contextlib import contextmanager, asynccontextmanager
+import time
+from pages.base_page import BasePage as SyncBasePage
+from pages.locators import Selector
+from pages.wait_strategy import ResponseWait
+from pages.aio.step import step
+
+
+class BasePage:
+
+    ACTIONABILITY_CHECKS = SyncBasePage.ACTIONABILITY_CHECKS
+    STABLE_SCRIPT = SyncBasePage.STABLE_SCRIPT
+
+    WAIT_STRATEGIES: dict[str, ResponseWait] = {}
+
+    # Shared with the sync pages so the per-test wait report covers both
+    _wait_stats = SyncBasePage._wait_stats
+    _missed_responses = SyncBasePage._missed_responses
+
+    def __init_subclass__(cls, sync_page: Optional[type] = None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Selector constants and wait strategies come from the sync page so the two layers cannot drift apart
+        if sync_page is not None:
+            for name, value in vars(sync_page).items():
+                if name.isupper() and name not in vars(cls):
+                    setattr(cls, name, value)
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.logger = Logger()
+        self.config = ConfigManager()
+        self._locators: dict[tuple, Locator] = {}
+        self.snapshots = SnapshotRecorder()
+
+    @step("Navigate to URL: {url}")
+    async def navigate(self, url: str, wait_for: Optional[str] = None) -> None:
+        self.logger.info("Navigating to: %s", url)
+        async with self.expect_backend(wait_for):
+            await self.page.goto(url)
+        if wait_for is None:
+            with self._timed_wait('load_state'):
+                await self.page.wait_for_load_state('networkidle')
+
+    @step("Click element")
+    async def click(self, locator: str | Locator, timeout: Optional[int] = 1000, wait_for: Optional[str] = None) -> None:
+        if self.config.wait_strategy == 'networkidle':
+            with self._timed_wait('load_state'):
+                await self.page.wait_for_load_state('networkidle')
+        element = await self._get_element(locator, self.ACTIONABILITY_CHECKS)
+        self.logger.info("Clicking element: %s", locator)
+
+        await element.scroll_into_view_if_needed()
+        async with self.expect_backend(wait_for):
+            await element.click(timeout=timeout)
+
+    @step("Fill text")
+    async def fill(self, locator: str | Locator, text: str, timeout: Optional[int] = 1000, wait_for: Optional[str] = None) -> None:
+        element = await self._get_element(locator, self.ACTIONABILITY_CHECKS)
+        self.logger.info("Filling text in element: %s", locator)
+        await element.scroll_into_view_if_needed()
+        async with self.expect_backend(wait_for):
+            await element.fill(text, timeout=timeout)
+
+    @asynccontextmanager
+    async def expect_backend(self, action: Optional[str]):
+        if action is None:
+            yield
+            return
+
+        strategy = self.WAIT_STRATEGIES.get(action)
+        if strategy is None or self.config.wait_strategy == 'networkidle' or repr(strategy) in self._missed_responses:
+            yield
+            with self._timed_wait('load_state'):
+                await self.page.wait_for_load_state('networkidle')
+            return
+
+        action_done = False
+        start = None
+        try:
+            async with self.page.expect_response(strategy.matches, timeout=self.config.response_timeout) as response_info:
+                yield
+                action_done = True
+                start = time.perf_counter()
+            response = await response_info.value
+            self.logger.info("'%s' completed with %s -> %s", action, strategy, response.status)
+        except PlaywrightTimeoutError:
+            if not action_done:
+                raise
+            # An endpoint that never answered would cost the full timeout on every later action, so stop expecting it
+            self._missed_responses.add(repr(strategy))
+            self.logger.warning("No %s response for '%s', using networkidle for it for the rest of the session", strategy, action)
+            await self.page.wait_for_load_state('networkidle')
+        finally:
+            if start is not None:
+                self._record_wait('response', time.perf_counter() - start)
+
+    @step("Get text from element")
+    async def get_text(self, locator: str | Locator) -> str:
+        element = await self._get_element(locator, ('attached',))
+        text = await element.text_content()
+        self.logger.info("Got text from element: %s", text)
+        return text.strip() if text else ""
+
+    @step("Check if element is visible")
+    async def is_visible(self, locator: str | Locator, timeout: Optional[int] = None) -> bool:
+        # Answers for the page as it is now; pass a timeout only when the element may still be appearing
+        try:
+            if timeout is None:
+                element = await self._get_element(locator)
+                return await element.is_visible()
+            await self._get_element(locator, ('visible',), timeout=timeout)
+            return True
+        except Exception as e:
+            self.logger.debug("Element not visible: %s", e)
+            return False
+
+    @step("Wait for element to be visible")
+    async def wait_for_element(self, locator: str | Locator, timeout: Optional[int] = None, state: str = 'visible') -> None:
+        element = await self._get_element(locator)
+        self.logger.info("Waiting for element: %s to be %s", locator, state)
+        with self._timed_wait('actionability'):
+            await element.wait_for(state=state, timeout=timeout)
+
+    @step("Upload file")
+    async def upload_file(self, locator: str | Locator, file_path: str) -> None:
+        element = await self._get_element(locator, ('attached',))
+        self.logger.info("Uploading file: %s", file_path)
+        await element.set_input_files(file_path)
+
+    @step("Assert element contains text")
+    async def assert_text_contains(self, locator: str | Locator, expected_text: str) -> None:
+        element = await self._get_element(locator)
+        self.logger.info("Asserting element contains text: %s", expected_text)
+        await expect(element).to_contain_text(expected_text)
+
+    @step("Assert element is visible")
+    async def assert_visible(self, locator: str | Locator) -> None:
+        element = await self._get_element(locator)
+        self.logger.info("Asserting element is visible: %s", locator)
+        await expect(element).to_be_visible()
+
+    @step("Press key")
+    async def press_key(self, key: str) -> None:
+        self.logger.info("Pressing key: %s", key)
+        await self.page.keyboard.press(key)
+
+    @step("Wait for page load")
+    async def wait_for_load_state(self, state: str = 'networkidle', timeout: Optional[int] = None) -> None:
+        self.logger.info("Waiting for page load state: %s", state)
+        with self._timed_wait('load_state'):
+            await self.page.wait_for_load_state(state, timeout=timeout)
+
+    async def pause(self, milliseconds: int) -> None:
+        with self._timed_wait('sleep'):
+            await self.page.wait_for_timeout(milliseconds)
+
+    @step("Scroll to element")
+    async def scroll_to_element(self, locator: str | Locator) -> None:
+        element = await self._get_element(locator, ('visible',))
+        self.logger.info("Scrolling to element: %s", locator)
+        await element.scroll_into_view_if_needed()
+
+    def locator(self, selector: str | Selector, **params) -> Locator:
+        # Locators are lazy and reusable, so each selector and argument tuple is resolved once per page object
+        key = (selector, tuple(sorted(params.items())))
+        element = self._locators.get(key)
+        if element is None:
+            text = selector.format(**params) if isinstance(selector, Selector) else selector
+            element = self._locators[key] = self.page.locator(text)
+            if params:
+                # Keyed by the class that declares the selector, which is where the profiler's inventory lists it
+                self.snapshots.record_sample(selector.owner, selector.name, text)
+        return element
+
+    async def _get_element(self, locator: str | Locator, checks: tuple = (), timeout: Optional[int] = None) -> Locator:
+        element = self.locator(locator) if isinstance(locator, str) else locator
+        if checks:
+            await self._wait_until_actionable(element, checks, timeout)
+            if self.snapshots.wants(type(self).__name__, locator):
+                self.snapshots.capture(type(self).__name__, await self.page.content())
+        return element
+
+    async def _wait_until_actionable(self, element: Locator, checks: tuple, timeout: Optional[int] = None) -> None:
+        timeout = self.config.timeout if timeout is None else timeout
+        with self._timed_wait('actionability'):
+            if 'visible' in checks or 'stable' in checks or 'enabled' in checks:
+                await element.wait_for(state='visible', timeout=timeout)
+            elif 'attached' in checks:
+                await element.wait_for(state='attached', timeout=timeout)
+
+            if 'stable' in checks and not await element.evaluate(self.STABLE_SCRIPT, timeout, timeout=timeout):
+                self.logger.debug("Element did not settle within %s ms: %s", timeout, element)
+
+            if 'enabled' in checks:
+                await expect(element).to_be_enabled(timeout=timeout)
+
+    @contextmanager
+    def _timed_wait(self, kind: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record_wait(kind, time.perf_counter() - start)
+
+    def _record_wait(self, kind: str, seconds: float) -> None:
+        BasePage._wait_stats[type(self).__name__][kind] += seconds
+
+    @classmethod
+    def wait_stats(cls) -> dict:
+        return {page: dict(kinds) for page, kinds in cls._wait_stats.items()}
+
+    @classmethod
+    def reset_wait_stats(cls) -> None:
+        cls._wait_stats.clear()
+
+    @step("Take screenshot")
+    async def take_screenshot(self, name: str, selector: Optional[str] = None, full_page: bool = False) -> None:
+        pipeline = ArtifactPipeline()
+        target = self.page.locator(selector) if selector else self.page
+        data = await target.screenshot(**pipeline.screenshot_options(full_page, element=selector is not None))
+        pipeline.publish(data, name)
+        self.logger.info("Screenshot captured: %s", name)
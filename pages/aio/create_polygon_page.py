@@ -0,0 +1,278 @@
+from playwright.async_api import Page
+from pages.aio.base_page import BasePage
+from pages.aio.step import step
+from pages.aio.store_details_page import StoreDetailsPage
+from pages.create_polygon_page import CreatePolygonPage as SyncCreatePolygonPage
+from utils.coordinates import prepare_upload_csv
+from utils.helpers import write_coordinates_csv
+from typing import Optional
+import asyncio
+import numpy as np
+
+
+class CreatePolygonPage(BasePage, sync_page=SyncCreatePolygonPage):
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.logger.info("Create Polygon page initialized")
+
+    @step("Verify create polygon page is displayed")
+    async def is_create_polygon_page_displayed(self) -> bool:
+        return await self.is_visible(f"{self.HEADER_TITLE}, {self.EDIT_HEADER}", timeout=5000)
+
+    @step("Enter polygon name: {name}")
+    async def enter_polygon_name(self, name: str) -> None:
+        await self.fill(self.POLYGON_NAME_INPUT, name)
+        self.logger.info("Entered polygon name: %s", name)
+
+    @step("Select delivery type: Quick Commerce")
+    async def select_quick_commerce(self) -> None:
+        await self.click(self.QUICK_COMMERCE_RADIO)
+        self.logger.info("Quick Commerce delivery type is selected")
+
+    @step("Select delivery type: Slotted Delivery")
+    async def select_slotted_delivery(self) -> None:
+        await self.click(self.SLOTTED_DELIVERY_RADIO)
+        self.logger.info("Selected Slotted Delivery type")
+
+    @step("Select Travel Time tab")
+    async def select_travel_time_tab(self) -> None:
+        await self.click(self.TRAVEL_TIME_TAB, timeout=2000)
+        self.logger.info("Selected Travel Time tab")
+
+    @step("Select Travel Distance tab")
+    async def select_travel_distance_tab(self) -> None:
+        await self.click(self.TRAVEL_DISTANCE_TAB, timeout=2000)
+        self.logger.info("Selected Travel Distance tab")
+
+    @step("Select Manual tab")
+    async def select_manual_tab(self) -> None:
+        await self.click(self.MANUAL_TAB, timeout=2000)
+        self.logger.info("Selected Manual tab")
+
+    @step("Enter travel time: {minutes} minutes")
+    async def enter_travel_time(self, minutes: int) -> None:
+        travel_time_input = self.locator(self.TRAVEL_TIME_INPUT)
+        await travel_time_input.click()
+        await travel_time_input.fill(str(minutes))
+        self.logger.info("Entered travel time: %s minutes", minutes)
+
+    @step("Enter travel distance: {distance} meters")
+    async def enter_travel_distance(self, distance: int) -> None:
+        travel_distance_input = self.locator(self.TRAVEL_DISTANCE_INPUT)
+        await travel_distance_input.click()
+        await travel_distance_input.fill(str(distance))
+        self.logger.info("Entered travel distance: %s meters", distance)
+
+    @step("Enter maximum promise time: {minutes} minutes")
+    async def enter_max_promise_time(self, minutes: int) -> None:
+        max_promise_input = self.locator(self.MAX_PROMISE_TIME_INPUT)
+        await max_promise_input.click()
+        await max_promise_input.fill(str(minutes))
+        self.logger.info("Entered maximum promise time: %s minutes", minutes)
+
+    @step("Enter flat delivery fee: {fee}")
+    async def enter_flat_delivery_fee(self, fee: int) -> None:
+        delivery_fee_input = self.locator(self.FLAT_DELIVERY_FEE_INPUT)
+        await delivery_fee_input.click()
+        await delivery_fee_input.fill(str(fee))
+        self.logger.info("Entered flat delivery fee: %s", fee)
+
+    @step("Select store type: Grocery")
+    async def select_grocery_store_type(self) -> None:
+        await self.click(self.GROCERY_STORE_TYPE)
+        self.logger.info("Selected Grocery store type")
+
+    @step("Select store type: Digital")
+    async def select_digital_store_type(self) -> None:
+        await self.click(self.DIGITAL_STORE_TYPE)
+        self.logger.info("Selected Digital store type")
+
+    @step("Upload CSV file: {file_path}")
+    async def upload_csv_file(self, file_path: str) -> None:
+        # Large files take a noticeable slice of CPU to validate, so keep it off the event loop
+        upload_path = await asyncio.to_thread(prepare_upload_csv, file_path)
+        await self.click(self.UPLOAD_CORDINATES_BUTTON)
+        file_input = self.locator(self.UPLOAD_CSV_BUTTON)
+        await file_input.set_input_files(str(upload_path))
+        self.logger.info("Uploaded CSV file: %s", file_path)
+
+    @step("Select manual drawing option")
+    async def select_manual_drawing(self) -> None:
+        await self.select_manual_tab()
+        self.logger.info("Selected manual drawing option")
+
+    @step("Draw polygon on map using coordinates")
+    async def draw_polygon_on_map(self, offsets: Optional[np.ndarray] = None, coordinates: Optional[np.ndarray] = None) -> None:
+        map_frame = self.locator(self.MAP_FRAME).first
+        await map_frame.scroll_into_view_if_needed()
+        frame = await (await map_frame.element_handle()).content_frame()
+        await frame.wait_for_load_state()
+        box = await map_frame.evaluate(self.MAP_FRAME_BOX_SCRIPT)
+
+        viewport = {'width': box['width'], 'height': box['height']}
+        if coordinates is not None:
+            viewport = (SyncCreatePolygonPage.viewport_from_url(frame.url, box['width'], box['height'])
+                        or await frame.evaluate(self.MAP_VIEWPORT_SCRIPT) or viewport)
+
+        points = SyncCreatePolygonPage.map_click_points(viewport, offsets=offsets, coordinates=coordinates)
+        await self._click_points([(box['x'] + x, box['y'] + y) for x, y in points])
+        self.logger.info("Drew polygon on map with %d vertices", len(points) - 1)
+
+    async def _click_points(self, points: list) -> None:
+        browser = self.page.context.browser
+        if browser is None or browser.browser_type.name != 'chromium':
+            for x, y in points:
+                await self.page.mouse.click(x, y)
+            return
+
+        session = await self.page.context.new_cdp_session(self.page)
+        try:
+            for x, y in points:
+                for event in SyncCreatePolygonPage.mouse_click_events(x, y):
+                    await session.send('Input.dispatchMouseEvent', event)
+        finally:
+            await session.detach()
+
+    @step("Click Create button")
+    async def click_create(self) -> None:
+        await self.click(self.CREATE_BUTTON, wait_for='create')
+        self.logger.info("Clicked Create button")
+
+    @step("Click Update button")
+    async def click_update(self) -> None:
+        await self.click(self.UPDATE_BUTTON, wait_for='update')
+        self.logger.info("Clicked Update button")
+
+    @step("Create QC polygon with travel time")
+    async def create_qc_polygon_travel_time(
+        self,
+        name: str,
+        travel_time: int,
+        max_promise_time: Optional[int] = None
+    ) -> None:
+
+        await self.enter_polygon_name(name)
+        await self.select_quick_commerce()
+        await self.select_travel_time_tab()
+        await self.enter_travel_time(travel_time)
+
+        if max_promise_time:
+            await self.enter_max_promise_time(max_promise_time)
+
+        await self.click_create()
+        self.logger.info("Created QC polygon with travel time: %s", name)
+
+    @step("Create Slotted Delivery polygon with travel distance")
+    async def create_slotted_polygon_travel_distance(
+        self,
+        name: str,
+        travel_distance: int,
+        flat_delivery_fee: Optional[int] = None,
+        store_type: Optional[str] = None
+    ) -> None:
+
+        await self.enter_polygon_name(name)
+        await self.select_slotted_delivery()
+        await self.select_travel_distance_tab()
+        await self.enter_travel_distance(travel_distance)
+
+        if flat_delivery_fee:
+            await self.enter_flat_delivery_fee(flat_delivery_fee)
+
+        if store_type:
+            if store_type.lower() == 'grocery':
+                await self.select_grocery_store_type()
+            elif store_type.lower() == 'digital':
+                await self.select_digital_store_type()
+
+        await self.click_create()
+        self.logger.info("Created Slotted Delivery polygon: %s", name)
+
+    @step("Create QC polygon with manual CSV upload")
+    async def create_qc_polygon_manual_csv(
+        self,
+        name: str,
+        csv_file_path: Optional[str] = None,
+        coordinates: Optional[np.ndarray] = None
+    ) -> None:
+        if coordinates is not None:
+            csv_file_path = str(write_coordinates_csv(name, coordinates))
+        await self.enter_polygon_name(name)
+        await self.select_quick_commerce()
+        await self.select_manual_tab()
+        await self.upload_csv_file(csv_file_path)
+        await self.pause(2000)
+        await self.click_create()
+        self.logger.info("Created QC polygon with manual CSV: %s", name)
+
+    @step("Create Slotted Delivery polygon with manual drawing")
+    async def create_slotted_polygon_manual_drawing(
+        self,
+        name: str,
+        offsets: Optional[np.ndarray] = None,
+        coordinates: Optional[np.ndarray] = None
+    ) -> None:
+        await self.enter_polygon_name(name)
+        await self.select_slotted_delivery()
+        await self.select_manual_tab()
+        await self.draw_polygon_on_map(offsets=offsets, coordinates=coordinates)
+        await self.click_create()
+        self.logger.info("Created Slotted Delivery polygon with manual drawing: %s", name)
+
+    @step("Edit polygon - change from travel time to travel distance")
+    async def edit_polygon_change_to_travel_distance(self, travel_distance: int) -> None:
+        await self.select_travel_distance_tab()
+        await self.enter_travel_distance(travel_distance)
+        await self.click_update()
+        self.logger.info("Edited polygon to travel distance: %s", travel_distance)
+
+    @step("Create polygons in one batch")
+    async def create_polygons(self, specs: list[dict]) -> list[str]:
+        for spec in specs:
+            SyncCreatePolygonPage.validate_polygon_spec(spec)
+
+        store_details_page = StoreDetailsPage(self.page)
+        for index, spec in enumerate(specs):
+            if index:
+                await store_details_page.click_create_polygon()
+            await self.fill_polygon_form(spec)
+            await self.click_create()
+            self.logger.info("Created polygon %s/%s: %s", index + 1, len(specs), spec['name'])
+
+        return await store_details_page.find_missing_polygons([spec['name'] for spec in specs])
+
+    @step("Fill polygon form")
+    async def fill_polygon_form(self, spec: dict) -> None:
+        await self.enter_polygon_name(spec['name'])
+
+        if spec['delivery_type'] == 'quick_commerce':
+            await self.select_quick_commerce()
+        else:
+            await self.select_slotted_delivery()
+
+        if spec.get('travel_time') is not None:
+            await self.select_travel_time_tab()
+            await self.enter_travel_time(spec['travel_time'])
+        elif spec.get('travel_distance') is not None:
+            await self.select_travel_distance_tab()
+            await self.enter_travel_distance(spec['travel_distance'])
+        else:
+            await self.select_manual_tab()
+            if spec.get('coordinates') is not None:
+                await self.upload_csv_file(str(write_coordinates_csv(spec['name'], spec['coordinates'])))
+            elif spec.get('csv_file_path'):
+                await self.upload_csv_file(str(spec['csv_file_path']))
+            else:
+                await self.draw_polygon_on_map()
+
+        if spec.get('max_promise_time'):
+            await self.enter_max_promise_time(spec['max_promise_time'])
+        if spec.get('flat_delivery_fee'):
+            await self.enter_flat_delivery_fee(spec['flat_delivery_fee'])
+
+        store_type = (spec.get('store_type') or '').lower()
+        if store_type == 'grocery':
+            await self.select_grocery_store_type()
+        elif store_type == 'digital':
+            await self.select_digital_store_type()
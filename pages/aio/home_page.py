@@ -0,0 +1,33 @@
+from playwright.async_api import Page
+from pages.aio.base_page import BasePage
+from pages.aio.step import step
+from pages.home_page import HomePage as SyncHomePage
+
+
+class HomePage(BasePage, sync_page=SyncHomePage):
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.logger.info("Home page initialized")
+
+    @step("Open home page")
+    async def open(self) -> None:
+        await self.navigate(self.config.base_url)
+        await self.wait_for_element(self.STORES_NAV)
+        self.logger.info("Opened home page with cached session")
+
+    @step("Navigate to Stores section")
+    async def navigate_to_stores(self) -> None:
+        await self.click(self.STORES_NAV, wait_for='store_list')
+        self.logger.info("Navigated to Stores section")
+
+    @step("Click user profile")
+    async def click_user_profile(self) -> None:
+        await self.click(self.USER_PROFILE)
+        self.logger.info("Clicked user profile")
+
+    @step("Logout from application")
+    async def logout(self) -> None:
+        await self.click_user_profile()
+        await self.click(self.LOGOUT_BUTTON, wait_for='logout')
+        self.logger.info("Logged out successfully")
@@ -0,0 +1,57 @@
+from playwright.async_api import Page
+from pages.aio.base_page import BasePage
+from pages.aio.step import step
+from pages.login_page import LoginPage as SyncLoginPage
+
+
+class LoginPage(BasePage, sync_page=SyncLoginPage):
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.logger.info("Login page initialized")
+
+    @step("Navigate to login page")
+    async def navigate_to_login(self) -> None:
+        await self.navigate(self.config.base_url)
+        await self.wait_for_element(self.EMAIL_INPUT)
+        self.logger.info("Navigated to login page")
+
+    @step("Enter email: {email}")
+    async def enter_email(self, email: str) -> None:
+        await self.fill(self.EMAIL_INPUT, email)
+        self.logger.info("Entered email: %s", email)
+
+    @step("Enter password")
+    async def enter_password(self, password: str) -> None:
+        await self.fill(self.PASSWORD_INPUT, password)
+        self.logger.info("Entered password")
+
+    @step("Accept terms and conditions")
+    async def accept_terms(self) -> None:
+        await self.click(self.ACCEPT_TERMS_CHECKBOX)
+        self.logger.info("Accepted terms and conditions")
+
+    @step("Click login button")
+    async def click_login(self) -> None:
+        await self.click(self.LOGIN_BUTTON, wait_for='login')
+        self.logger.info("Clicked login button")
+
+    @step("Login with credentials")
+    async def login(self, email: str, password: str) -> None:
+        self.logger.info("Attempting to login with email: %s", email)
+        await self.enter_email(email)
+        await self.enter_password(password)
+        await self.accept_terms()
+        await self.click_login()
+        self.logger.info("Login successful")
+
+    @step("Verify login page is displayed")
+    async def is_login_page_displayed(self) -> bool:
+        try:
+            await self.page.wait_for_url("**/login**", timeout=self.config.timeout)
+        except Exception as e:
+            self.logger.debug("Login URL not reached: %s", e)
+        url_has_login = "/login" in self.page.url
+        logo_visible = await self.is_visible(self.LOGO, timeout=5000)
+        self.logger.info("Login page displayed")
+        return url_has_login and logo_visible
@@ -0,0 +1,68 @@
+import contextvars
+import functools
+from typing import Optional
+import allure_commons
+from allure_commons.model2 import Parameter, TestStepResult
+from allure_commons.utils import func_parameters, now, represent, uuid4
+from allure_pytest.utils import get_status, get_status_details
+
+# Allure hangs a new step under whichever step was opened last, which under asyncio.gather belongs to another
+# coroutine; each task keeps its own open step here and the Allure reporter is given that parent explicitly
+_parent_step: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar('aio_parent_step', default=None)
+
+
+def _allure_listener():
+    for plugin in allure_commons.plugin_manager.get_plugins():
+        if hasattr(plugin, 'allure_logger'):
+            return plugin
+    return None
+
+
+def _other_plugins(hook_name: str, listener):
+    if listener is None:
+        return getattr(allure_commons.plugin_manager.hook, hook_name)
+    return allure_commons.plugin_manager.subset_hook_caller(hook_name, remove_plugins=[listener])
+
+
+class AsyncStepContext:
+
+    def __init__(self, title: str, params: dict):
+        self.title = title
+        self.params = params
+        self.uuid = uuid4()
+        self._token = None
+
+    def __enter__(self):
+        listener = _allure_listener()
+        if listener is not None:
+            parent = _parent_step.get()
+            if parent is None:
+                test = listener.allure_logger.get_test(None)
+                parent = test.uuid if test is not None else None
+            parameters = [Parameter(name=name, value=value) for name, value in self.params.items()]
+            listener.allure_logger.start_step(parent, self.uuid, TestStepResult(name=self.title, start=now(), parameters=parameters))
+        _other_plugins('start_step', listener)(uuid=self.uuid, title=self.title, params=self.params)
+        self._token = _parent_step.set(self.uuid)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _parent_step.reset(self._token)
+        listener = _allure_listener()
+        if listener is not None:
+            listener.allure_logger.stop_step(self.uuid, stop=now(), status=get_status(exc_val),
+                                             statusDetails=get_status_details(exc_type, exc_val, exc_tb))
+        _other_plugins('stop_step', listener)(uuid=self.uuid, exc_type=exc_type, exc_val=exc_val, exc_tb=exc_tb)
+
+
+def step(title: str):
+    # allure.step closes its step as soon as a coroutine function returns the coroutine, so await inside it instead
+    def decorator(func):
+        @functools.wraps(func)
+        async def impl(*args, **kwargs):
+            __tracebackhide__ = True
+            params = func_parameters(func, *args, **kwargs)
+            represented = [represent(arg) for arg in args]
+            with AsyncStepContext(title.format(*represented, **params), params):
+                return await func(*args, **kwargs)
+
+        return impl
+    return decorator
@@ -0,0 +1,163 @@
+from playwright.async_api import Page
+from pathlib import Path
+from typing import Iterable, Optional
+import allure
+import asyncio
+import json
+from pages.aio.base_page import BasePage
+from pages.aio.step import step
+from pages.store_details_page import StoreDetailsPage as SyncStoreDetailsPage
+from utils.export_validator import validate_export
+from utils.helpers import validate_downloaded_file, generate_unique_filename, worker_path
+import os
+
+
+class StoreDetailsPage(BasePage, sync_page=SyncStoreDetailsPage):
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.logger.info("Store Details page initialized")
+
+    @step("Open store {store_code} by deep link")
+    async def open(self, store_code: str) -> None:
+        await self.navigate(self.config.store_url(store_code))
+        await self.wait_for_element(self.STORE_DETAILS_HEADING)
+        self.logger.info("Opened store %s details page", store_code)
+
+    @step("Verify store details page is displayed")
+    async def is_store_details_page_displayed(self) -> bool:
+        return await self.is_visible(self.STORE_DETAILS_HEADING, timeout=5000)
+
+    @step("Get store name")
+    async def get_store_name(self) -> str:
+        return await self.get_text("h4")
+
+    @step("Click create polygon button")
+    async def click_create_polygon(self) -> None:
+        await self.click(self.CREATE_POLYGON_BUTTON)
+        self.logger.info("Clicked create polygon button")
+
+    @step("Search for polygon: {polygon_name}")
+    async def search_polygon(self, polygon_name: str) -> None:
+        await self.fill(self.SEARCH_POLYGON_INPUT, polygon_name, wait_for='search_polygon')
+        self.logger.info("Searched for polygon: %s", polygon_name)
+
+    @step("Verify polygon exists: {polygon_name}")
+    async def is_polygon_visible(self, polygon_name: str, timeout: Optional[int] = 5000) -> bool:
+        is_visible = await self.is_visible(self.locator(self.POLYGON_HEADING, polygon_name=polygon_name), timeout=timeout)
+        self.logger.info("Polygon '%s' visible: %s", polygon_name, is_visible)
+        return is_visible
+
+    @step("Verify polygons exist")
+    async def find_missing_polygons(self, polygon_names: list[str]) -> list[str]:
+        prefix = os.path.commonprefix(polygon_names)
+        missing = list(polygon_names)
+        if len(prefix) >= self.MIN_SHARED_SEARCH:
+            await self.search_polygon(prefix)
+            shown = await self._shown_polygon_names()
+            missing = [name for name in polygon_names if name not in shown]
+        missing = [name for name in missing if not await self._search_and_check(name)]
+        self.logger.info("Found %s of %s polygons, missing: %s", len(polygon_names) - len(missing), len(polygon_names), missing)
+        return missing
+
+    async def _search_and_check(self, polygon_name: str) -> bool:
+        await self.search_polygon(polygon_name)
+        return polygon_name in await self._shown_polygon_names()
+
+    async def _shown_polygon_names(self) -> set[str]:
+        return {text.strip() for text in await self.locator(self.POLYGON_HEADINGS).all_inner_texts()}
+
+    @step("Verify polygon status: {polygon_name} - {expected_status}")
+    async def verify_polygon_status(self, polygon_name: str, expected_status: str) -> bool:
+        status_element = self.locator(self.POLYGON_STATUS_BADGE, polygon_name=polygon_name, status=expected_status)
+        is_status_correct = await status_element.is_visible()
+
+        self.logger.info("Polygon '%s' has status '%s': %s", polygon_name, expected_status, is_status_correct)
+        return is_status_correct
+
+    @step("Click three dots menu for Store")
+    async def click_three_dots_menu(self) -> None:
+        await self.click(self.THREE_DOTS_MENU)
+        self.logger.info("Clicked three dots menu")
+
+    @step("Click Export Data and validate file is downloaded")
+    async def click_export_data_download_file(self, expected_polygons: Iterable[str] = (), store_key: Optional[str] = None) -> None:
+        async with self.page.expect_download() as download_info:
+            await self.click(self.EXPORT_DATA_OPTION)
+            self.logger.info("Clicked Export Data option")
+        download = await download_info.value
+
+        unique_filename = generate_unique_filename(download.suggested_filename)
+        file_path = worker_path(self.config.downloads_path) / unique_filename
+        await download.save_as(file_path)
+        self.logger.info("File downloaded successfully: %s", unique_filename)
+
+        validate_downloaded_file(file_path)
+        self.logger.info("File validation successful - Size: %s bytes", file_path.stat().st_size)
+        await self.validate_export(file_path, expected_polygons, history_key=store_key)
+
+    @step("Validate export contents")
+    async def validate_export(self, file_path: Path, expected_polygons: Iterable[str] = (), history_key: Optional[str] = None) -> None:
+        # Parsing a large export is blocking file work, so it runs off the event loop
+        report = await asyncio.to_thread(validate_export, file_path, expected_polygons, history_key)
+        self.logger.info("Export %s", report.summary())
+        allure.attach(
+            json.dumps({'summary': report.summary(), 'checksum': report.checksum, 'diff': report.diff}, indent=2),
+            name="Export validation",
+            attachment_type=allure.attachment_type.JSON
+        )
+        # Polygons found missing by a name column that is really there always fail; only schema guesses are lenient
+        if report.has_names and report.missing_polygons:
+            raise AssertionError(f"Export validation failed: {report.summary()}")
+        if report.is_valid:
+            return
+        if self.config.export_strict:
+            raise AssertionError(f"Export validation failed: {report.summary()}")
+        self.logger.warning("Export does not match the expected schema, continuing: %s", report.summary())
+
+    @step("Set store status to: {status}")
+    async def set_store_status(self, status: str) -> None:
+        if status not in ['Active', 'Inactive']:
+            raise ValueError(f"Invalid status: {status}. Must be 'Active' or 'Inactive'")
+        option_locator = self.SET_ACTIVE_OPTION if status == 'Active' else self.SET_INACTIVE_OPTION
+        await self.click(self.locator(option_locator).first, wait_for='store_status')
+        self.logger.info("Set store status to %s", status)
+
+    @step("Click Set as Inactive option")
+    async def click_set_as_inactive(self) -> None:
+        await self.set_store_status('Inactive')
+
+    @step("Click Set as Active option")
+    async def click_set_as_active(self) -> None:
+        await self.set_store_status('Active')
+
+    @step("Verify store status: {expected_status}")
+    async def verify_store_status(self, expected_status: str) -> bool:
+        is_status_visible = await self.is_visible(self.locator(self.STORE_STATUS_BADGE, status=expected_status), timeout=5000)
+        self.logger.info("Store status '%s' visible: %s", expected_status, is_status_visible)
+        return is_status_visible
+
+    @step("Click polygon three dots menu: {polygon_name}")
+    async def click_polygon_menu(self, polygon_name: str) -> None:
+        await self.click(self.locator(self.POLYGON_MENU_BUTTON, polygon_name=polygon_name))
+        self.logger.info("Clicked menu for polygon: %s", polygon_name)
+
+    @step("Click Edit polygon: {polygon_name}")
+    async def click_edit_polygon(self, polygon_name: str) -> None:
+        await self.click_polygon_menu(polygon_name)
+        await self.click(self.EDIT_BUTTON, wait_for='polygon_details')
+        self.logger.info("Clicked Edit for polygon: %s", polygon_name)
+
+    @step("Set polygon as inactive: {polygon_name}")
+    async def set_polygon_inactive(self, polygon_name: str) -> None:
+        await self.click_polygon_menu(polygon_name)
+        await self.click(self.locator(self.POLYGON_INACTIVE_OPTION, polygon_name=polygon_name), wait_for='polygon_status')
+        self.logger.info("Set polygon '%s' as inactive", polygon_name)
+
+    @step("Verify polygon travel distance: {polygon_name} - {expected_distance}")
+    async def verify_polygon_travel_distance(self, polygon_name: str, expected_distance: str) -> bool:
+        actual_distance_text = await self.get_text(self.DISTANCE_TEXT)
+        is_distance_correct = expected_distance in actual_distance_text
+
+        self.logger.info("Polygon '%s' - Expected: '%s', Actual: '%s', Match: %s", polygon_name, expected_distance, actual_distance_text, is_distance_correct)
+        return is_distance_correct
@@ -0,0 +1,54 @@
+from playwright.async_api import Page
+from pages.aio.base_page import BasePage
+from pages.aio.step import step
+from pages.store_list_page import StoreListPage as SyncStoreListPage
+
+
+class StoreListPage(BasePage, sync_page=SyncStoreListPage):
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.logger.info("Store List page initialized")
+
+    @step("Search for store: {store_code}")
+    async def search_store(self, store_code: str) -> None:
+        await self.fill(self.SEARCH_STORE_INPUT, store_code)
+        self.logger.info("Searched for store: %s", store_code)
+
+    @step("Click on store: {store_name}")
+    async def click_store(self, store_name: str) -> None:
+        store_button = self.locator(self.STORE_BUTTON, store_name=store_name).first
+        await self.wait_for_element(store_button)
+        await self.click(store_button, wait_for='store_details')
+        self.logger.info("Clicked on store: %s", store_name)
+
+    @step("Verify stores page is displayed")
+    async def is_stores_page_displayed(self) -> bool:
+        try:
+            current_url = self.page.url.lower()
+            if 'store' in current_url or 'stores' in current_url:
+                return True
+
+            if await self.is_visible(self.SEARCH_STORE_INPUT):
+                return True
+
+        except Exception as e:
+            self.logger.warning("Error checking stores page: %s", e)
+
+        return False
+
+    @step("Click on first active store")
+    async def click_first_active_store(self) -> str:
+        await self.wait_for_element(self.SEARCH_STORE_INPUT, timeout=10000)
+
+        first_active = self.locator(self.ACTIVE_STORE_BADGE).first
+        await self.wait_for_element(first_active)
+
+        store_text = await first_active.inner_text()
+        lines = [line.strip() for line in store_text.split('\n') if line.strip()]
+        store_name = next((line for line in lines if line and 'Active' not in line), lines[0] if lines else store_text.strip())
+
+        await self.click(first_active, wait_for='store_details')
+
+        self.logger.info("Clicked on first active store: %s", store_name)
+        return store_name
@@ -1,117 +1,233 @@
-from playwright.sync_api import Page, Locator, expect
+from playwright.sync_api import Page, Locator, expect, TimeoutError as PlaywrightTimeoutError
+from utils.artifacts import ArtifactPipeline
 from utils.logger import Logger
 from utils.config_manager import ConfigManager
+from utils.selector_profiler import SnapshotRecorder
 from typing import Optional
+from collections import defaultdict
+from contextlib import contextmanager
 import allure
-from pathlib import Path
-from datetime import datetime
+import time
+from pages.locators import Selector
+from pages.wait_strategy import ResponseWait
 
 
 class BasePage:
 
+    ACTIONABILITY_CHECKS = ('attached', 'visible', 'stable', 'enabled')
+
+    # Resolves once the element's bounding box is unchanged across two animation frames
+    STABLE_SCRIPT = """
+        (element, timeout) => new Promise(resolve => {
+            const deadline = performance.now() + timeout;
+            let last = null;
+            const check = () => {
+                if (!element.isConnected) return resolve(false);
+                const r = element.getBoundingClientRect();
+                const rect = `${r.x},${r.y},${r.width},${r.height}`;
+                if (rect === last) return resolve(true);
+                if (performance.now() > deadline) return resolve(false);
+                last = rect;
+                requestAnimationFrame(check);
+            };
+            requestAnimationFrame(check);
+        })
+    """
+
+    # Backend call each action triggers, keyed by the name passed as wait_for
+    WAIT_STRATEGIES: dict[str, ResponseWait] = {}
+
+    _wait_stats: dict = defaultdict(lambda: defaultdict(float))
+    _missed_responses: set[str] = set()
+
     def __init__(self, page: Page):
         self.page = page
         self.logger = Logger()
         self.config = ConfigManager()
+        self._locators: dict[tuple, Locator] = {}
+        self.snapshots = SnapshotRecorder()
 
     @allure.step("Navigate to URL: {url}")
-    def navigate(self, url: str) -> None:
-        self.logger.info(f"Navigating to: {url}")
-        self.page.goto(url)
-        self.page.wait_for_load_state('networkidle')
+    def navigate(self, url: str, wait_for: Optional[str] = None) -> None:
+        self.logger.info("Navigating to: %s", url)
+        with self.expect_backend(wait_for):
+            self.page.goto(url)
+        if wait_for is None:
+            with self._timed_wait('load_state'):
+                self.page.wait_for_load_state('networkidle')
 
     @allure.step("Click element")
-    def click(self, locator: str | Locator, timeout: Optional[int] = 1000) -> None:
-        self.page.wait_for_load_state('networkidle')
-        element = self._get_element(locator)
-        self.logger.info(f"Clicking element: {locator}")
+    def click(self, locator: str | Locator, timeout: Optional[int] = 1000, wait_for: Optional[str] = None) -> None:
+        if self.config.wait_strategy == 'networkidle':
+            with self._timed_wait('load_state'):
+                self.page.wait_for_load_state('networkidle')
+        element = self._get_element(locator, self.ACTIONABILITY_CHECKS)
+        self.logger.info("Clicking element: %s", locator)
 
         element.scroll_into_view_if_needed()
-        element.click(timeout=timeout)
+        with self.expect_backend(wait_for):
+            element.click(timeout=timeout)
 
     @allure.step("Fill text")
-    def fill(self, locator: str | Locator, text: str, timeout: Optional[int] = 1000) -> None:
-        element = self._get_element(locator)
-        self.logger.info(f"Filling text in element: {locator}")
+    def fill(self, locator: str | Locator, text: str, timeout: Optional[int] = 1000, wait_for: Optional[str] = None) -> None:
+        element = self._get_element(locator, self.ACTIONABILITY_CHECKS)
+        self.logger.info("Filling text in element: %s", locator)
         element.scroll_into_view_if_needed()
-        element.fill(text, timeout=timeout)
+        with self.expect_backend(wait_for):
+            element.fill(text, timeout=timeout)
+
+    @contextmanager
+    def expect_backend(self, action: Optional[str]):
+        if action is None:
+            yield
+            return
+
+        strategy = self.WAIT_STRATEGIES.get(action)
+        if strategy is None or self.config.wait_strategy == 'networkidle' or repr(strategy) in self._missed_responses:
+            yield
+            with self._timed_wait('load_state'):
+                self.page.wait_for_load_state('networkidle')
+            return
+
+        action_done = False
+        start = None
+        try:
+            with self.page.expect_response(strategy.matches, timeout=self.config.response_timeout) as response_info:
+                yield
+                action_done = True
+                start = time.perf_counter()
+            self.logger.info("'%s' completed with %s -> %s", action, strategy, response_info.value.status)
+        except PlaywrightTimeoutError:
+            if not action_done:
+                raise
+            # An endpoint that never answered would cost the full timeout on every later action, so stop expecting it
+            self._missed_responses.add(repr(strategy))
+            self.logger.warning("No %s response for '%s', using networkidle for it for the rest of the session", strategy, action)
+            self.page.wait_for_load_state('networkidle')
+        finally:
+            if start is not None:
+                self._record_wait('response', time.perf_counter() - start)
 
     @allure.step("Get text from element")
     def get_text(self, locator: str | Locator) -> str:
-        element = self._get_element(locator)
+        element = self._get_element(locator, ('attached',))
         text = element.text_content()
-        self.logger.info(f"Got text from element: {text}")
+        self.logger.info("Got text from element: %s", text)
         return text.strip() if text else ""
 
     @allure.step("Check if element is visible")
-    def is_visible(self, locator: str | Locator, timeout: int = 5000) -> bool:
+    def is_visible(self, locator: str | Locator, timeout: Optional[int] = None) -> bool:
+        # Answers for the page as it is now; pass a timeout only when the element may still be appearing
         try:
-            element = self._get_element(locator)
-            return element.is_visible(timeout=timeout)
+            if timeout is None:
+                return self._get_element(locator).is_visible()
+            self._get_element(locator, ('visible',), timeout=timeout)
+            return True
         except Exception as e:
-            self.logger.debug(f"Element not visible: {e}")
+            self.logger.debug("Element not visible: %s", e)
             return False
 
     @allure.step("Wait for element to be visible")
     def wait_for_element(self, locator: str | Locator, timeout: Optional[int] = None, state: str = 'visible') -> None:
         element = self._get_element(locator)
-        self.logger.info(f"Waiting for element: {locator} to be {state}")
-        element.wait_for(state=state, timeout=timeout)
+        self.logger.info("Waiting for element: %s to be %s", locator, state)
+        with self._timed_wait('actionability'):
+            element.wait_for(state=state, timeout=timeout)
 
     @allure.step("Upload file")
     def upload_file(self, locator: str | Locator, file_path: str) -> None:
-        element = self._get_element(locator)
-        self.logger.info(f"Uploading file: {file_path}")
+        element = self._get_element(locator, ('attached',))
+        self.logger.info("Uploading file: %s", file_path)
         element.set_input_files(file_path)
 
     @allure.step("Assert element contains text")
     def assert_text_contains(self, locator: str | Locator, expected_text: str) -> None:
         element = self._get_element(locator)
-        self.logger.info(f"Asserting element contains text: {expected_text}")
+        self.logger.info("Asserting element contains text: %s", expected_text)
         expect(element).to_contain_text(expected_text)
 
     @allure.step("Assert element is visible")
     def assert_visible(self, locator: str | Locator) -> None:
         element = self._get_element(locator)
-        self.logger.info(f"Asserting element is visible: {locator}")
+        self.logger.info("Asserting element is visible: %s", locator)
         expect(element).to_be_visible()
 
     @allure.step("Press key")
     def press_key(self, key: str) -> None:
 
-        self.logger.info(f"Pressing key: {key}")
+        self.logger.info("Pressing key: %s", key)
         self.page.keyboard.press(key)
 
     @allure.step("Wait for page load")
     def wait_for_load_state(self, state: str = 'networkidle', timeout: Optional[int] = None) -> None:
-        self.logger.info(f"Waiting for page load state: {state}")
-        self.page.wait_for_load_state(state, timeout=timeout)
+        self.logger.info("Waiting for page load state: %s", state)
+        with self._timed_wait('load_state'):
+            self.page.wait_for_load_state(state, timeout=timeout)
+
+    def pause(self, milliseconds: int) -> None:
+        with self._timed_wait('sleep'):
+            self.page.wait_for_timeout(milliseconds)
 
     @allure.step("Scroll to element")
     def scroll_to_element(self, locator: str | Locator) -> None:
-        element = self._get_element(locator)
-        self.logger.info(f"Scrolling to element: {locator}")
+        element = self._get_element(locator, ('visible',))
+        self.logger.info("Scrolling to element: %s", locator)
         element.scroll_into_view_if_needed()
 
-    def _get_element(self, locator: str | Locator) -> Locator:
-        self.page.wait_for_timeout(1000)
-        if isinstance(locator, str):
-            return self.page.locator(locator)
-        return locator
+    def locator(self, selector: str | Selector, **params) -> Locator:
+        # Locators are lazy and reusable, so each selector and argument tuple is resolved once per page object
+        key = (selector, tuple(sorted(params.items())))
+        element = self._locators.get(key)
+        if element is None:
+            text = selector.format(**params) if isinstance(selector, Selector) else selector
+            element = self._locators[key] = self.page.locator(text)
+            if params:
+                # Keyed by the class that declares the selector, which is where the profiler's inventory lists it
+                self.snapshots.record_sample(selector.owner, selector.name, text)
+        return element
+
+    def _get_element(self, locator: str | Locator, checks: tuple = (), timeout: Optional[int] = None) -> Locator:
+        element = self.locator(locator) if isinstance(locator, str) else locator
+        if checks:
+            self._wait_until_actionable(element, checks, timeout)
+            if self.snapshots.wants(type(self).__name__, locator):
+                self.snapshots.capture(type(self).__name__, self.page.content())
+        return element
+
+    def _wait_until_actionable(self, element: Locator, checks: tuple, timeout: Optional[int] = None) -> None:
+        timeout = self.config.timeout if timeout is None else timeout
+        with self._timed_wait('actionability'):
+            if 'visible' in checks or 'stable' in checks or 'enabled' in checks:
+                element.wait_for(state='visible', timeout=timeout)
+            elif 'attached' in checks:
+                element.wait_for(state='attached', timeout=timeout)
+
+            if 'stable' in checks and not element.evaluate(self.STABLE_SCRIPT, timeout, timeout=timeout):
+                self.logger.debug("Element did not settle within %s ms: %s", timeout, element)
+
+            if 'enabled' in checks:
+                expect(element).to_be_enabled(timeout=timeout)
+
+    @contextmanager
+    def _timed_wait(self, kind: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record_wait(kind, time.perf_counter() - start)
 
-    @allure.step("Take screenshot")
-    def take_screenshot(self, name: str) -> None:
+    def _record_wait(self, kind: str, seconds: float) -> None:
+        BasePage._wait_stats[type(self).__name__][kind] += seconds
 
-        screenshots_dir = Path(__file__).parent.parent / 'screenshots'
-        screenshots_dir.mkdir(exist_ok=True)
+    @classmethod
+    def wait_stats(cls) -> dict:
+        return {page: dict(kinds) for page, kinds in cls._wait_stats.items()}
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        screenshot_path = screenshots_dir / f"{name}_{timestamp}.png"
+    @classmethod
+    def reset_wait_stats(cls) -> None:
+        cls._wait_stats.clear()
 
-        self.page.screenshot(path=str(screenshot_path))
-        allure.attach.file(
-            str(screenshot_path),
-            name=name,
-            attachment_type=allure.attachment_type.PNG
-        )
-        self.logger.info(f"Screenshot saved: {screenshot_path}")
+    @allure.step("Take screenshot")
+    def take_screenshot(self, name: str, selector: Optional[str] = None, full_page: bool = False) -> None:
+        ArtifactPipeline().screenshot(self.page, name, selector=selector, full_page=full_page)
+        self.logger.info("Screenshot captured: %s", name)
@@ -1,10 +1,15 @@
+import re
+from urllib.parse import parse_qsl, urlsplit
 from playwright.sync_api import Page
 from pages.base_page import BasePage
+from pages.store_details_page import StoreDetailsPage
+from pages.wait_strategy import ResponseWait
+from utils.coordinates import prepare_upload_csv
+from utils.geometry import centered_viewport, map_projection, regular_polygon
+from utils.helpers import write_coordinates_csv
 import allure
 from typing import Optional
-import csv
-import os
-import math
+import numpy as np
 
 
 class CreatePolygonPage(BasePage):
@@ -27,6 +32,24 @@ class CreatePolygonPage(BasePage):
     UPLOAD_CSV_BUTTON = "input[type='file']"
     UPLOAD_CORDINATES_BUTTON = "//div[normalize-space()='Upload Coordinates']"
     MANUAL_DRAWING_OPTION = "text=Manual Drawing"
+    MAP_FRAME = "iframe"
+
+    # Page position and size of the map frame's content area, inside its border
+    MAP_FRAME_BOX_SCRIPT = """
+        (frame) => {
+            const rect = frame.getBoundingClientRect();
+            return { x: rect.x + frame.clientLeft, y: rect.y + frame.clientTop, width: frame.clientWidth, height: frame.clientHeight };
+        }
+    """
+    # Embedded maps carry their view in the frame URL: /@lat,lng,15z, ?center=lat,lng&zoom=15 or ?ll=lat,lng&z=15
+    MAP_URL_VIEW_PATTERN = re.compile(r'@(-?\d+(?:\.\d+)?),(-?\d+(?:\.\d+)?),(\d+(?:\.\d+)?)z')
+    # Evaluated inside the map frame when its URL has no view; window.mapViewport (bounds and zoom) is published
+    # by the benchmark mock map, whose frame is a srcdoc document
+    MAP_VIEWPORT_SCRIPT = """
+        () => window.mapViewport && innerWidth > 0
+            ? { ...window.mapViewport, width: innerWidth, height: innerHeight }
+            : null
+    """
 
     MAX_PROMISE_TIME_INPUT = "//input[@id='meta.max_promise_time']"
     FLAT_DELIVERY_FEE_INPUT = "//input[@id='meta.flat_delivery_fee']"
@@ -37,18 +60,27 @@ class CreatePolygonPage(BasePage):
     EDIT_HEADER = "h1:has-text('Edit Polygon')"
     UPDATE_BUTTON = "button:has-text('Update')"
 
+    DELIVERY_TYPES = ('quick_commerce', 'slotted_delivery')
+    STORE_TYPES = ('grocery', 'digital')
+
+    WAIT_STRATEGIES = {
+        'create': ResponseWait('POST', 'polygons'),
+        'update': ResponseWait('PUT', 'polygon'),
+    }
+
     def __init__(self, page: Page):
         super().__init__(page)
         self.logger.info("Create Polygon page initialized")
 
     @allure.step("Verify create polygon page is displayed")
     def is_create_polygon_page_displayed(self) -> bool:
-        return self.is_visible(self.HEADER_TITLE) or self.is_visible(self.EDIT_HEADER)
+        # Either header will do, so one wait covers both instead of timing out on the create header in edit mode
+        return self.is_visible(f"{self.HEADER_TITLE}, {self.EDIT_HEADER}", timeout=5000)
 
     @allure.step("Enter polygon name: {name}")
     def enter_polygon_name(self, name: str) -> None:
         self.fill(self.POLYGON_NAME_INPUT, name)
-        self.logger.info(f"Entered polygon name: {name}")
+        self.logger.info("Entered polygon name: %s", name)
 
     @allure.step("Select delivery type: Quick Commerce")
     def select_quick_commerce(self) -> None:
@@ -77,31 +109,31 @@ class CreatePolygonPage(BasePage):
 
     @allure.step("Enter travel time: {minutes} minutes")
     def enter_travel_time(self, minutes: int) -> None:
-        travel_time_input = self.page.locator(self.TRAVEL_TIME_INPUT)
+        travel_time_input = self.locator(self.TRAVEL_TIME_INPUT)
         travel_time_input.click()
         travel_time_input.fill(str(minutes))
-        self.logger.info(f"Entered travel time: {minutes} minutes")
+        self.logger.info("Entered travel time: %s minutes", minutes)
 
     @allure.step("Enter travel distance: {distance} meters")
     def enter_travel_distance(self, distance: int) -> None:
-        travel_distance_input = self.page.locator(self.TRAVEL_DISTANCE_INPUT)
+        travel_distance_input = self.locator(self.TRAVEL_DISTANCE_INPUT)
         travel_distance_input.click()
         travel_distance_input.fill(str(distance))
-        self.logger.info(f"Entered travel distance: {distance} meters")
+        self.logger.info("Entered travel distance: %s meters", distance)
 
     @allure.step("Enter maximum promise time: {minutes} minutes")
     def enter_max_promise_time(self, minutes: int) -> None:
-        max_promise_input = self.page.locator(self.MAX_PROMISE_TIME_INPUT)
+        max_promise_input = self.locator(self.MAX_PROMISE_TIME_INPUT)
         max_promise_input.click()
         max_promise_input.fill(str(minutes))
-        self.logger.info(f"Entered maximum promise time: {minutes} minutes")
+        self.logger.info("Entered maximum promise time: %s minutes", minutes)
 
     @allure.step("Enter flat delivery fee: {fee}")
     def enter_flat_delivery_fee(self, fee: int) -> None:
-        delivery_fee_input = self.page.locator(self.FLAT_DELIVERY_FEE_INPUT)
+        delivery_fee_input = self.locator(self.FLAT_DELIVERY_FEE_INPUT)
         delivery_fee_input.click()
         delivery_fee_input.fill(str(fee))
-        self.logger.info(f"Entered flat delivery fee: {fee}")
+        self.logger.info("Entered flat delivery fee: %s", fee)
 
     @allure.step("Select store type: Grocery")
     def select_grocery_store_type(self) -> None:
@@ -115,10 +147,11 @@ class CreatePolygonPage(BasePage):
 
     @allure.step("Upload CSV file: {file_path}")
     def upload_csv_file(self, file_path: str) -> None:
+        upload_path = prepare_upload_csv(file_path)
         self.click(self.UPLOAD_CORDINATES_BUTTON)
-        file_input = self.page.locator(self.UPLOAD_CSV_BUTTON)
-        file_input.set_input_files(file_path)
-        self.logger.info(f"Uploaded CSV file: {file_path}")
+        file_input = self.locator(self.UPLOAD_CSV_BUTTON)
+        file_input.set_input_files(str(upload_path))
+        self.logger.info("Uploaded CSV file: %s", file_path)
 
     @allure.step("Select manual drawing option")
     def select_manual_drawing(self) -> None:
@@ -126,64 +159,94 @@ class CreatePolygonPage(BasePage):
         self.logger.info("Selected manual drawing option")
 
     @allure.step("Draw polygon on map using coordinates")
-    def draw_polygon_on_map(self) -> None:
-        self.page.wait_for_timeout(1000)
-
-        box = self.page.evaluate("""
-            () => {
-                const iframe = document.querySelector('iframe');
-                if (iframe) {
-                    const rect = iframe.getBoundingClientRect();
-                    return { x: rect.x, y: rect.y, width: rect.width, height: rect.height };
-                }
-                return null;
-            }
-        """)
-
-        if box:
-            center_x = box['x'] + box['width'] / 2
-            center_y = box['y'] + box['height'] / 2
-
-            radius = 50
-            points = []
-            for i in range(5):
-                angle = (2 * math.pi * i) / 5
-                x = center_x + radius * math.cos(angle)
-                y = center_y + radius * math.sin(angle)
-                points.append((x, y))
-
-            if points:
-                points.append(points[0])
-
+    def draw_polygon_on_map(self, offsets: Optional[np.ndarray] = None, coordinates: Optional[np.ndarray] = None) -> None:
+        map_frame = self.locator(self.MAP_FRAME).first
+        map_frame.scroll_into_view_if_needed()
+        frame = map_frame.element_handle().content_frame()
+        frame.wait_for_load_state()
+        box = map_frame.evaluate(self.MAP_FRAME_BOX_SCRIPT)
+
+        viewport = {'width': box['width'], 'height': box['height']}
+        if coordinates is not None:
+            viewport = (self.viewport_from_url(frame.url, box['width'], box['height'])
+                        or frame.evaluate(self.MAP_VIEWPORT_SCRIPT) or viewport)
+
+        points = self.map_click_points(viewport, offsets=offsets, coordinates=coordinates)
+        self._click_points([(box['x'] + x, box['y'] + y) for x, y in points])
+        self.logger.info("Drew polygon on map with %d vertices", len(points) - 1)
+
+    def _click_points(self, points: list) -> None:
+        # Map libraries ignore synthetic events that are not trusted. page.mouse clicks are trusted but each one
+        # pays slow_mo, so on Chromium the whole shape goes through one CDP session as raw input events instead
+        browser = self.page.context.browser
+        if browser is None or browser.browser_type.name != 'chromium':
             for x, y in points:
                 self.page.mouse.click(x, y)
-                self.page.wait_for_timeout(300)
-
-        self.logger.info("Drew polygon on map using mouse clicks")
+            return
 
-    def _get_coordinates_from_csv(self) -> list:
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'testData', 'lat_long_coordinates.csv')
-
-        coordinates = []
-        with open(csv_path, 'r') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                lat = float(row['latitude'])
-                lng = float(row['longitude'])
-                coordinates.append((lat, lng))
-
-        return coordinates
+        session = self.page.context.new_cdp_session(self.page)
+        try:
+            for x, y in points:
+                for event in self.mouse_click_events(x, y):
+                    session.send('Input.dispatchMouseEvent', event)
+        finally:
+            session.detach()
+
+    @staticmethod
+    def mouse_click_events(x: float, y: float) -> list[dict]:
+        return [
+            {'type': 'mouseMoved', 'x': x, 'y': y},
+            {'type': 'mousePressed', 'x': x, 'y': y, 'button': 'left', 'clickCount': 1},
+            {'type': 'mouseReleased', 'x': x, 'y': y, 'button': 'left', 'clickCount': 1},
+        ]
+
+    @classmethod
+    def viewport_from_url(cls, url: str, width: float, height: float) -> Optional[dict]:
+        match = cls.MAP_URL_VIEW_PATTERN.search(url)
+        if match:
+            latitude, longitude, zoom = map(float, match.groups())
+            return centered_viewport((latitude, longitude), zoom, width, height)
+
+        query = dict(parse_qsl(urlsplit(url).query))
+        center, zoom = query.get('center') or query.get('ll'), query.get('zoom') or query.get('z')
+        try:
+            latitude, longitude = map(float, center.split(','))
+            return centered_viewport((latitude, longitude), float(zoom), width, height)
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+    @classmethod
+    def map_click_points(
+        cls,
+        viewport: dict,
+        offsets: Optional[np.ndarray] = None,
+        coordinates: Optional[np.ndarray] = None
+    ) -> list:
+        if coordinates is not None:
+            if 'zoom' not in viewport:
+                raise ValueError("The map frame's URL has no center and zoom and it does not publish window.mapViewport, "
+                                 "so coordinates cannot be projected")
+            projection = map_projection(
+                viewport['north'], viewport['west'], viewport['zoom'], viewport['width'], viewport['height']
+            )
+            points = projection.project(coordinates)
+        else:
+            offsets = regular_polygon(5, radius=50) if offsets is None else np.asarray(offsets)
+            points = np.array([viewport['width'] / 2, viewport['height'] / 2]) + offsets
+
+        # Clicking the first vertex again closes the polygon
+        if not (points[0] == points[-1]).all():
+            points = np.vstack((points, points[:1]))
+        return points.tolist()
 
     @allure.step("Click Create button")
     def click_create(self) -> None:
-        self.click(self.CREATE_BUTTON)
-        self.wait_for_load_state('networkidle')
+        self.click(self.CREATE_BUTTON, wait_for='create')
         self.logger.info("Clicked Create button")
 
     @allure.step("Click Update button")
     def click_update(self) -> None:
-        self.click(self.UPDATE_BUTTON)
-        self.wait_for_load_state('networkidle')
+        self.click(self.UPDATE_BUTTON, wait_for='update')
         self.logger.info("Clicked Update button")
 
     @allure.step("Create QC polygon with travel time")
@@ -203,7 +266,7 @@ class CreatePolygonPage(BasePage):
             self.enter_max_promise_time(max_promise_time)
 
         self.click_create()
-        self.logger.info(f"Created QC polygon with travel time: {name}")
+        self.logger.info("Created QC polygon with travel time: %s", name)
 
     @allure.step("Create Slotted Delivery polygon with travel distance")
     def create_slotted_polygon_travel_distance(
@@ -229,30 +292,105 @@ class CreatePolygonPage(BasePage):
                 self.select_digital_store_type()
 
         self.click_create()
-        self.logger.info(f"Created Slotted Delivery polygon: {name}")
+        self.logger.info("Created Slotted Delivery polygon: %s", name)
 
     @allure.step("Create QC polygon with manual CSV upload")
-    def create_qc_polygon_manual_csv(self, name: str, csv_file_path: str) -> None:
+    def create_qc_polygon_manual_csv(
+        self,
+        name: str,
+        csv_file_path: Optional[str] = None,
+        coordinates: Optional[np.ndarray] = None
+    ) -> None:
+        if coordinates is not None:
+            csv_file_path = str(write_coordinates_csv(name, coordinates))
         self.enter_polygon_name(name)
         self.select_quick_commerce()
         self.select_manual_tab()
         self.upload_csv_file(csv_file_path)
-        self.page.wait_for_timeout(2000)
+        self.pause(2000)
         self.click_create()
-        self.logger.info(f"Created QC polygon with manual CSV: {name}")
+        self.logger.info("Created QC polygon with manual CSV: %s", name)
 
     @allure.step("Create Slotted Delivery polygon with manual drawing")
-    def create_slotted_polygon_manual_drawing(self, name: str) -> None:
+    def create_slotted_polygon_manual_drawing(
+        self,
+        name: str,
+        offsets: Optional[np.ndarray] = None,
+        coordinates: Optional[np.ndarray] = None
+    ) -> None:
         self.enter_polygon_name(name)
         self.select_slotted_delivery()
         self.select_manual_tab()
-        self.draw_polygon_on_map()
+        self.draw_polygon_on_map(offsets=offsets, coordinates=coordinates)
         self.click_create()
-        self.logger.info(f"Created Slotted Delivery polygon with manual drawing: {name}")
+        self.logger.info("Created Slotted Delivery polygon with manual drawing: %s", name)
 
     @allure.step("Edit polygon - change from travel time to travel distance")
     def edit_polygon_change_to_travel_distance(self, travel_distance: int) -> None:
         self.select_travel_distance_tab()
         self.enter_travel_distance(travel_distance)
         self.click_update()
-        self.logger.info(f"Edited polygon to travel distance: {travel_distance}")
+        self.logger.info("Edited polygon to travel distance: %s", travel_distance)
+
+    @allure.step("Create polygons in one batch")
+    def create_polygons(self, specs: list[dict]) -> list[str]:
+        for spec in specs:
+            self.validate_polygon_spec(spec)
+
+        store_details_page = StoreDetailsPage(self.page)
+        for index, spec in enumerate(specs):
+            # The form for the first polygon is already open; the app returns to the store after each Create
+            if index:
+                store_details_page.click_create_polygon()
+            self.fill_polygon_form(spec)
+            self.click_create()
+            self.logger.info("Created polygon %s/%s: %s", index + 1, len(specs), spec['name'])
+
+        return store_details_page.find_missing_polygons([spec['name'] for spec in specs])
+
+    @allure.step("Fill polygon form")
+    def fill_polygon_form(self, spec: dict) -> None:
+        self.enter_polygon_name(spec['name'])
+
+        if spec['delivery_type'] == 'quick_commerce':
+            self.select_quick_commerce()
+        else:
+            self.select_slotted_delivery()
+
+        if spec.get('travel_time') is not None:
+            self.select_travel_time_tab()
+            self.enter_travel_time(spec['travel_time'])
+        elif spec.get('travel_distance') is not None:
+            self.select_travel_distance_tab()
+            self.enter_travel_distance(spec['travel_distance'])
+        else:
+            self.select_manual_tab()
+            if spec.get('coordinates') is not None:
+                self.upload_csv_file(str(write_coordinates_csv(spec['name'], spec['coordinates'])))
+            elif spec.get('csv_file_path'):
+                self.upload_csv_file(str(spec['csv_file_path']))
+            else:
+                self.draw_polygon_on_map()
+
+        if spec.get('max_promise_time'):
+            self.enter_max_promise_time(spec['max_promise_time'])
+        if spec.get('flat_delivery_fee'):
+            self.enter_flat_delivery_fee(spec['flat_delivery_fee'])
+
+        store_type = (spec.get('store_type') or '').lower()
+        if store_type == 'grocery':
+            self.select_grocery_store_type()
+        elif store_type == 'digital':
+            self.select_digital_store_type()
+
+    @classmethod
+    def validate_polygon_spec(cls, spec: dict) -> None:
+        if not spec.get('name'):
+            raise ValueError(f"Polygon spec needs a name: {spec}")
+        if spec.get('delivery_type') not in cls.DELIVERY_TYPES:
+            raise ValueError(f"Invalid delivery type: {spec.get('delivery_type')}. Must be one of {cls.DELIVERY_TYPES}")
+        if spec.get('store_type') and spec['store_type'].lower() not in cls.STORE_TYPES:
+            raise ValueError(f"Invalid store type: {spec['store_type']}. Must be one of {cls.STORE_TYPES}")
+        areas = [key for key in ('travel_time', 'travel_distance', 'coordinates', 'csv_file_path') if spec.get(key) is not None]
+        if len(areas) > 1:
+            raise ValueError(f"Polygon '{spec['name']}' sets more than one of {areas}")
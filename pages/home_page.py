@@ -1,5 +1,6 @@
 from playwright.sync_api import Page
 from pages.base_page import BasePage
+from pages.wait_strategy import ResponseWait
 import allure
 
 
@@ -9,14 +10,24 @@ class HomePage(BasePage):
     USER_PROFILE = "//div[@id='avatarContainer']"
     LOGOUT_BUTTON = "text=Log Out"
 
+    WAIT_STRATEGIES = {
+        'store_list': ResponseWait('GET', 'stores'),
+        'logout': ResponseWait('POST', 'logout'),
+    }
+
     def __init__(self, page: Page):
         super().__init__(page)
         self.logger.info("Home page initialized")
 
+    @allure.step("Open home page")
+    def open(self) -> None:
+        self.navigate(self.config.base_url)
+        self.wait_for_element(self.STORES_NAV)
+        self.logger.info("Opened home page with cached session")
+
     @allure.step("Navigate to Stores section")
     def navigate_to_stores(self) -> None:
-        self.wait_for_load_state('networkidle')
-        self.click(self.STORES_NAV)
+        self.click(self.STORES_NAV, wait_for='store_list')
         self.logger.info("Navigated to Stores section")
 
     @allure.step("Click user profile")
@@ -27,9 +38,5 @@ class HomePage(BasePage):
     @allure.step("Logout from application")
     def logout(self) -> None:
         self.click_user_profile()
-        self.page.wait_for_timeout(2000)
-        logout_option = self.page.locator(self.LOGOUT_BUTTON)
-        logout_option.is_visible(timeout=3000)
-        logout_option.click()
-        self.wait_for_load_state('networkidle')
+        self.click(self.LOGOUT_BUTTON, wait_for='logout')
         self.logger.info("Logged out successfully")
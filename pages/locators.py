@@ -0,0 +1,133 @@
+import importlib
+import pkgutil
+import re
+import string
+import sys
+from typing import Optional
+
+LITERAL_TYPES = (str, int)
+
+
+def css_string(value: str) -> str:
+    # Quoted string for CSS, text= and role= engines, with quotes, backslashes and newlines escaped
+    escaped = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\a ')
+    return f'"{escaped}"'
+
+
+def xpath_string(value: str) -> str:
+    # XPath 1.0 has no escape sequences, so a value holding both quote kinds is split with concat()
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return 'concat(' + ', "\'", '.join(f"'{part}'" for part in value.split("'")) + ')'
+
+
+class Selector:
+    # A parametrized selector declared once on a page class; {name} placeholders are filled with escaped literals
+
+    def __init__(self, template: str, **types: type):
+        self.template = template
+        self.params = tuple(dict.fromkeys(field for _, field, _, _ in string.Formatter().parse(template) if field))
+        unknown = set(types) - set(self.params)
+        if unknown:
+            raise ValueError(f"Selector types given for missing placeholders {sorted(unknown)}: {template}")
+        self.types = {name: types.get(name, str) for name in self.params}
+        if not all(kind in LITERAL_TYPES for kind in self.types.values()):
+            raise ValueError(f"Selector placeholders must be str or int: {template}")
+        self.is_xpath = template.lstrip('(').startswith(('//', 'xpath='))
+        self.owner: Optional[str] = None
+        self.name: Optional[str] = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.owner = owner.__qualname__
+        self.name = name
+
+    def format(self, **values) -> str:
+        if set(values) != set(self.params):
+            raise TypeError(f"{self} takes {list(self.params)}, got {sorted(values)}")
+        literals = {}
+        for name, value in values.items():
+            kind = self.types[name]
+            if not isinstance(value, kind) or isinstance(value, bool):
+                raise TypeError(f"{self} expects {name} to be {kind.__name__}, got {type(value).__name__}")
+            if kind is int:
+                literals[name] = str(value)
+            else:
+                literals[name] = xpath_string(value) if self.is_xpath else css_string(value)
+        return self.template.format(**literals)
+
+    def __repr__(self) -> str:
+        return f"{self.owner}.{self.name}" if self.name else f"Selector({self.template!r})"
+
+
+def page_classes() -> list[type]:
+    # Importing every page module makes each page class visible as a BasePage subclass
+    import pages
+    from pages.base_page import BasePage
+    for module in pkgutil.iter_modules(pages.__path__):
+        if not module.ispkg:
+            importlib.import_module(f"pages.{module.name}")
+
+    classes, pending = [], [BasePage]
+    while pending:
+        cls = pending.pop(0)
+        classes.append(cls)
+        pending.extend(cls.__subclasses__())
+    return classes
+
+
+def inventory() -> list[dict]:
+    rows = []
+    for cls in page_classes():
+        for name, value in vars(cls).items():
+            if not name.isupper() or name.endswith('_SCRIPT'):
+                continue
+            if isinstance(value, Selector):
+                rows.append({'page': cls.__name__, 'name': name, 'selector': value.template,
+                             'params': {param: kind.__name__ for param, kind in value.types.items()}})
+            elif isinstance(value, str):
+                rows.append({'page': cls.__name__, 'name': name, 'selector': value, 'params': {}})
+    return rows
+
+
+def _unbalanced(selector: str) -> bool:
+    # Brackets inside quoted strings do not count
+    unquoted = re.sub(r'"(?:[^"\\]|\\.)*"|\'[^\']*\'', '', selector)
+    return unquoted.count('[') != unquoted.count(']') or unquoted.count('(') != unquoted.count(')')
+
+
+def lint(rows: Optional[list[dict]] = None) -> list[str]:
+    rows = inventory() if rows is None else rows
+    problems, seen = [], {}
+    for row in rows:
+        where = f"{row['page']}.{row['name']}"
+        selector = row['selector']
+        if row['params']:
+            for param in row['params']:
+                if re.search(rf"""['"]\{{{param}\}}['"]""", selector):
+                    problems.append(f"{where}: placeholder {{{param}}} is quoted; Selector adds the quotes")
+        elif re.search(r'\{\w+\}', selector):
+            problems.append(f"{where}: string template with placeholders; declare it as a Selector")
+        if _unbalanced(selector):
+            problems.append(f"{where}: unbalanced brackets")
+        duplicate = seen.setdefault((row['page'], selector), row['name'])
+        if duplicate != row['name']:
+            problems.append(f"{where}: same selector as {row['page']}.{duplicate}")
+    return problems
+
+
+def main() -> int:
+    rows = inventory()
+    for row in rows:
+        params = ', '.join(f"{name}: {kind}" for name, kind in row['params'].items())
+        print(f"{row['page'] + '.' + row['name']:<48} {row['selector']}" + (f"  ({params})" if params else ''))
+    problems = lint(rows)
+    print(f"\n{len(rows)} selectors, {len(problems)} problems")
+    for problem in problems:
+        print(f"  {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,5 +1,6 @@
 from playwright.sync_api import Page
 from pages.base_page import BasePage
+from pages.wait_strategy import ResponseWait
 import allure
 
 
@@ -11,6 +12,10 @@ class LoginPage(BasePage):
     LOGIN_BUTTON = "[data-testid='Auth_Login_index_Button']"
     LOGO = "img[alt='logo']"
 
+    WAIT_STRATEGIES = {
+        'login': ResponseWait('POST', 'login'),
+    }
+
     def __init__(self, page: Page):
         super().__init__(page)
         self.logger.info("Login page initialized")
@@ -24,7 +29,7 @@ class LoginPage(BasePage):
     @allure.step("Enter email: {email}")
     def enter_email(self, email: str) -> None:
         self.fill(self.EMAIL_INPUT, email)
-        self.logger.info(f"Entered email: {email}")
+        self.logger.info("Entered email: %s", email)
 
     @allure.step("Enter password")
     def enter_password(self, password: str) -> None:
@@ -38,24 +43,24 @@ class LoginPage(BasePage):
 
     @allure.step("Click login button")
     def click_login(self) -> None:
-        self.click(self.LOGIN_BUTTON)
+        self.click(self.LOGIN_BUTTON, wait_for='login')
         self.logger.info("Clicked login button")
 
     @allure.step("Login with credentials")
     def login(self, email: str, password: str) -> None:
-        self.logger.info(f"Attempting to login with email: {email}")
+        self.logger.info("Attempting to login with email: %s", email)
         self.enter_email(email)
         self.enter_password(password)
         self.accept_terms()
         self.click_login()
-
-        self.page.wait_for_load_state('networkidle')
         self.logger.info("Login successful")
 
     @allure.step("Verify login page is displayed")
     def is_login_page_displayed(self) -> bool:
-        self.page.wait_for_load_state('networkidle')
-        self.page.wait_for_timeout(9000)
+        try:
+            self.page.wait_for_url("**/login**", timeout=self.config.timeout)
+        except Exception as e:
+            self.logger.debug("Login URL not reached: %s", e)
         url_has_login = "/login" in self.page.url
         logo_visible = self.is_visible(self.LOGO, timeout=5000)
         self.logger.info("Login page displayed")
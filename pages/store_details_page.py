@@ -1,7 +1,14 @@
 from playwright.sync_api import Page
+from pathlib import Path
+from typing import Iterable, Optional
 import allure
+import json
+import os
 from pages.base_page import BasePage
-from utils.helpers import validate_downloaded_file, generate_unique_filename
+from pages.locators import Selector
+from pages.wait_strategy import ResponseWait
+from utils.export_validator import validate_export
+from utils.helpers import validate_downloaded_file, generate_unique_filename, worker_path
 
 class StoreDetailsPage(BasePage):
 
@@ -18,19 +25,47 @@ class StoreDetailsPage(BasePage):
 
     EDIT_BUTTON = "text=Edit"
     DISTANCE_TEXT = "//p[@data-testid='StoreDetails_PolygonCard_PolygonCard_p']"
-    POLYGON_INACTIVE_OPTION = "(//a[@target='_self'][normalize-space()='Set as Inactive'])[2]"
-    POLYGON_MENU_BUTTON = "//span[@data-testid='StoreDetails_PolygonCard_PolygonCard_span']/div[@class='JMMenu']"
-
     DIALOG_SAVE_BUTTON = "button:has-text('Save')"
 
+    POLYGON_HEADING = Selector("h4:has-text({polygon_name})")
+    POLYGON_HEADINGS = "h4"
+    POLYGON_STATUS_BADGE = Selector(
+        "//h4[normalize-space()={polygon_name}]/../.."
+        "//span[@data-testid='components_JMBadge_JMBadge_span'][normalize-space()={status}]"
+    )
+    # Scoped to the polygon's card, so the store menu's own "Set as Inactive" link is never picked up
+    POLYGON_MENU_BUTTON = Selector(
+        "//h4[normalize-space()={polygon_name}]/../.."
+        "//span[@data-testid='StoreDetails_PolygonCard_PolygonCard_span']/div[@class='JMMenu']"
+    )
+    POLYGON_INACTIVE_OPTION = Selector(
+        "//h4[normalize-space()={polygon_name}]/../..//a[@target='_self'][normalize-space()='Set as Inactive']"
+    )
+    STORE_STATUS_BADGE = Selector("(//span[@data-testid='components_JMBadge_JMBadge_span'][normalize-space()={status}])[1]")
+
+    # Shorter shared prefixes match too much of the store's list to be worth one search
+    MIN_SHARED_SEARCH = 6
+
+    WAIT_STRATEGIES = {
+        'search_polygon': ResponseWait('GET', 'polygons'),
+        'store_status': ResponseWait('PATCH', 'store_status'),
+        'polygon_details': ResponseWait('GET', 'polygon'),
+        'polygon_status': ResponseWait('PATCH', 'polygon_status'),
+    }
+
     def __init__(self, page: Page):
         super().__init__(page)
         self.logger.info("Store Details page initialized")
 
+    @allure.step("Open store {store_code} by deep link")
+    def open(self, store_code: str) -> None:
+        self.navigate(self.config.store_url(store_code))
+        self.wait_for_element(self.STORE_DETAILS_HEADING)
+        self.logger.info("Opened store %s details page", store_code)
+
     @allure.step("Verify store details page is displayed")
     def is_store_details_page_displayed(self) -> bool:
-        self.wait_for_load_state('networkidle')
-        return self.is_visible(self.STORE_DETAILS_HEADING)
+        return self.is_visible(self.STORE_DETAILS_HEADING, timeout=5000)
 
     @allure.step("Get store name")
     def get_store_name(self) -> str:
@@ -39,28 +74,47 @@ class StoreDetailsPage(BasePage):
     @allure.step("Click create polygon button")
     def click_create_polygon(self) -> None:
         self.click(self.CREATE_POLYGON_BUTTON)
-        self.wait_for_load_state('networkidle')
         self.logger.info("Clicked create polygon button")
 
     @allure.step("Search for polygon: {polygon_name}")
     def search_polygon(self, polygon_name: str) -> None:
-        self.page.wait_for_load_state('networkidle')
-        self.fill(self.SEARCH_POLYGON_INPUT, polygon_name)
-        self.logger.info(f"Searched for polygon: {polygon_name}")
+        self.fill(self.SEARCH_POLYGON_INPUT, polygon_name, wait_for='search_polygon')
+        self.logger.info("Searched for polygon: %s", polygon_name)
 
     @allure.step("Verify polygon exists: {polygon_name}")
-    def is_polygon_visible(self, polygon_name: str) -> bool:
-        polygon_heading = f"h4:has-text('{polygon_name}')"
-        is_visible = self.is_visible(polygon_heading, timeout=5000)
-        self.logger.info(f"Polygon '{polygon_name}' visible: {is_visible}")
+    def is_polygon_visible(self, polygon_name: str, timeout: Optional[int] = 5000) -> bool:
+        is_visible = self.is_visible(self.locator(self.POLYGON_HEADING, polygon_name=polygon_name), timeout=timeout)
+        self.logger.info("Polygon '%s' visible: %s", polygon_name, is_visible)
         return is_visible
 
+    @allure.step("Verify polygons exist")
+    def find_missing_polygons(self, polygon_names: list[str]) -> list[str]:
+        # One search for the names' shared prefix brings every polygon of a batch into the list at once
+        prefix = os.path.commonprefix(polygon_names)
+        missing = list(polygon_names)
+        if len(prefix) >= self.MIN_SHARED_SEARCH:
+            self.search_polygon(prefix)
+            # The search already waited for its response, so the list is read once instead of waiting per name
+            shown = self._shown_polygon_names()
+            missing = [name for name in polygon_names if name not in shown]
+        # Unrelated names, or ones beyond the first page of a shared search, are looked up one by one
+        missing = [name for name in missing if not self._search_and_check(name)]
+        self.logger.info("Found %s of %s polygons, missing: %s", len(polygon_names) - len(missing), len(polygon_names), missing)
+        return missing
+
+    def _search_and_check(self, polygon_name: str) -> bool:
+        self.search_polygon(polygon_name)
+        return polygon_name in self._shown_polygon_names()
+
+    def _shown_polygon_names(self) -> set[str]:
+        return {text.strip() for text in self.locator(self.POLYGON_HEADINGS).all_inner_texts()}
+
     @allure.step("Verify polygon status: {polygon_name} - {expected_status}")
     def verify_polygon_status(self, polygon_name: str, expected_status: str) -> bool:
-        status_element = self.page.locator(f"//h4[normalize-space()='{polygon_name}']/../..//span[@data-testid='components_JMBadge_JMBadge_span'][normalize-space()='{expected_status}']")
+        status_element = self.locator(self.POLYGON_STATUS_BADGE, polygon_name=polygon_name, status=expected_status)
         is_status_correct = status_element.is_visible()
 
-        self.logger.info(f"Polygon '{polygon_name}' has status '{expected_status}': {is_status_correct}")
+        self.logger.info("Polygon '%s' has status '%s': %s", polygon_name, expected_status, is_status_correct)
         return is_status_correct
 
     @allure.step("Click three dots menu for Store")
@@ -69,29 +123,47 @@ class StoreDetailsPage(BasePage):
         self.logger.info("Clicked three dots menu")
 
     @allure.step("Click Export Data and validate file is downloaded")
-    def click_export_data_download_file(self) -> None:
+    def click_export_data_download_file(self, expected_polygons: Iterable[str] = (), store_key: Optional[str] = None) -> None:
         with self.page.expect_download() as download_info:
             self.click(self.EXPORT_DATA_OPTION)
             self.logger.info("Clicked Export Data option")
             download = download_info.value
 
             unique_filename = generate_unique_filename(download.suggested_filename)
-            file_path = self.config.downloads_path / unique_filename
+            file_path = worker_path(self.config.downloads_path) / unique_filename
             download.save_as(file_path)
-            self.logger.info(f"File downloaded successfully: {unique_filename}")
+            self.logger.info("File downloaded successfully: %s", unique_filename)
 
             validate_downloaded_file(file_path)
-            self.logger.info(f"File validation successful - Size: {file_path.stat().st_size} bytes")
+            self.logger.info("File validation successful - Size: %s bytes", file_path.stat().st_size)
+            self.validate_export(file_path, expected_polygons, history_key=store_key)
+
+    @allure.step("Validate export contents")
+    def validate_export(self, file_path: Path, expected_polygons: Iterable[str] = (), history_key: Optional[str] = None) -> None:
+        # Keyed by the store rather than the download's file name, which may carry a timestamp
+        report = validate_export(file_path, expected_polygons, history_key=history_key)
+        self.logger.info("Export %s", report.summary())
+        allure.attach(
+            json.dumps({'summary': report.summary(), 'checksum': report.checksum, 'diff': report.diff}, indent=2),
+            name="Export validation",
+            attachment_type=allure.attachment_type.JSON
+        )
+        # Polygons found missing by a name column that is really there always fail; only schema guesses are lenient
+        if report.has_names and report.missing_polygons:
+            raise AssertionError(f"Export validation failed: {report.summary()}")
+        if report.is_valid:
+            return
+        if self.config.export_strict:
+            raise AssertionError(f"Export validation failed: {report.summary()}")
+        self.logger.warning("Export does not match the expected schema, continuing: %s", report.summary())
 
     @allure.step("Set store status to: {status}")
     def set_store_status(self, status: str) -> None:
         if status not in ['Active', 'Inactive']:
             raise ValueError(f"Invalid status: {status}. Must be 'Active' or 'Inactive'")
-        self.page.wait_for_timeout(2000)
         option_locator = self.SET_ACTIVE_OPTION if status == 'Active' else self.SET_INACTIVE_OPTION
-        self.page.locator(option_locator).first.click()
-        self.wait_for_load_state('networkidle')
-        self.logger.info(f"Set store status to {status}")
+        self.click(self.locator(option_locator).first, wait_for='store_status')
+        self.logger.info("Set store status to %s", status)
 
     @allure.step("Click Set as Inactive option")
     def click_set_as_inactive(self) -> None:
@@ -103,36 +175,31 @@ class StoreDetailsPage(BasePage):
 
     @allure.step("Verify store status: {expected_status}")
     def verify_store_status(self, expected_status: str) -> bool:
-        self.page.wait_for_load_state('networkidle')
-        self.page.wait_for_timeout(5000)
-        status_locator = (f"(//span[@data-testid='components_JMBadge_JMBadge_span'][normalize-space()='{expected_status}'])[1]")
-        is_status_visible = self.is_visible(status_locator)
-        self.logger.info(f"Store status '{expected_status}' visible: {is_status_visible}")
+        is_status_visible = self.is_visible(self.locator(self.STORE_STATUS_BADGE, status=expected_status), timeout=5000)
+        self.logger.info("Store status '%s' visible: %s", expected_status, is_status_visible)
         return is_status_visible
 
     @allure.step("Click polygon three dots menu: {polygon_name}")
     def click_polygon_menu(self, polygon_name: str) -> None:
-        self.click(self.POLYGON_MENU_BUTTON)
-        self.logger.info(f"Clicked menu for polygon: {polygon_name}")
+        self.click(self.locator(self.POLYGON_MENU_BUTTON, polygon_name=polygon_name))
+        self.logger.info("Clicked menu for polygon: %s", polygon_name)
 
     @allure.step("Click Edit polygon: {polygon_name}")
     def click_edit_polygon(self, polygon_name: str) -> None:
         self.click_polygon_menu(polygon_name)
-        self.click(self.EDIT_BUTTON)
-        self.wait_for_load_state('networkidle')
-        self.logger.info(f"Clicked Edit for polygon: {polygon_name}")
+        self.click(self.EDIT_BUTTON, wait_for='polygon_details')
+        self.logger.info("Clicked Edit for polygon: %s", polygon_name)
 
     @allure.step("Set polygon as inactive: {polygon_name}")
     def set_polygon_inactive(self, polygon_name: str) -> None:
         self.click_polygon_menu(polygon_name)
-        self.click(self.POLYGON_INACTIVE_OPTION)
-        self.wait_for_load_state('networkidle')
-        self.logger.info(f"Set polygon '{polygon_name}' as inactive")
+        self.click(self.locator(self.POLYGON_INACTIVE_OPTION, polygon_name=polygon_name), wait_for='polygon_status')
+        self.logger.info("Set polygon '%s' as inactive", polygon_name)
 
     @allure.step("Verify polygon travel distance: {polygon_name} - {expected_distance}")
     def verify_polygon_travel_distance(self, polygon_name: str, expected_distance: str) -> bool:
         actual_distance_text = self.get_text(self.DISTANCE_TEXT)
         is_distance_correct = expected_distance in actual_distance_text
 
-        self.logger.info(f"Polygon '{polygon_name}' - Expected: '{expected_distance}', Actual: '{actual_distance_text}', Match: {is_distance_correct}")
+        self.logger.info("Polygon '%s' - Expected: '%s', Actual: '%s', Match: %s", polygon_name, expected_distance, actual_distance_text, is_distance_correct)
         return is_distance_correct
@@ -0,0 +1,26 @@
+import re
+from typing import Optional
+from urllib.parse import urlsplit
+from playwright.sync_api import Response
+from utils.config_manager import ConfigManager
+
+
+class ResponseWait:
+
+    def __init__(self, method: str, api_path: str):
+        self.method = method
+        self.api_path = api_path
+        self._pattern: Optional[re.Pattern] = None
+
+    @property
+    def pattern(self) -> re.Pattern:
+        # Compiled on first use so that configuration overrides applied at startup are honoured
+        if self._pattern is None:
+            self._pattern = re.compile(f"/{ConfigManager().api_path_pattern(self.api_path)}/?$")
+        return self._pattern
+
+    def matches(self, response: Response) -> bool:
+        return response.request.method == self.method and bool(self.pattern.search(urlsplit(response.url).path))
+
+    def __repr__(self) -> str:
+        return f"{self.method} {self.api_path}"
@@ -0,0 +1,38 @@
+from typing import Optional
+from services.tms_api_client import TmsApiClient
+from utils.helpers import generate_polygon_name
+from utils.logger import Logger
+
+
+class Preconditions:
+    # Setup and cleanup over the API, so UI steps are spent only on the behaviour under test
+
+    def __init__(self, api: TmsApiClient):
+        self.api = api
+        self.logger = Logger()
+        self._store_statuses: dict[str, str] = {}
+
+    def store_code(self, store_name: str) -> Optional[str]:
+        store = next((store for store in self.api.list_stores() if store.get('name') == store_name), None)
+        return store['code'] if store else None
+
+    def qc_polygon(self, store_code: str, prefix: str = 'seeded_qc_polygon', travel_time: int = 18) -> str:
+        name = generate_polygon_name(prefix)
+        self.api.create_qc_polygon_travel_time(store_code, name, travel_time=travel_time)
+        self.logger.info("Seeded QC polygon %s in store %s", name, store_code)
+        return name
+
+    def keep_store_status(self, store_code: str) -> None:
+        # The status now is put back by restore() if the test leaves the store changed
+        if store_code not in self._store_statuses:
+            self._store_statuses[store_code] = self.api.get_store(store_code)['status']
+
+    def restore(self) -> None:
+        for store_code, status in self._store_statuses.items():
+            try:
+                if self.api.get_store(store_code).get('status') != status:
+                    self.api.set_store_status(store_code, status)
+                    self.logger.info("Restored store %s to %s", store_code, status)
+            except Exception as e:
+                self.logger.warning("Could not restore store %s to %s: %s", store_code, status, e)
+        self._store_statuses.clear()
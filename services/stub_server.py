@@ -0,0 +1,210 @@
+import itertools
+import json
+import mimetypes
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlparse, parse_qs, unquote
+from utils.config_manager import ConfigManager
+from utils.logger import Logger
+
+
+class TmsStubServer:
+
+    API_PREFIX = '/api/'
+    STATIC_PREFIX = '/tms/'
+
+    DEFAULT_STORES = [
+        {'code': 'STR001', 'name': 'Andheri Fresh Store', 'status': 'Active', 'latitude': 19.1197, 'longitude': 72.8468},
+        {'code': 'STR002', 'name': 'Bandra Grocery Hub', 'status': 'Active', 'latitude': 19.0596, 'longitude': 72.8295},
+        {'code': 'STR003', 'name': 'Powai Digital Point', 'status': 'Inactive', 'latitude': 19.1176, 'longitude': 72.9060},
+    ]
+
+    ROUTES = (
+        ('GET', 'stores', '_list_stores'),
+        ('GET', 'store', '_get_store'),
+        ('PATCH', 'store_status', '_set_store_status'),
+        ('GET', 'polygons', '_list_polygons'),
+        ('GET', 'polygon', '_get_polygon'),
+        ('POST', 'polygons', '_create_polygon'),
+        ('PUT', 'polygon', '_update_polygon'),
+        ('PATCH', 'polygon_status', '_set_polygon_status'),
+    )
+
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        stores: Optional[list] = None,
+        static_dir: Optional[Path] = None
+    ):
+        self.config = ConfigManager()
+        self.logger = Logger()
+        self.host = host
+        self.port = port
+        self.static_dir = static_dir
+        self.stores = {store['code']: dict(store) for store in (stores or self.DEFAULT_STORES)}
+        self.polygons: dict[str, dict] = {}
+        self._polygon_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._routes = [(method, self._compile(name), handler) for method, name, handler in self.ROUTES]
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/"
+
+    @property
+    def api_base_url(self) -> str:
+        return f"http://{self.host}:{self.port}{self.API_PREFIX}"
+
+    @property
+    def app_url(self) -> str:
+        return f"http://{self.host}:{self.port}{self.STATIC_PREFIX}"
+
+    def start(self) -> 'TmsStubServer':
+        self._server = ThreadingHTTPServer((self.host, self.port), self._handler_class())
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        self.logger.info("TMS stub server listening on %s", self.base_url)
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self.logger.info("TMS stub server stopped")
+
+    def __enter__(self) -> 'TmsStubServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def dispatch(self, method: str, raw_path: str, body: Optional[dict]) -> tuple[int, object]:
+        parsed = urlparse(raw_path)
+        query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+
+        for route_method, pattern, handler in self._routes:
+            match = pattern.match(parsed.path)
+            if match and route_method == method:
+                params = {key: unquote(value) for key, value in match.groupdict().items()}
+                with self._lock:
+                    return getattr(self, handler)(body or {}, query, **params)
+
+        return 404, {'error': f"No stub route for {method} {parsed.path}"}
+
+    def static_file(self, raw_path: str) -> Optional[tuple[str, bytes]]:
+        path = urlparse(raw_path).path
+        if self.static_dir is None or not path.startswith(self.STATIC_PREFIX):
+            return None
+
+        relative = path[len(self.STATIC_PREFIX):] or 'index.html'
+        if relative == 'config.js':
+            # Lets the mock app call the same endpoint paths the page objects wait for
+            paths = {name: self.config.api_path(name, store_code='{store_code}', polygon_id='{polygon_id}')
+                     for _, name, _ in self.ROUTES}
+            script = f"window.TMS_API = {json.dumps({'base': self.API_PREFIX, 'paths': paths})};"
+            return 'application/javascript', script.encode('utf-8')
+
+        file_path = (self.static_dir / relative).resolve()
+        if self.static_dir.resolve() not in file_path.parents or not file_path.is_file():
+            return None
+        return mimetypes.guess_type(file_path.name)[0] or 'application/octet-stream', file_path.read_bytes()
+
+    def _compile(self, name: str) -> re.Pattern:
+        return re.compile(f"^{re.escape(self.API_PREFIX)}{self.config.api_path_pattern(name)}/?$")
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def _handle(self) -> None:
+                static = server.static_file(self.path) if self.command == 'GET' else None
+                if static is not None:
+                    self._send(200, *static)
+                    return
+
+                length = int(self.headers.get('Content-Length') or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                status, payload = server.dispatch(self.command, self.path, body)
+                self._respond(status, payload)
+
+            def _respond(self, status: int, payload: object) -> None:
+                self._send(status, 'application/json', json.dumps(payload).encode('utf-8'))
+
+            def _send(self, status: int, content_type: str, content: bytes) -> None:
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = do_PATCH = _handle
+
+            def log_message(self, format: str, *args) -> None:
+                server.logger.debug("Stub server: " + format, *args)
+
+        return Handler
+
+    def _list_stores(self, body: dict, query: dict) -> tuple[int, object]:
+        return 200, {'data': list(self.stores.values())}
+
+    def _get_store(self, body: dict, query: dict, store_code: str) -> tuple[int, object]:
+        if store_code not in self.stores:
+            return 404, {'error': f"Unknown store: {store_code}"}
+        return 200, {'data': self.stores[store_code]}
+
+    def _set_store_status(self, body: dict, query: dict, store_code: str) -> tuple[int, object]:
+        if store_code not in self.stores:
+            return 404, {'error': f"Unknown store: {store_code}"}
+        if body.get('status') not in ('Active', 'Inactive'):
+            return 400, {'error': f"Invalid status: {body.get('status')}"}
+        self.stores[store_code]['status'] = body['status']
+        return 200, {'data': self.stores[store_code]}
+
+    def _list_polygons(self, body: dict, query: dict, store_code: str) -> tuple[int, object]:
+        search = query.get('search', '').lower()
+        polygons = [
+            polygon for polygon in self.polygons.values()
+            if polygon['store_code'] == store_code and search in polygon['name'].lower()
+        ]
+        return 200, {'data': polygons}
+
+    def _get_polygon(self, body: dict, query: dict, polygon_id: str) -> tuple[int, object]:
+        if polygon_id not in self.polygons:
+            return 404, {'error': f"Unknown polygon: {polygon_id}"}
+        return 200, {'data': self.polygons[polygon_id]}
+
+    def _create_polygon(self, body: dict, query: dict, store_code: str) -> tuple[int, object]:
+        if store_code not in self.stores:
+            return 404, {'error': f"Unknown store: {store_code}"}
+        if not body.get('name'):
+            return 400, {'error': "Polygon name is required"}
+        if any(p['store_code'] == store_code and p['name'] == body['name'] for p in self.polygons.values()):
+            return 409, {'error': f"Polygon already exists: {body['name']}"}
+
+        polygon_id = str(next(self._polygon_ids))
+        polygon = {**body, 'id': polygon_id, 'store_code': store_code, 'status': 'Active'}
+        self.polygons[polygon_id] = polygon
+        return 201, {'data': polygon}
+
+    def _update_polygon(self, body: dict, query: dict, polygon_id: str) -> tuple[int, object]:
+        if polygon_id not in self.polygons:
+            return 404, {'error': f"Unknown polygon: {polygon_id}"}
+        self.polygons[polygon_id].update({key: value for key, value in body.items() if key not in ('id', 'store_code')})
+        return 200, {'data': self.polygons[polygon_id]}
+
+    def _set_polygon_status(self, body: dict, query: dict, polygon_id: str) -> tuple[int, object]:
+        if polygon_id not in self.polygons:
+            return 404, {'error': f"Unknown polygon: {polygon_id}"}
+        if body.get('status') not in ('Active', 'Inactive'):
+            return 400, {'error': f"Invalid status: {body.get('status')}"}
+        self.polygons[polygon_id]['status'] = body['status']
+        return 200, {'data': self.polygons[polygon_id]}
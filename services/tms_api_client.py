@@ -0,0 +1,146 @@
+from typing import Optional
+from urllib.parse import quote
+from playwright.sync_api import APIRequestContext, APIResponse
+from utils.config_manager import ConfigManager
+from utils.logger import Logger
+import allure
+
+
+class TmsApiClient:
+
+    VALID_STATUSES = ('Active', 'Inactive')
+
+    def __init__(self, request: APIRequestContext, base_url: Optional[str] = None):
+        self.request = request
+        self.config = ConfigManager()
+        self.logger = Logger()
+        self.base_url = (base_url or self.config.api_base_url).rstrip('/') + '/'
+
+    def url(self, name: str, **params) -> str:
+        quoted = {key: quote(str(value), safe='') for key, value in params.items()}
+        return self.base_url + self.config.api_path(name, **quoted)
+
+    @allure.step("API: list stores")
+    def list_stores(self, status: Optional[str] = None) -> list:
+        stores = self._send('GET', self.url('stores'))
+        if status:
+            stores = [store for store in stores if store.get('status') == status]
+        return stores
+
+    @allure.step("API: get store {store_code}")
+    def get_store(self, store_code: str) -> dict:
+        return self._send('GET', self.url('store', store_code=store_code))
+
+    @allure.step("API: set store {store_code} status to {status}")
+    def set_store_status(self, store_code: str, status: str) -> dict:
+        self._validate_status(status)
+        return self._send('PATCH', self.url('store_status', store_code=store_code), data={'status': status})
+
+    @allure.step("API: list polygons for store {store_code}")
+    def list_polygons(self, store_code: str, search: Optional[str] = None) -> list:
+        params = {'search': search} if search else None
+        return self._send('GET', self.url('polygons', store_code=store_code), params=params)
+
+    @allure.step("API: find polygon {name}")
+    def find_polygon(self, store_code: str, name: str) -> Optional[dict]:
+        return next((polygon for polygon in self.list_polygons(store_code, search=name) if polygon.get('name') == name), None)
+
+    @allure.step("API: create polygon for store {store_code}")
+    def create_polygon(self, store_code: str, payload: dict) -> dict:
+        return self._send('POST', self.url('polygons', store_code=store_code), data=payload)
+
+    @allure.step("API: update polygon {polygon_id}")
+    def update_polygon(self, polygon_id: str, payload: dict) -> dict:
+        return self._send('PUT', self.url('polygon', polygon_id=polygon_id), data=payload)
+
+    @allure.step("API: set polygon {polygon_id} status to {status}")
+    def set_polygon_status(self, polygon_id: str, status: str) -> dict:
+        self._validate_status(status)
+        return self._send('PATCH', self.url('polygon_status', polygon_id=polygon_id), data={'status': status})
+
+    def activate_store(self, store_code: str) -> dict:
+        return self.set_store_status(store_code, 'Active')
+
+    def deactivate_store(self, store_code: str) -> dict:
+        return self.set_store_status(store_code, 'Inactive')
+
+    def activate_polygon(self, polygon_id: str) -> dict:
+        return self.set_polygon_status(polygon_id, 'Active')
+
+    def deactivate_polygon(self, polygon_id: str) -> dict:
+        return self.set_polygon_status(polygon_id, 'Inactive')
+
+    def create_qc_polygon_travel_time(
+        self,
+        store_code: str,
+        name: str,
+        travel_time: int,
+        max_promise_time: Optional[int] = None
+    ) -> dict:
+        payload = {
+            'name': name,
+            'delivery_type': 'quick_commerce',
+            'polygon': {'type': 'travel_time', 'attributes': {'travel_time': travel_time}},
+            'meta': {'max_promise_time': max_promise_time} if max_promise_time else {}
+        }
+        return self.create_polygon(store_code, payload)
+
+    def create_slotted_polygon_travel_distance(
+        self,
+        store_code: str,
+        name: str,
+        travel_distance: int,
+        flat_delivery_fee: Optional[int] = None,
+        store_type: Optional[str] = None
+    ) -> dict:
+        meta = {}
+        if flat_delivery_fee:
+            meta['flat_delivery_fee'] = flat_delivery_fee
+        if store_type:
+            meta['store_type'] = store_type.lower()
+
+        payload = {
+            'name': name,
+            'delivery_type': 'slotted_delivery',
+            'polygon': {'type': 'travel_distance', 'attributes': {'travel_distance': travel_distance}},
+            'meta': meta
+        }
+        return self.create_polygon(store_code, payload)
+
+    def create_polygon_from_coordinates(
+        self,
+        store_code: str,
+        name: str,
+        coordinates: list,
+        delivery_type: str = 'quick_commerce'
+    ) -> dict:
+        payload = {
+            'name': name,
+            'delivery_type': delivery_type,
+            'polygon': {'type': 'manual', 'coordinates': [[lat, lng] for lat, lng in coordinates]},
+            'meta': {}
+        }
+        return self.create_polygon(store_code, payload)
+
+    def change_polygon_to_travel_distance(self, polygon_id: str, travel_distance: int) -> dict:
+        payload = {'polygon': {'type': 'travel_distance', 'attributes': {'travel_distance': travel_distance}}}
+        return self.update_polygon(polygon_id, payload)
+
+    def _validate_status(self, status: str) -> None:
+        if status not in self.VALID_STATUSES:
+            raise ValueError(f"Invalid status: {status}. Must be 'Active' or 'Inactive'")
+
+    def _send(self, method: str, url: str, data: Optional[dict] = None, params: Optional[dict] = None):
+        self.logger.info("API %s %s", method, url)
+        response = self.request.fetch(url, method=method, data=data, params=params)
+        return self._parse(method, url, response)
+
+    def _parse(self, method: str, url: str, response: APIResponse):
+        if not response.ok:
+            raise AssertionError(f"API {method} {url} failed with {response.status}: {response.text()}")
+
+        if not response.body():
+            return {}
+
+        body = response.json()
+        return body.get('data', body) if isinstance(body, dict) else body
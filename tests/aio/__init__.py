@@ -0,0 +1 @@
+# Async tests package initialization
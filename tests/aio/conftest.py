@@ -0,0 +1,100 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from playwright.async_api import Page, Browser, BrowserContext, Playwright, async_playwright
+from typing import Optional
+from utils.config_manager import ConfigManager
+from utils.logger import Logger
+from utils.browser_manager import BrowserManager
+from utils.store_fanout import login
+from pages.aio.login_page import LoginPage
+from pages.aio.home_page import HomePage
+from pages.aio.store_list_page import StoreListPage
+from pages.aio.store_details_page import StoreDetailsPage
+from pages.aio.create_polygon_page import CreatePolygonPage
+
+
+config = ConfigManager()
+logger = Logger()
+auth_state: Optional[dict] = None
+
+@pytest.fixture(scope="session")
+def event_loop():
+    # One loop for the whole session so the browser launched once can serve every async test
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+@pytest_asyncio.fixture(scope="session")
+async def async_playwright_instance() -> Playwright:
+    async with async_playwright() as playwright:
+        yield playwright
+
+@pytest_asyncio.fixture(scope="session")
+async def async_browser(async_playwright_instance: Playwright) -> Browser:
+    logger.info("Launching async browser...")
+    browser_type = getattr(async_playwright_instance, config.browser)
+    browser = await browser_type.launch(
+        headless=config.headless,
+        slow_mo=config.slow_mo
+    )
+
+    yield browser
+
+    logger.info("Closing async browser...")
+    await browser.close()
+
+@pytest_asyncio.fixture(scope="function")
+async def async_storage_state(async_browser: Browser, request) -> Optional[dict]:
+    global auth_state
+    if not config.reuse_auth_session or request.node.get_closest_marker('fresh_session'):
+        return None
+    if auth_state is None:
+        auth_state = await login(async_browser)
+    return auth_state
+
+@pytest_asyncio.fixture(scope="function")
+async def async_context_factory(async_browser: Browser, async_storage_state: Optional[dict]):
+    contexts: list[BrowserContext] = []
+
+    async def new_context(**overrides) -> BrowserContext:
+        options = {**BrowserManager.CONTEXT_OPTIONS, 'storage_state': async_storage_state, **overrides}
+        context = await async_browser.new_context(**options)
+        context.set_default_timeout(config.timeout)
+        contexts.append(context)
+        return context
+
+    yield new_context
+
+    logger.info("Closing %s async browser contexts...", len(contexts))
+    await asyncio.gather(*(context.close() for context in contexts), return_exceptions=True)
+
+@pytest_asyncio.fixture(scope="function")
+async def async_context(async_context_factory) -> BrowserContext:
+    logger.info("Creating async browser context...")
+    return await async_context_factory()
+
+@pytest_asyncio.fixture(scope="function")
+async def async_page(async_context: BrowserContext) -> Page:
+    logger.info("Creating new async page...")
+    return await async_context.new_page()
+
+@pytest.fixture(scope="function")
+def async_login_page(async_page: Page) -> LoginPage:
+    return LoginPage(async_page)
+
+@pytest.fixture(scope="function")
+def async_home_page(async_page: Page) -> HomePage:
+    return HomePage(async_page)
+
+@pytest.fixture(scope="function")
+def async_store_list_page(async_page: Page) -> StoreListPage:
+    return StoreListPage(async_page)
+
+@pytest.fixture(scope="function")
+def async_store_details_page(async_page: Page) -> StoreDetailsPage:
+    return StoreDetailsPage(async_page)
+
+@pytest.fixture(scope="function")
+def async_create_polygon_page(async_page: Page) -> CreatePolygonPage:
+    return CreatePolygonPage(async_page)
@@ -0,0 +1,81 @@
+import asyncio
+from pathlib import Path
+
+import numpy as np
+import pytest
+import allure
+from pages.aio.store_details_page import StoreDetailsPage
+from pages.aio.create_polygon_page import CreatePolygonPage
+from services.stub_server import TmsStubServer
+from utils.geometry import concave_polygons
+from utils.helpers import generate_polygon_name
+from utils.logger import Logger
+
+
+logger = Logger()
+
+MOCK_APP_DIR = Path(__file__).parent.parent.parent / 'benchmarks' / 'mock_app'
+STORE_CODE = 'STR001'
+STORE_CENTER = (19.1197, 72.8468)
+
+
+@pytest.fixture(scope="module")
+def mock_app_server() -> TmsStubServer:
+    with TmsStubServer(static_dir=MOCK_APP_DIR) as server:
+        yield server
+
+
+@allure.feature("Polygon Management")
+@allure.story("Concurrent pages on one event loop")
+@pytest.mark.asyncio
+@pytest.mark.fresh_session
+class TestConcurrentPages:
+
+    PAGE_COUNT = 4
+
+    @allure.title("Create and validate polygons from several pages at once")
+    async def test_create_polygons_concurrently(self, async_context_factory, mock_app_server: TmsStubServer):
+
+        async def create_and_validate(index: int) -> tuple[str, bool]:
+            context = await async_context_factory()
+            page = await context.new_page()
+            store_details_page = StoreDetailsPage(page)
+            create_polygon_page = CreatePolygonPage(page)
+            name = generate_polygon_name(f'async_polygon_{index}')
+
+            await store_details_page.navigate(f"{mock_app_server.app_url}?store={STORE_CODE}#/store")
+            await store_details_page.wait_for_element(StoreDetailsPage.STORE_DETAILS_HEADING)
+            await store_details_page.click_create_polygon()
+            await create_polygon_page.create_qc_polygon_travel_time(name=name, travel_time=18, max_promise_time=15)
+
+            await store_details_page.search_polygon(name)
+            return name, await store_details_page.is_polygon_visible(name)
+
+        results = await asyncio.gather(*(create_and_validate(index) for index in range(self.PAGE_COUNT)))
+        logger.info("Created polygons concurrently: %s", results)
+
+        missing = [name for name, visible in results if not visible]
+        assert not missing, f"Polygons not found in list: {missing}"
+
+        created = {polygon['name'] for polygon in mock_app_server.polygons.values()}
+        assert {name for name, _ in results} <= created, "Not every polygon reached the backend"
+
+    @allure.title("Draw a 200-vertex polygon from coordinates")
+    async def test_draw_polygon_from_coordinates(self, async_context_factory, mock_app_server: TmsStubServer):
+        context = await async_context_factory()
+        page = await context.new_page()
+        store_details_page = StoreDetailsPage(page)
+        create_polygon_page = CreatePolygonPage(page)
+        name = generate_polygon_name('async_drawn_polygon')
+        coordinates = concave_polygons(STORE_CENTER, count=1, vertices=200, radius_m=1500, seed=17)[0]
+
+        await store_details_page.navigate(f"{mock_app_server.app_url}?store={STORE_CODE}#/store")
+        await store_details_page.wait_for_element(StoreDetailsPage.STORE_DETAILS_HEADING)
+        await store_details_page.click_create_polygon()
+        await create_polygon_page.create_slotted_polygon_manual_drawing(name, coordinates=coordinates)
+
+        polygon = next(p for p in mock_app_server.polygons.values() if p['name'] == name)
+        drawn = np.array(polygon['polygon']['coordinates'])
+        assert len(drawn) == 201 and (drawn[0] == drawn[-1]).all()
+        # Click positions may be truncated to whole pixels, about 18 m at the mock map's zoom
+        np.testing.assert_allclose(drawn[:-1], coordinates, atol=2e-4)
@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+import allure
+import allure_commons
+from pages.aio.step import _allure_listener, step
+from utils.step_timing import StepTimer
+
+
+@step("Open page {name}")
+async def open_page(name: str, delay: float) -> None:
+    await asyncio.sleep(delay)
+    await fill_form(name, delay)
+
+
+@step("Fill form on {name}")
+async def fill_form(name: str, delay: float) -> None:
+    await asyncio.sleep(delay)
+
+
+def step_tree(steps) -> list:
+    return [(item.name, step_tree(item.steps)) for item in steps]
+
+
+@pytest.fixture
+def step_timer(tmp_path):
+    timer = StepTimer(tmp_path, 'chromium')
+    timer.start_test('test_steps')
+    allure_commons.plugin_manager.register(timer)
+
+    yield timer
+
+    allure_commons.plugin_manager.unregister(timer)
+
+
+@allure.feature("Async Page Objects")
+@pytest.mark.asyncio
+class TestAsyncSteps:
+
+    async def test_concurrent_coroutines_keep_their_own_step_nesting(self, step_timer: StepTimer):
+        listener = _allure_listener()
+        if listener is None:
+            pytest.skip("Allure reporting is not enabled")
+
+        # The delays interleave the two coroutines: both pages open before either form is filled
+        await asyncio.gather(open_page('A', 0.02), open_page('B', 0.01))
+
+        test = listener.allure_logger.get_test(None)
+        assert step_tree(test.steps) == [
+            ("Open page 'A'", [("Fill form on 'A'", [])]),
+            ("Open page 'B'", [("Fill form on 'B'", [])]),
+        ]
+        records = {record['step']: record for record in step_timer.finish_test()}
+        assert records["Fill form on 'A'"]['parent'] == "Open page 'A'"
+        assert records["Fill form on 'B'"]['parent'] == "Open page 'B'"
+        assert records["Open page 'A'"]['depth'] == records["Open page 'B'"]['depth'] == 1
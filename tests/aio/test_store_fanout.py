@@ -0,0 +1,54 @@
+import json
+from pathlib import Path
+
+import pytest
+import allure
+from playwright.async_api import Browser
+from services.stub_server import TmsStubServer
+from utils.store_fanout import StoreFanout, collect_store_codes, summarize
+from utils.logger import Logger
+
+
+logger = Logger()
+
+MOCK_APP_DIR = Path(__file__).parent.parent.parent / 'benchmarks' / 'mock_app'
+FANOUT_STORES = [
+    {'code': f'FAN{index:03d}', 'name': f'Fanout Store {index}', 'status': 'Active' if index % 4 else 'Inactive'}
+    for index in range(1, 9)
+]
+
+
+@pytest.fixture(scope="module")
+def fanout_server() -> TmsStubServer:
+    with TmsStubServer(stores=FANOUT_STORES, static_dir=MOCK_APP_DIR) as server:
+        yield server
+
+
+@allure.feature("Polygon Management")
+@allure.story("Polygon workflow across many stores")
+@pytest.mark.asyncio
+@pytest.mark.fresh_session
+class TestStoreFanout:
+
+    @allure.title("Run the polygon workflow for every active store concurrently")
+    async def test_polygon_workflow_fanout(self, async_browser: Browser, async_context_factory, fanout_server: TmsStubServer):
+        context = await async_context_factory()
+        store_codes = await collect_store_codes(context.request, status='Active', api_base_url=fanout_server.api_base_url)
+        assert store_codes == [store['code'] for store in FANOUT_STORES if store['status'] == 'Active']
+
+        fanout = StoreFanout(
+            async_browser,
+            concurrency=3,
+            store_url=lambda store_code: f"{fanout_server.app_url}?store={store_code}#/store"
+        )
+        results = await fanout.run(store_codes)
+
+        summary = summarize(results)
+        logger.info("Fan-out summary: %s", summary)
+        allure.attach(json.dumps(results, indent=2), name="Per-store results", attachment_type=allure.attachment_type.JSON)
+
+        assert summary['stores'] == len(store_codes)
+        assert not summary['failures'], f"Stores failed: {summary['failures']}"
+        for result in results:
+            polygons = [p for p in fanout_server.polygons.values() if p['store_code'] == result['store_code']]
+            assert [(p['name'], p['status']) for p in polygons] == [(result['polygon'], 'Inactive')]
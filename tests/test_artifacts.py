@@ -0,0 +1,94 @@
+import struct
+import zlib
+from pathlib import Path
+
+import pytest
+import allure
+from utils.artifacts import PNG_SIGNATURE, ArtifactPipeline, recompress_png
+
+
+def make_png(width: int, height: int, seed: int = 0, level: int = 1) -> bytes:
+    rows = b''.join(b'\x00' + bytes((x * 7 + y * 3 + seed) % 256 for x in range(width * 3)) for y in range(height))
+
+    def chunk(kind: bytes, body: bytes) -> bytes:
+        return struct.pack('>I', len(body)) + kind + body + struct.pack('>I', zlib.crc32(kind + body))
+
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    compressed = zlib.compress(rows, level)
+    # Split the image data over several IDAT chunks the way encoders do for large images
+    middle = len(compressed) // 2
+    return (PNG_SIGNATURE + chunk(b'IHDR', header) + chunk(b'IDAT', compressed[:middle])
+            + chunk(b'IDAT', compressed[middle:]) + chunk(b'IEND', b''))
+
+
+def image_data(png: bytes) -> bytes:
+    position, data = len(PNG_SIGNATURE), []
+    while position < len(png):
+        length, kind = struct.unpack('>I4s', png[position:position + 8])
+        body = png[position + 8:position + 8 + length]
+        assert struct.unpack('>I', png[position + 8 + length:position + 12 + length])[0] == zlib.crc32(kind + body)
+        if kind == b'IDAT':
+            data.append(body)
+        position += length + 12
+    return zlib.decompress(b''.join(data))
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    pipeline = ArtifactPipeline()
+    pipeline.wait()
+    monkeypatch.setattr(pipeline, 'directory', tmp_path)
+    monkeypatch.setattr(pipeline, 'image_format', 'png')
+    monkeypatch.setattr(pipeline, '_saved', {})
+    return pipeline
+
+
+@allure.feature("Screenshot Artifacts")
+class TestArtifacts:
+
+    def test_recompressed_png_is_smaller_with_identical_pixels(self):
+        original = make_png(200, 120)
+        recompressed = recompress_png(original, 9)
+
+        assert len(recompressed) < len(original)
+        assert image_data(recompressed) == image_data(original)
+
+    def test_non_png_data_is_left_alone(self):
+        assert recompress_png(b'\xff\xd8\xff\xe0 jpeg', 9) == b'\xff\xd8\xff\xe0 jpeg'
+
+    def test_identical_screenshots_are_saved_once(self, pipeline, tmp_path):
+        duplicates = pipeline.duplicates
+        first, second = make_png(40, 40, seed=1), make_png(40, 40, seed=2)
+
+        pipeline.publish(first, "Store details")
+        pipeline.publish(first, "Store details again")
+        pipeline.publish(second, "Create polygon")
+        paths = pipeline.wait()
+
+        assert len(paths) == 3 and paths[0] == paths[1] != paths[2]
+        assert sorted(path.name for path in tmp_path.iterdir()) == sorted({path.name for path in paths})
+        assert pipeline.duplicates == duplicates + 1
+        assert image_data(paths[0].read_bytes()) == image_data(first)
+
+    def test_failed_write_does_not_block_a_later_identical_screenshot(self, pipeline, tmp_path, monkeypatch):
+        screenshot = make_png(40, 40, seed=3)
+        write_bytes = Path.write_bytes
+
+        def disk_full(path, data):
+            monkeypatch.setattr(Path, 'write_bytes', write_bytes)
+            raise OSError("No space left on device")
+
+        monkeypatch.setattr(Path, 'write_bytes', disk_full)
+        pipeline.publish(screenshot, "Store details")
+        assert pipeline.wait() == [] and pipeline._saved == {}
+
+        pipeline.publish(screenshot, "Store details")
+        [path] = pipeline.wait()
+        assert path.exists() and image_data(path.read_bytes()) == image_data(screenshot)
+
+    def test_jpeg_options_carry_quality_and_skip_full_page_for_elements(self, pipeline, monkeypatch):
+        monkeypatch.setattr(pipeline, 'image_format', 'jpeg')
+        assert pipeline.screenshot_options(full_page=True) == {
+            'type': 'jpeg', 'scale': pipeline.scale, 'quality': pipeline.quality, 'full_page': True
+        }
+        assert 'full_page' not in pipeline.screenshot_options(full_page=True, element=True)
@@ -0,0 +1,46 @@
+import os
+
+import pytest
+import allure
+from utils.config_manager import ConfigManager, parse_setting
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    config = ConfigManager()
+    profile = config.profile
+    for name in [name for name in os.environ if name.startswith('TMS_')]:
+        monkeypatch.delenv(name)
+    yield config
+    monkeypatch.undo()
+    config.load(profile=profile)
+
+
+@allure.feature("Configuration")
+class TestConfigProfiles:
+
+    def test_fast_profile_overrides_file_values(self, settings):
+        settings.load(profile='fast')
+        assert settings.profile == 'fast'
+        assert settings.slow_mo == 0 and settings.headless is True
+        assert settings.timeout == 10000 and settings.screenshot_format == 'jpeg'
+        # Keys the profile leaves alone keep their config.ini value
+        assert settings.base_url == 'https://uat.scmz5.de/tms/'
+
+    def test_environment_overrides_profile_and_cli_overrides_environment(self, settings, monkeypatch):
+        monkeypatch.setenv('TMS_APP__TIMEOUT', '15000')
+        monkeypatch.setenv('TMS_APP__SLOW_MO', '5')
+        settings.load(profile='fast', overrides=['APP.slow_mo=7'])
+
+        assert settings.timeout == 15000
+        assert settings.slow_mo == 7
+        assert settings.headless is True
+
+    def test_unknown_profile_lists_the_available_ones(self, settings):
+        with pytest.raises(ValueError, match="fast, debug, ci"):
+            settings.load(profile='turbo')
+
+    def test_settings_must_name_section_and_key(self):
+        assert parse_setting('waits.response_timeout = 2000') == ('WAITS', 'response_timeout', '2000')
+        with pytest.raises(ValueError):
+            parse_setting('timeout=2000')
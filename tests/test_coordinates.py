@@ -0,0 +1,100 @@
+from itertools import combinations
+from pathlib import Path
+
+import numpy as np
+import pytest
+import allure
+from utils.coordinates import (
+    CoordinateError, find_self_intersections, iter_coordinate_chunks, load_coordinates,
+    validate_coordinates, validate_coordinates_file, write_normalized_csv
+)
+
+
+TEST_DATA = Path(__file__).parent.parent / 'testData' / 'lat_long_coordinates.csv'
+
+
+def ring(count: int, wobble: float = 0.3) -> np.ndarray:
+    angles = np.linspace(0, 2 * np.pi, count, endpoint=False)
+    radius = 0.05 * (1 + wobble * np.sin(7 * angles))
+    return np.column_stack((19.1 + radius * np.sin(angles), 72.85 + radius * np.cos(angles)))
+
+
+def crosses(a, b, c, d) -> bool:
+    def orientation(p, q, r):
+        return (q[0] - p[0]) * (r[1] - p[1]) - (q[1] - p[1]) * (r[0] - p[0])
+    return orientation(a, b, c) * orientation(a, b, d) < 0 and orientation(c, d, a) * orientation(c, d, b) < 0
+
+
+@allure.feature("Coordinate CSV Validation")
+class TestCoordinates:
+
+    def test_test_data_is_a_valid_polygon(self):
+        report = validate_coordinates_file(TEST_DATA)
+        assert report.is_valid, report.summary()
+        assert report.count == 6 and not report.closed
+
+    def test_chunks_follow_header_columns(self, tmp_path):
+        csv_path = tmp_path / 'coordinates.csv'
+        csv_path.write_text('id,lng,lat\n' + ''.join(f'{i},72.{i:04d},19.{i:04d}\n' for i in range(10)))
+
+        chunks = list(iter_coordinate_chunks(csv_path, chunk_rows=4))
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+        assert np.concatenate(chunks)[3].tolist() == [19.0003, 72.0003]
+
+    def test_headerless_file_is_read_as_latitude_longitude(self, tmp_path):
+        csv_path = tmp_path / 'coordinates.csv'
+        csv_path.write_text('19.1,72.8\n19.2,72.9\n')
+        assert load_coordinates(csv_path).tolist() == [[19.1, 72.8], [19.2, 72.9]]
+
+    def test_parse_error_reports_rows(self, tmp_path):
+        csv_path = tmp_path / 'coordinates.csv'
+        csv_path.write_text('latitude,longitude\n19.1,72.8\n19.2,abc\n')
+        with pytest.raises(CoordinateError, match="rows 2-3"):
+            load_coordinates(csv_path)
+
+    def test_reports_out_of_range_duplicates_and_too_few_vertices(self):
+        assert "outside latitude" in validate_coordinates([[19.1, 72.8], [91.0, 72.9], [19.2, 72.9]]).summary()
+        assert "at least 3 distinct" in validate_coordinates([[19.1, 72.8], [19.1, 72.8], [19.2, 72.9]]).summary()
+
+        points = ring(40)
+        points[30] = points[10]
+        report = validate_coordinates(points)
+        assert report.duplicates.tolist() == [points[10].tolist()]
+
+    def test_closing_and_consecutive_vertices_are_not_duplicates(self):
+        points = ring(40)
+        points = np.vstack((points[:5], points[4:], points[:1]))
+        report = validate_coordinates(points)
+        assert report.is_valid, report.summary()
+        assert report.closed and report.consecutive_duplicates == 1
+        assert len(report.ring) == 40
+
+    @pytest.mark.parametrize('seed', range(3))
+    def test_self_intersections_match_brute_force(self, seed):
+        points = np.random.default_rng(seed).random((120, 2))
+        count = len(points)
+        expected = {
+            (i, j) for i, j in combinations(range(count), 2)
+            if j - i > 1 and not (i == 0 and j == count - 1)
+            and crosses(points[i], points[(i + 1) % count], points[j], points[(j + 1) % count])
+        }
+        assert set(map(tuple, find_self_intersections(points).tolist())) == expected
+
+    def test_large_ring_with_one_crossing(self, tmp_path):
+        points = ring(100_000)
+        points[[100, 50_000]] = points[[50_000, 100]]
+        csv_path = write_normalized_csv(points, tmp_path / 'large.csv')
+
+        report = validate_coordinates_file(csv_path)
+        assert report.count == 100_000
+        assert not report.is_valid
+        assert {100, 50_000} & set(report.self_intersections.ravel().tolist())
+
+    def test_normalized_csv_round_trips(self, tmp_path):
+        points = ring(12)
+        csv_path = write_normalized_csv(points, tmp_path / 'normalized.csv', close_ring=True)
+        assert csv_path.read_text().splitlines()[0] == 'latitude,longitude'
+
+        report = validate_coordinates_file(csv_path)
+        assert report.is_valid and report.closed
+        np.testing.assert_allclose(report.ring, points, atol=1e-7)
@@ -0,0 +1,118 @@
+import zipfile
+from xml.sax.saxutils import escape
+
+import pytest
+import allure
+from pages.store_details_page import StoreDetailsPage
+from utils.export_validator import ExportError, ExportReport, detect_format, iter_export_rows, validate_export
+
+HEADER = ['Polygon Name', 'Status', 'Delivery Type', 'Details']
+ROWS = [
+    ['QC "North"', 'Active', 'quick_commerce', 'Travel time: 18 mins'],
+    ['Slotted, East', 'Inactive', 'slotted_delivery', 'Travel distance: 200 m'],
+]
+
+
+def write_csv(path, rows):
+    lines = [','.join('"' + cell.replace('"', '""') + '"' for cell in row) for row in rows]
+    path.write_text('\n'.join(lines), encoding='utf-8')
+    return path
+
+
+def write_xlsx(path, rows):
+    # Header cells use shared strings and data cells inline strings, with the empty Details cell left out
+    shared = rows[0]
+    sheet_rows = []
+    for number, row in enumerate(rows, start=1):
+        cells = []
+        for column, value in enumerate(row):
+            reference = f"{'ABCD'[column]}{number}"
+            if number == 1:
+                cells.append(f'<c r="{reference}" t="s"><v>{shared.index(value)}</v></c>')
+            elif value:
+                cells.append(f'<c r="{reference}" t="inlineStr"><is><t>{escape(value)}</t></is></c>')
+        sheet_rows.append(f'<row r="{number}">{"".join(cells)}</row>')
+
+    main = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+    relationships = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('xl/workbook.xml', f'<workbook xmlns="{main}" xmlns:r="{relationships}">'
+                         '<sheets><sheet name="Export" sheetId="1" r:id="rId1"/></sheets></workbook>')
+        archive.writestr('xl/_rels/workbook.xml.rels',
+                         '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                         '<Relationship Id="rId1" Target="worksheets/sheet1.xml"/></Relationships>')
+        archive.writestr('xl/sharedStrings.xml', f'<sst xmlns="{main}">'
+                         + ''.join(f'<si><t>{escape(value)}</t></si>' for value in shared) + '</sst>')
+        archive.writestr('xl/worksheets/sheet1.xml',
+                         f'<worksheet xmlns="{main}"><sheetData>{"".join(sheet_rows)}</sheetData></worksheet>')
+    return path
+
+
+@pytest.fixture
+def history(tmp_path, monkeypatch):
+    from utils.config_manager import ConfigManager
+    monkeypatch.setattr(ConfigManager, 'export_history_dir', tmp_path / 'history')
+    return tmp_path / 'history'
+
+
+@allure.feature("Export Validation")
+class TestExportValidator:
+
+    def test_csv_and_xlsx_exports_parse_to_the_same_rows(self, tmp_path):
+        rows = [HEADER] + ROWS + [['Manual', 'Active', 'quick_commerce', '']]
+        csv_path = write_csv(tmp_path / 'store.csv', rows)
+        xlsx_path = write_xlsx(tmp_path / 'store.xlsx', rows)
+
+        assert detect_format(csv_path) == 'csv' and detect_format(xlsx_path) == 'xlsx'
+        assert list(iter_export_rows(xlsx_path)) == list(iter_export_rows(csv_path)) == rows
+        assert ExportReport(xlsx_path).checksum == ExportReport(csv_path).checksum
+
+    def test_reports_missing_columns_and_polygons(self, tmp_path):
+        path = write_csv(tmp_path / 'store.csv', [['Name', 'Status']] + [row[:2] for row in ROWS])
+        report = ExportReport(path, expected_polygons=['QC "North"'], required_columns=['Polygon Name', 'Status'],
+                              name_column='Polygon Name')
+        assert report.missing_columns == ['Polygon Name']
+        assert report.missing_polygons == ['QC "North"']
+        assert not report.is_valid
+
+        report = ExportReport(write_csv(tmp_path / 'ok.csv', [HEADER] + ROWS), expected_polygons=['Slotted, East'],
+                              required_columns=['polygon name', 'STATUS'], name_column='Polygon Name')
+        assert report.is_valid and report.rows == 2, report.summary()
+
+    def test_zip_that_is_not_a_workbook_is_rejected(self, tmp_path):
+        with zipfile.ZipFile(tmp_path / 'export.zip', 'w') as archive:
+            archive.writestr('data.csv', 'a,b')
+        with pytest.raises(ExportError):
+            detect_format(tmp_path / 'export.zip')
+
+    def test_diff_against_previous_export_of_the_same_store(self, tmp_path, history):
+        first = validate_export(write_csv(tmp_path / 'first.csv', [HEADER] + ROWS), history_key='S001_serviceability')
+        assert first.diff is None
+
+        updated = [[ROWS[0][0], 'Inactive'] + ROWS[0][2:], ['Manual', 'Active', 'quick_commerce', '']]
+        second = validate_export(write_xlsx(tmp_path / 'second.xlsx', [HEADER] + updated),
+                                 expected_polygons=['Manual'], history_key='S001_serviceability')
+        assert second.is_valid
+        assert second.diff == {'added': ['Manual'], 'removed': ['Slotted, East'], 'changed': ['QC "North"']}
+        assert '1 added, 1 removed, 1 changed since last export' in second.summary()
+
+    def test_unresolved_name_column_keeps_no_history(self, tmp_path, history):
+        rows = [['Name', 'Status']] + [row[:2] for row in ROWS]
+        validate_export(write_csv(tmp_path / 'first.csv', rows), history_key='S001_serviceability')
+        report = validate_export(write_csv(tmp_path / 'second.csv', rows), expected_polygons=['QC "North"'],
+                                 history_key='S001_serviceability')
+
+        assert not report.has_names and report.diff is None
+        assert "Name column 'Polygon Name' not in header" in report.summary()
+        assert not history.exists()
+
+    def test_missing_polygon_fails_even_when_not_strict(self, tmp_path, history, monkeypatch):
+        from utils.config_manager import ConfigManager
+        monkeypatch.setattr(ConfigManager, 'export_strict', False)
+        page = StoreDetailsPage(page=None)
+
+        # An unconfirmed schema only warns
+        page.validate_export(write_csv(tmp_path / 'schema.csv', [['Name', 'Status']] + [row[:2] for row in ROWS]),
+                             expected_polygons=['QC "North"'])
+        with pytest.raises(AssertionError, match='1 polygons missing'):
+            page.validate_export(write_csv(tmp_path / 'missing.csv', [HEADER] + ROWS), expected_polygons=['Manual'])
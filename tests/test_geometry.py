@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+import allure
+from utils.coordinates import validate_coordinates
+from pages.create_polygon_page import CreatePolygonPage
+from utils.geometry import (
+    centered_viewport, circle_polygon, concave_polygons, convex_polygons, from_local_metres, map_projection, mercator_pixels, polygon_area,
+    polygon_centroid, screen_offsets, simplify, to_local_metres
+)
+
+
+STORE = (19.1197, 72.8468)
+
+
+def is_convex(ring: np.ndarray) -> bool:
+    xy = to_local_metres(ring, STORE)
+    edges = np.roll(xy, -1, axis=0) - xy
+    turns = edges[:, 0] * np.roll(edges, -1, axis=0)[:, 1] - edges[:, 1] * np.roll(edges, -1, axis=0)[:, 0]
+    return bool((turns > 0).all() or (turns < 0).all())
+
+
+@allure.feature("Polygon Geometry")
+class TestGeometry:
+
+    def test_local_metres_round_trip(self):
+        offsets = np.array([[0.0, 0.0], [1500.0, -250.0], [-30.0, 4000.0]])
+        np.testing.assert_allclose(to_local_metres(from_local_metres(offsets, STORE), STORE), offsets, atol=1e-6)
+
+    def test_circle_area_and_centroid(self):
+        circle = circle_polygon(STORE, radius_m=1000, vertices=256)
+        assert polygon_area(circle) == pytest.approx(np.pi * 1000 ** 2, rel=1e-3)
+        assert polygon_centroid(circle) == pytest.approx(STORE, abs=1e-7)
+        distances = np.linalg.norm(to_local_metres(circle, STORE), axis=1)
+        np.testing.assert_allclose(distances, 1000, rtol=1e-6)
+
+    def test_square_area_and_centroid(self):
+        square = from_local_metres(np.array([[0, 0], [200, 0], [200, 100], [0, 100], [0, 0]]), STORE)
+        assert polygon_area(square) == pytest.approx(20000, rel=1e-6)
+        np.testing.assert_allclose(polygon_centroid(square), from_local_metres([100, 50], STORE), atol=1e-9)
+
+    def test_generated_polygons_are_valid_and_distinct(self):
+        convex = convex_polygons(STORE, count=200, vertices=10, radius_m=3000, seed=1)
+        concave = concave_polygons(STORE, count=200, vertices=30, radius_m=3000, seed=2)
+        assert convex.shape == (200, 10, 2) and concave.shape == (200, 30, 2)
+
+        for polygon in convex:
+            assert is_convex(polygon)
+        for polygon in concave:
+            report = validate_coordinates(polygon)
+            assert report.is_valid, report.summary()
+        assert not all(is_convex(polygon) for polygon in concave)
+        assert len(np.unique(concave.reshape(200, -1), axis=0)) == 200
+
+    def test_seed_makes_generation_reproducible(self):
+        np.testing.assert_array_equal(concave_polygons(STORE, 3, seed=7), concave_polygons(STORE, 3, seed=7))
+
+    def test_simplify_keeps_shape_within_tolerance(self):
+        dense = circle_polygon(STORE, radius_m=1000, vertices=5000)
+        simplified = simplify(np.vstack((dense, dense[:1])), tolerance_m=2.0)
+
+        assert (simplified[0] == simplified[-1]).all()
+        assert 20 < len(simplified) < 200
+        assert validate_coordinates(simplified).is_valid
+        assert polygon_area(simplified) == pytest.approx(polygon_area(dense), rel=5e-3)
+
+    def test_simplify_drops_collinear_vertices(self):
+        line = from_local_metres(np.array([[0, 0], [50, 0], [100, 0], [100, 100], [0, 100]]), STORE)
+        assert len(simplify(line, tolerance_m=0.1)) == 4
+
+    def test_screen_offsets_fit_radius_with_north_up(self):
+        offsets = screen_offsets(circle_polygon(STORE, radius_m=500, vertices=8), radius_px=60)
+        assert np.linalg.norm(offsets, axis=1).max() == pytest.approx(60)
+        # The vertex at 90 degrees lies due north, which is up on screen
+        assert offsets[2] == pytest.approx([0, -60], abs=1e-6)
+
+    def test_mercator_projection_round_trips_inside_viewport(self):
+        projection = map_projection(19.14, 72.82, 13, 640, 320)
+        assert map_projection(19.14, 72.82, 13, 640, 320) is projection
+
+        coordinates = concave_polygons(STORE, count=1, vertices=200, radius_m=1500, seed=3)[0]
+        pixels = projection.project(coordinates)
+        assert ((pixels >= 0) & (pixels <= (640, 320))).all()
+        np.testing.assert_allclose(projection.unproject(pixels), coordinates, atol=1e-9)
+        # One zoom level doubles distances on screen
+        np.testing.assert_allclose(np.ptp(mercator_pixels(coordinates, 14), axis=0), 2 * np.ptp(pixels, axis=0))
+
+    def test_mercator_projection_rejects_points_outside_viewport(self):
+        projection = map_projection(19.14, 72.82, 13, 640, 320)
+        with pytest.raises(ValueError, match="1 vertices fall outside"):
+            projection.project(np.array([STORE, (19.3, 72.84)]))
+
+    def test_centered_viewport_projects_center_to_the_middle(self):
+        viewport = centered_viewport(STORE, 15, 640, 320)
+        projection = map_projection(viewport['north'], viewport['west'], 15, 640, 320)
+        assert np.allclose(projection.project(np.array([STORE])), [[320, 160]])
+
+    def test_map_view_is_read_from_the_frame_url(self):
+        expected = centered_viewport(STORE, 15.0, 640, 320)
+        for url in (
+            f"https://www.google.com/maps/embed/v1/view?key=k&center={STORE[0]},{STORE[1]}&zoom=15",
+            f"https://maps.google.com/maps?ll={STORE[0]},{STORE[1]}&z=15&output=embed",
+            f"https://www.google.com/maps/@{STORE[0]},{STORE[1]},15z",
+        ):
+            assert CreatePolygonPage.viewport_from_url(url, 640, 320) == expected
+        assert CreatePolygonPage.viewport_from_url('about:srcdoc', 640, 320) is None
+        assert CreatePolygonPage.viewport_from_url('https://maps.test/embed?center=here&zoom=15', 640, 320) is None
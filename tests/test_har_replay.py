@@ -0,0 +1,106 @@
+import base64
+import json
+from types import SimpleNamespace
+
+import pytest
+import allure
+from utils.har_replay import HarReplayer, har_path_for, normalize_url
+
+POLYGON_ID = 'qc_20261017_101500_123_gw0_4821'
+REPLAYED_ID = 'qc_20261018_093000_456_gw1_9313'
+
+
+def har_entry(method: str, url: str, status: int, text: str, encoding: str = None) -> dict:
+    content = {'mimeType': 'application/json', 'text': text}
+    if encoding:
+        content['encoding'] = encoding
+    return {
+        'request': {'method': method, 'url': url},
+        'response': {
+            'status': status,
+            'headers': [
+                {'name': 'Content-Type', 'value': 'application/json'},
+                {'name': 'Content-Length', 'value': str(len(text))},
+                {'name': 'Content-Encoding', 'value': 'gzip'},
+            ],
+            'content': content,
+        },
+    }
+
+
+class RecordingRoute:
+    # Stands in for a Playwright route: records how the replayer answered
+
+    def __init__(self, method: str, url: str):
+        self.request = SimpleNamespace(method=method, url=url)
+        self.outcome = None
+
+    def fulfill(self, status: int, headers: dict, body: bytes) -> None:
+        self.outcome = ('fulfill', status, headers, body)
+
+    def fallback(self) -> None:
+        self.outcome = ('fallback',)
+
+    def abort(self) -> None:
+        self.outcome = ('abort',)
+
+
+@pytest.fixture
+def replayer(tmp_path):
+    entries = [
+        har_entry('GET', f'https://tms.test/api/polygons?name={POLYGON_ID}&page=1&_=1760695200', 200, '[]'),
+        har_entry('GET', f'https://tms.test/api/polygons?name={POLYGON_ID}&page=1&_=1760695260', 200, '[{"id": 7}]'),
+        har_entry('POST', 'https://tms.test/api/polygons', 201, base64.b64encode(b'{"id": 7}').decode(), 'base64'),
+    ]
+    har_path = tmp_path / 'polygon.har'
+    har_path.write_text(json.dumps({'log': {'entries': entries}}), encoding='utf-8')
+    return HarReplayer(har_path)
+
+
+def replay(replayer: HarReplayer, method: str, url: str) -> tuple:
+    route = RecordingRoute(method, url)
+    replayer._handle(route)
+    return route.outcome
+
+
+@allure.feature("HAR Replay")
+class TestNormalizeUrl:
+
+    def test_query_order_and_volatile_params_are_ignored(self):
+        volatile = frozenset({'_', 'ts'})
+        assert normalize_url('https://tms.test/api/stores?b=2&a=1&_=17&ts=5', volatile) == \
+            normalize_url('https://tms.test/api/stores?a=1&b=2', volatile) == 'https://tms.test/api/stores?a=1&b=2'
+
+    def test_unique_ids_match_across_runs(self):
+        assert normalize_url(f'https://tms.test/api/polygons/{POLYGON_ID}?name={POLYGON_ID}') == \
+            normalize_url(f'https://tms.test/api/polygons/{REPLAYED_ID}?name={REPLAYED_ID}') == \
+            'https://tms.test/api/polygons/qc_{id}?name=qc_%7Bid%7D'
+
+    def test_blank_values_and_fragments(self):
+        assert normalize_url('https://tms.test/stores?search=&page=1#list') == 'https://tms.test/stores?page=1&search='
+
+    def test_har_path_is_safe_for_node_ids(self, tmp_path):
+        path = har_path_for(tmp_path, 'tests/test_polygon_management.py::TestPolygon::test_create[chromium]')
+        assert path == tmp_path / 'tests_test_polygon_management.py_TestPolygon_test_create_chromium.har'
+
+
+@allure.feature("HAR Replay")
+class TestHarReplayer:
+
+    def test_repeated_requests_are_served_in_recorded_order(self, replayer):
+        url = f'https://tms.test/api/polygons?page=1&name={REPLAYED_ID}&_=1760781000'
+        bodies = [replay(replayer, 'GET', url)[3] for _ in range(3)]
+        # The last recorded response keeps answering polls
+        assert bodies == [b'[]', b'[{"id": 7}]', b'[{"id": 7}]']
+        assert replayer.served == 3 and replayer.missed == 0
+
+    def test_transfer_headers_are_dropped_and_base64_decoded(self, replayer):
+        outcome, status, headers, body = replay(replayer, 'POST', 'https://tms.test/api/polygons')
+        assert (outcome, status, body) == ('fulfill', 201, b'{"id": 7}')
+        assert headers == {'Content-Type': 'application/json'}
+
+    def test_unrecorded_request_is_a_miss(self, replayer):
+        assert replay(replayer, 'DELETE', 'https://tms.test/api/polygons') == ('abort',)
+        replayer.not_found = 'fallback'
+        assert replay(replayer, 'GET', 'https://tms.test/api/polygons?name=other') == ('fallback',)
+        assert replayer.served == 0 and replayer.missed == 2
@@ -0,0 +1,71 @@
+import pytest
+import allure
+from pages.base_page import BasePage
+from pages.locators import Selector, css_string, inventory, lint, xpath_string
+from pages.store_details_page import StoreDetailsPage
+
+
+class CountingPage:
+    # Stands in for a Playwright Page; records which selectors were turned into locators
+
+    def __init__(self):
+        self.selectors = []
+
+    def locator(self, selector: str):
+        self.selectors.append(selector)
+        return object()
+
+
+@allure.feature("Locators")
+class TestLocators:
+
+    def test_css_literals_escape_quotes_and_backslashes(self):
+        selector = StoreDetailsPage.POLYGON_HEADING.format(polygon_name='Andheri "East" \\ 2')
+        assert selector == 'h4:has-text("Andheri \\"East\\" \\\\ 2")'
+        assert css_string("O'Brien") == '"O\'Brien"'
+
+    def test_xpath_literals_pick_quotes_or_concat(self):
+        assert xpath_string("Active") == "'Active'"
+        assert xpath_string("O'Brien") == '"O\'Brien"'
+        assert xpath_string('it\'s "x"') == 'concat(\'it\', "\'", \'s "x"\')'
+        selector = StoreDetailsPage.STORE_STATUS_BADGE.format(status="O'Brien")
+        assert selector.endswith('[normalize-space()="O\'Brien"])[1]')
+
+    def test_arguments_are_checked_against_declared_types(self):
+        indexed = Selector("(//li[@role='option'])[{index}]", index=int)
+        assert indexed.format(index=2) == "(//li[@role='option'])[2]"
+        with pytest.raises(TypeError):
+            indexed.format(index='2')
+        with pytest.raises(TypeError):
+            StoreDetailsPage.POLYGON_STATUS_BADGE.format(polygon_name='Zone A')
+        with pytest.raises(ValueError):
+            Selector("h4:has-text({name})", index=int)
+
+    def test_locators_are_cached_per_selector_and_arguments(self):
+        page = BasePage(CountingPage())
+        first = page.locator(StoreDetailsPage.POLYGON_HEADING, polygon_name='Zone A')
+        assert page.locator(StoreDetailsPage.POLYGON_HEADING, polygon_name='Zone A') is first
+        assert page.locator(StoreDetailsPage.POLYGON_HEADING, polygon_name='Zone B') is not first
+        assert page.locator("text=Edit") is page.locator("text=Edit")
+        assert page.page.selectors == ['h4:has-text("Zone A")', 'h4:has-text("Zone B")', 'text=Edit']
+
+    def test_page_selectors_pass_lint(self):
+        rows = inventory()
+        assert {'page': 'StoreListPage', 'name': 'STORE_BUTTON', 'selector': "button:has-text({store_name})",
+                'params': {'store_name': 'str'}} in rows
+        assert lint(rows) == []
+
+    def test_lint_flags_templates_quotes_and_brackets(self):
+        rows = [
+            {'page': 'P', 'name': 'TEMPLATE', 'selector': "button:has-text('{name}')", 'params': {}},
+            {'page': 'P', 'name': 'QUOTED', 'selector': "h4:has-text('{name}')", 'params': {'name': 'str'}},
+            {'page': 'P', 'name': 'BROKEN', 'selector': "(//span[@id='a']", 'params': {}},
+            {'page': 'P', 'name': 'AGAIN', 'selector': "(//span[@id='a']", 'params': {}},
+        ]
+        assert lint(rows) == [
+            "P.TEMPLATE: string template with placeholders; declare it as a Selector",
+            "P.QUOTED: placeholder {name} is quoted; Selector adds the quotes",
+            "P.BROKEN: unbalanced brackets",
+            "P.AGAIN: unbalanced brackets",
+            "P.AGAIN: same selector as P.BROKEN",
+        ]
@@ -0,0 +1,85 @@
+import json
+import logging
+
+import pytest
+import allure
+from utils.config_manager import ConfigManager
+from utils.helpers import merge_worker_logs
+from utils.logger import JsonFormatter, Logger
+
+
+class RecordingHandler(logging.Handler):
+
+    def __init__(self, context):
+        super().__init__()
+        self.addFilter(context)
+        self.setFormatter(JsonFormatter())
+        self.entries = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.entries.append(json.loads(self.format(record)))
+
+
+@pytest.fixture
+def recorded():
+    logger = Logger()
+    handler = RecordingHandler(logger.context)
+    logger.get_logger().addHandler(handler)
+    yield handler.entries
+    logger.get_logger().removeHandler(handler)
+
+
+@allure.feature("Logging")
+class TestLogging:
+
+    def test_json_records_carry_test_and_step(self, request, recorded):
+        # conftest registers the log context with allure, so steps are tracked here as in any test
+        logger = Logger()
+        recorded.clear()
+        with allure.step("Outer step"):
+            with allure.step("Inner step"):
+                logger.info("Clicking element: %s", "#submit")
+            logger.warning("Back in %s", "outer")
+        logger.debug("Outside steps")
+
+        assert [(entry['message'], entry['step']) for entry in recorded] == [
+            ("Clicking element: #submit", "Inner step"),
+            ("Back in outer", "Outer step"),
+            ("Outside steps", None),
+        ]
+        assert {entry['test_id'] for entry in recorded} == {request.node.nodeid}
+        assert recorded[0]['worker'] == 'master' and recorded[0]['level'] == 'INFO'
+
+    def test_flush_writes_queued_records(self):
+        logger = Logger()
+        logger.info("Flushed marker %s", id(self))
+        logger.flush()
+        assert f"Flushed marker {id(self)}" in logger.log_file.read_text(encoding='utf-8')
+
+    def test_profile_format_reopens_log_file(self):
+        logger = Logger()
+        config = ConfigManager()
+        profile = config.profile
+        try:
+            config.load(profile='ci')
+            logger.apply_levels()
+            logger.info("Profile marker %s", id(self))
+            logger.flush()
+            assert logger.log_file.suffix == '.jsonl'
+            lines = logger.log_file.read_text(encoding='utf-8').splitlines()
+            assert json.loads(lines[-1])['message'] == f"Profile marker {id(self)}"
+        finally:
+            config.load(profile=profile)
+            logger.apply_levels()
+
+    def test_merge_interleaves_json_worker_logs(self, tmp_path):
+        for worker, seconds in (('gw0', (1, 3)), ('gw1', (2, 4))):
+            (tmp_path / worker).mkdir()
+            lines = [json.dumps({'timestamp': f"2026-01-01 10:00:0{second}.000", 'message': f"{worker}-{second}"})
+                     for second in seconds]
+            (tmp_path / worker / 'test_20260101_100000.jsonl').write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+        merged = merge_worker_logs(tmp_path, since=0)
+        assert merged.suffix == '.jsonl'
+        messages = [json.loads(line)['message'] for line in merged.read_text(encoding='utf-8').splitlines()]
+        assert messages == ['gw0-1', 'gw1-2', 'gw0-3', 'gw1-4']
@@ -1,7 +1,9 @@
 from pathlib import Path
+from typing import Optional
 
 import pytest
 import allure
+from playwright.sync_api import Page
 from pages.login_page import LoginPage
 from pages.home_page import HomePage
 from pages.store_list_page import StoreListPage
@@ -9,6 +11,10 @@ from pages.store_details_page import StoreDetailsPage
 from pages.create_polygon_page import CreatePolygonPage
 from utils.logger import Logger
 from utils.config_manager import ConfigManager
+from utils.store_index import StoreIndexCache
+from utils.workflow import Workflow
+from services.preconditions import Preconditions
+from services.tms_api_client import TmsApiClient
 
 
 logger = Logger()
@@ -18,112 +24,183 @@ config = ConfigManager()
 @allure.feature("Polygon Management")
 @allure.story("Complete Polygon Management Workflow")
 @pytest.mark.smoke
+@pytest.mark.allow_resources('map_tiles')
 class TestPolygonManagement:
 
-
-    qc_polygon_name = None
-    slotted_polygon_name = None
-    manual_csv_polygon_name = None
-    manual_drawing_polygon_name = None
-
     @allure.title("Complete Polygon Management E2E Test")
     @allure.description("""
         End-to-end test covering:
         1. Login
-        2. Navigate to Stores
-        3. Click on first store
+        2. Look up first Active store in the store index
+        3. Open store details by deep link
         4. Create multiple polygons with different types
         5. Validate polygon creation
         6. Export Store data
         7. Set store as inactive
         8. Set store as active again
-        9. Edit polygon
-        10. Set polygon as inactive
+        9. Edit a polygon seeded over the API
+        10. Set a polygon seeded over the API as inactive
         11. Logout
     """)
     @allure.severity(allure.severity_level.CRITICAL)
     def test_complete_polygon_management_workflow(
         self,
+        page: Page,
         login_page: LoginPage,
         home_page: HomePage,
         store_list_page: StoreListPage,
         store_details_page: StoreDetailsPage,
         create_polygon_page: CreatePolygonPage,
         polygon_names: dict,
-        test_data_path: Path
+        test_data_path: Path,
+        storage_state: Optional[dict],
+        tms_api: TmsApiClient,
+        preconditions: Optional[Preconditions],
+        store_index: Optional[StoreIndexCache],
+        workflow: Workflow,
+        resume_from: Optional[int]
     ):
 
-        TestPolygonManagement.qc_polygon_name = polygon_names['qc_travel_time']
-        TestPolygonManagement.slotted_polygon_name = polygon_names['slotted_delivery']
-        TestPolygonManagement.manual_csv_polygon_name = polygon_names['manual_csv']
-        TestPolygonManagement.manual_drawing_polygon_name = polygon_names['manual_drawing']
-
-        with allure.step("Step 1: Login with credentials"):
-            logger.info("Step 1: Performing login")
-            login_page.navigate_to_login()
-            login_page.login(config.username, config.password)
-            logger.info("Waiting for login redirect...")
-
-        with allure.step("Step 2: Navigate to Stores"):
-            logger.info("Step 2: Navigating to Stores")
+        # Restored from the checkpoint when resuming, so names match the polygons created by the earlier run
+        workflow.state.setdefault('polygon_names', polygon_names)
+
+        @workflow.step(1, "Login with credentials")
+        def login(state: dict) -> None:
+            if storage_state:
+                logger.info("Step 1: Reusing cached authenticated session")
+                home_page.open()
+            else:
+                logger.info("Step 1: Performing login")
+                login_page.navigate_to_login()
+                login_page.login(config.username, config.password)
+                logger.info("Waiting for login redirect...")
+
+        def navigate_to_store_list() -> None:
             home_page.navigate_to_stores()
             assert store_list_page.is_stores_page_displayed(), "Stores page not displayed"
+
+        @workflow.step(2, "Find first Active store", requires=(1,))
+        def find_active_store(state: dict) -> None:
+            state['store'] = None
+            if store_index is not None:
+                logger.info("Step 2: Looking up first active store in the store index")
+                try:
+                    store = store_index.find_live(tms_api, status='Active')
+                except Exception as e:
+                    logger.warning("Store index lookup failed, falling back to the store list page: %s", e)
+                    store = None
+                if store is not None:
+                    state['store'] = {'code': store['code'], 'name': store['name']}
+                    logger.info("Found active store %s", store['code'])
+                    return
+            logger.info("Step 2: Navigating to Stores")
+            navigate_to_store_list()
             logger.info("Navigated to Stores successfully")
 
-        with allure.step("Step 3: Click on first Active store"):
-            logger.info("Step 3: Clicking on first active store")
-            first_active_store = store_list_page.click_first_active_store()
+        @workflow.step(3, "Open first Active store", requires=(2,))
+        def open_first_active_store(state: dict) -> None:
+            store = state.get('store')
+            if store is not None:
+                logger.info("Step 3: Opening store %s by deep link", store['code'])
+                try:
+                    store_details_page.open(store['code'])
+                    state['store_name'] = store['name']
+                except Exception as e:
+                    logger.warning("Deep link to store %s failed, falling back to the store list page: %s", store['code'], e)
+                    # The index pointed at a store the app would not open, so the next run fetches a fresh list
+                    if store_index is not None:
+                        store_index.invalidate()
+                    state['store'] = store = None
+                    home_page.open()
+                    navigate_to_store_list()
+            if store is None:
+                logger.info("Step 3: Clicking on first active store")
+                state['store_name'] = store_list_page.click_first_active_store()
             assert store_details_page.is_store_details_page_displayed(), "Store details page not displayed"
-            logger.info(f"{first_active_store} details page opened")
-
-        with allure.step("Step 4: Click on Create Polygon button"):
+            logger.info("%s details page opened", state['store_name'])
+
+        def api_store_code(state: dict) -> Optional[str]:
+            if preconditions is None:
+                return None
+            if state.get('store') is None:
+                try:
+                    code = preconditions.store_code(state['store_name'])
+                except Exception as e:
+                    logger.warning("Store lookup over the API failed: %s", e)
+                    return None
+                if code is None:
+                    return None
+                state['store'] = {'code': code, 'name': state['store_name']}
+            return state['store']['code']
+
+        def seeded_qc_polygon(state: dict, key: str) -> str:
+            # Edit and deactivate only need a QC polygon to act on, so one is created over the API instead of
+            # through the create form. Without the API they act on the polygon created in step 5
+            if key not in state:
+                state[key] = state['polygon_names']['qc_travel_time']
+                store_code = api_store_code(state)
+                if store_code is not None:
+                    try:
+                        state[key] = preconditions.qc_polygon(store_code, prefix=key)
+                    except Exception as e:
+                        logger.warning("Seeding a polygon over the API failed, using %s: %s", state[key], e)
+            return state[key]
+
+        @workflow.step(4, "Click on Create Polygon button", requires=(3,))
+        def open_create_polygon(state: dict) -> None:
             logger.info("Step 4: Clicking Create Polygon button")
             store_details_page.click_create_polygon()
             assert create_polygon_page.is_create_polygon_page_displayed(), "Create polygon page not displayed"
             logger.info("Create Polygon page opened")
 
-        with allure.step("Step 5: Create QC polygon with Travel Time (18 mins)"):
-            logger.info(f"Step 5: Creating QC polygon with travel time: {TestPolygonManagement.qc_polygon_name}")
+        @workflow.step(5, "Create QC polygon with Travel Time (18 mins)", requires=(4,))
+        def create_qc_polygon(state: dict) -> None:
+            name = state['polygon_names']['qc_travel_time']
+            logger.info("Step 5: Creating QC polygon with travel time: %s", name)
             create_polygon_page.create_qc_polygon_travel_time(
-                name=TestPolygonManagement.qc_polygon_name,
+                name=name,
                 travel_time=18,
                 max_promise_time=15
             )
             logger.info("QC polygon created with travel time")
 
-        with allure.step("Step 6: Validate QC polygon is added to the list"):
+        @workflow.step(6, "Validate QC polygon is added to the list", requires=(5,))
+        def validate_qc_polygon(state: dict) -> None:
+            name = state['polygon_names']['qc_travel_time']
             logger.info("Step 6: Validating QC polygon in list")
-            store_details_page.search_polygon(TestPolygonManagement.qc_polygon_name)
+            store_details_page.search_polygon(name)
 
-            assert store_details_page.is_polygon_visible(TestPolygonManagement.qc_polygon_name), \
-                f"QC polygon '{TestPolygonManagement.qc_polygon_name}' not found in list"
+            assert store_details_page.is_polygon_visible(name), f"QC polygon '{name}' not found in list"
 
             logger.info("QC polygon validated successfully")
             store_details_page.search_polygon("")
 
-        with allure.step("Step 7: Create Slotted Delivery polygon with Travel Distance"):
+        @workflow.step(7, "Create Slotted Delivery polygon with Travel Distance", requires=(3,))
+        def create_slotted_polygon(state: dict) -> None:
             logger.info("Step 7: Creating Slotted Delivery polygon")
             store_details_page.click_create_polygon()
 
             create_polygon_page.create_slotted_polygon_travel_distance(
-                name=TestPolygonManagement.slotted_polygon_name,
+                name=state['polygon_names']['slotted_delivery'],
                 travel_distance=5000,
                 flat_delivery_fee=35,
                 store_type='grocery'
             )
             logger.info("Slotted Delivery polygon created")
 
-        with allure.step("Step 8: Validate Slotted Delivery polygon is added"):
+        @workflow.step(8, "Validate Slotted Delivery polygon is added", requires=(7,))
+        def validate_slotted_polygon(state: dict) -> None:
+            name = state['polygon_names']['slotted_delivery']
             logger.info("Step 8: Validating Slotted Delivery polygon")
-            store_details_page.search_polygon(TestPolygonManagement.slotted_polygon_name)
+            store_details_page.search_polygon(name)
 
-            assert store_details_page.is_polygon_visible(TestPolygonManagement.slotted_polygon_name), \
-                f"Slotted polygon '{TestPolygonManagement.slotted_polygon_name}' not found in list"
+            assert store_details_page.is_polygon_visible(name), f"Slotted polygon '{name}' not found in list"
 
             logger.info("Slotted Delivery polygon validated successfully")
             store_details_page.search_polygon("")
 
-        with allure.step("Step 9: Create QC polygon with Manual CSV upload"):
+        @workflow.step(9, "Create QC polygon with Manual CSV upload", requires=(3,))
+        def create_manual_csv_polygon(state: dict) -> None:
             logger.info("Step 9: Creating QC polygon with manual CSV upload")
 
             store_details_page.click_create_polygon()
@@ -131,58 +208,75 @@ class TestPolygonManagement:
             csv_file_path = test_data_path / 'lat_long_coordinates.csv'
 
             create_polygon_page.create_qc_polygon_manual_csv(
-                name=TestPolygonManagement.manual_csv_polygon_name,
+                name=state['polygon_names']['manual_csv'],
                 csv_file_path=str(csv_file_path)
             )
             logger.info("QC polygon with manual CSV created")
 
-        with allure.step("Step 10: Validate Manual CSV polygon is added"):
+        @workflow.step(10, "Validate Manual CSV polygon is added", requires=(9,))
+        def validate_manual_csv_polygon(state: dict) -> None:
+            name = state['polygon_names']['manual_csv']
             logger.info("Step 10: Validating Manual CSV polygon")
-            store_details_page.search_polygon(TestPolygonManagement.manual_csv_polygon_name)
+            store_details_page.search_polygon(name)
 
-            assert store_details_page.is_polygon_visible(TestPolygonManagement.manual_csv_polygon_name), \
-                f"Manual CSV polygon '{TestPolygonManagement.manual_csv_polygon_name}' not found in list"
+            assert store_details_page.is_polygon_visible(name), f"Manual CSV polygon '{name}' not found in list"
 
             logger.info("Manual CSV polygon validated successfully")
 
             store_details_page.search_polygon("")
 
-        with allure.step("Step 11: Create Slotted Delivery polygon with Manual Drawing"):
+        @workflow.step(11, "Create Slotted Delivery polygon with Manual Drawing", requires=(3,))
+        def create_manual_drawing_polygon(state: dict) -> None:
             logger.info("Step 11: Creating Slotted Delivery polygon with manual drawing")
 
             store_details_page.click_create_polygon()
 
             create_polygon_page.create_slotted_polygon_manual_drawing(
-                name=TestPolygonManagement.manual_drawing_polygon_name
+                name=state['polygon_names']['manual_drawing']
             )
             logger.info("Slotted Delivery polygon with manual drawing created")
 
-        with allure.step("Step 12: Validate Manual Drawing polygon is added"):
+        @workflow.step(12, "Validate Manual Drawing polygon is added", requires=(11,))
+        def validate_manual_drawing_polygon(state: dict) -> None:
+            name = state['polygon_names']['manual_drawing']
             logger.info("Step 12: Validating Manual Drawing polygon")
 
-            store_details_page.search_polygon(TestPolygonManagement.manual_drawing_polygon_name)
+            store_details_page.search_polygon(name)
 
-            assert store_details_page.is_polygon_visible(TestPolygonManagement.manual_drawing_polygon_name), \
-                f"Manual Drawing polygon '{TestPolygonManagement.manual_drawing_polygon_name}' not found in list"
+            assert store_details_page.is_polygon_visible(name), f"Manual Drawing polygon '{name}' not found in list"
 
             logger.info("Manual Drawing polygon validated successfully")
             store_details_page.search_polygon("")
 
-        with allure.step("Step 13: Click on 3 dots menu, Export Data and validate file is not empty"):
-            logger.info("Step 13: Clicking 3 dots menu for Export Data and validate file is not empty")
+        @workflow.step(13, "Click on 3 dots menu, Export Data and validate the created polygons are in it", requires=(5, 7, 9, 11))
+        def export_store_data(state: dict) -> None:
+            logger.info("Step 13: Clicking 3 dots menu for Export Data and validating its contents")
 
             store_details_page.click_three_dots_menu()
-            store_details_page.click_export_data_download_file()
+            store = state.get('store')
+            store_details_page.click_export_data_download_file(
+                expected_polygons=state['polygon_names'].values(),
+                store_key=store['code'] if store else state['store_name']
+            )
             logger.info("Downloaded Store Serviceability Data")
 
-        with allure.step("Step 14: Set store as Inactive"):
+        @workflow.step(14, "Set store as Inactive", requires=(3,))
+        def set_store_inactive(state: dict) -> None:
             logger.info("Step 14: Setting store as inactive")
+            store_code = api_store_code(state)
+            if store_code is not None:
+                # Put back over the API at teardown if the test stops before step 16 reactivates it
+                try:
+                    preconditions.keep_store_status(store_code)
+                except Exception as e:
+                    logger.warning("Could not read store %s status over the API: %s", store_code, e)
 
             store_details_page.click_three_dots_menu()
             store_details_page.click_set_as_inactive()
             logger.info("Set store as inactive")
 
-        with allure.step("Step 15: Validate store is Inactive"):
+        @workflow.step(15, "Validate store is Inactive", requires=(14,))
+        def validate_store_inactive(state: dict) -> None:
             logger.info("Step 15: Validating store inactive status")
 
             assert store_details_page.verify_store_status("Inactive"), \
@@ -190,14 +284,16 @@ class TestPolygonManagement:
 
             logger.info("Store inactive status validated")
 
-        with allure.step("Step 16: Set store as active"):
+        @workflow.step(16, "Set store as active", requires=(14,))
+        def set_store_active(state: dict) -> None:
             logger.info("Step 16: Setting store as active")
 
             store_details_page.click_three_dots_menu()
             store_details_page.click_set_as_active()
             logger.info("Set store as active")
 
-        with allure.step("Step 17: Validate store is active"):
+        @workflow.step(17, "Validate store is active", requires=(16,))
+        def validate_store_active(state: dict) -> None:
             logger.info("Step 17: Validating store active status")
 
             assert store_details_page.verify_store_status("Active"), \
@@ -205,44 +301,58 @@ class TestPolygonManagement:
 
             logger.info("Store active status validated")
 
-        with allure.step("Step 18: Edit QC polygon - change to Travel Distance"):
+        @workflow.step(18, "Edit QC polygon - change to Travel Distance", requires=(3,))
+        def edit_qc_polygon(state: dict) -> None:
+            name = seeded_qc_polygon(state, 'edited_polygon')
             logger.info("Step 18: Editing QC polygon to change to travel distance")
-            store_details_page.search_polygon(TestPolygonManagement.qc_polygon_name)
-            store_details_page.click_edit_polygon(TestPolygonManagement.qc_polygon_name)
+            store_details_page.search_polygon(name)
+            store_details_page.click_edit_polygon(name)
 
             create_polygon_page.edit_polygon_change_to_travel_distance(200)
             logger.info("QC polygon edited to travel distance")
 
-        with allure.step("Step 19: Validate edited polygon travel distance"):
+        @workflow.step(19, "Validate edited polygon travel distance", requires=(18,))
+        def validate_edited_polygon(state: dict) -> None:
+            name = seeded_qc_polygon(state, 'edited_polygon')
             logger.info("Step 19: Validating edited polygon travel distance")
 
-            store_details_page.search_polygon(TestPolygonManagement.qc_polygon_name)
+            store_details_page.search_polygon(name)
 
-            assert store_details_page.verify_polygon_travel_distance(TestPolygonManagement.qc_polygon_name, "Travel Distance: 200 metres"), \
-                f"Polygon '{TestPolygonManagement.qc_polygon_name}' does not show 'Travel Distance: 200 metres'"
+            assert store_details_page.verify_polygon_travel_distance(name, "Travel Distance: 200 metres"), \
+                f"Polygon '{name}' does not show 'Travel Distance: 200 metres'"
 
             logger.info("Edited polygon travel distance validated successfully")
 
-        with allure.step("Step 20: Set QC polygon as Inactive"):
+        @workflow.step(20, "Set QC polygon as Inactive", requires=(3,))
+        def set_qc_polygon_inactive(state: dict) -> None:
             logger.info("Step 20: Setting QC polygon as inactive")
-            store_details_page.set_polygon_inactive(TestPolygonManagement.qc_polygon_name)
+            name = seeded_qc_polygon(state, 'inactive_polygon')
+            store_details_page.search_polygon(name)
+            store_details_page.set_polygon_inactive(name)
             logger.info("QC polygon set as inactive")
 
-        with allure.step("Step 21: Validate QC polygon is Inactive"):
+        @workflow.step(21, "Validate QC polygon is Inactive", requires=(20,))
+        def validate_qc_polygon_inactive(state: dict) -> None:
+            name = seeded_qc_polygon(state, 'inactive_polygon')
             logger.info("Step 21: Validating QC polygon inactive status")
-            store_details_page.search_polygon(TestPolygonManagement.qc_polygon_name)
+            store_details_page.search_polygon(name)
 
-            assert store_details_page.verify_polygon_status(
-                TestPolygonManagement.qc_polygon_name, "Inactive"
-            ), f"QC polygon '{TestPolygonManagement.qc_polygon_name}' is not Inactive"
+            assert store_details_page.verify_polygon_status(name, "Inactive"), f"QC polygon '{name}' is not Inactive"
 
             logger.info("QC polygon inactive status validated")
 
-        with allure.step("Step 22: Logout from application"):
+        @workflow.step(22, "Logout from application", requires=(1,))
+        def logout(state: dict) -> None:
+            if storage_state:
+                # Logging out would end the cached session on the server for every other test reusing it
+                logger.info("Step 22: Skipping logout, the session is shared through the auth cache")
+                return
             logger.info("Step 22: Logging out")
 
             home_page.logout()
             assert login_page.is_login_page_displayed(), "Logout failed - Login page not displayed"
             logger.info("Logout successful")
 
+        workflow.run(page, resume_from=resume_from)
+
         logger.info("Complete polygon management workflow test completed successfully")
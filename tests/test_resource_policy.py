@@ -0,0 +1,111 @@
+from collections import defaultdict
+from types import SimpleNamespace
+
+import pytest
+import allure
+from utils.resource_policy import CATEGORIES, STUB_RESPONSES, ResourcePolicy
+
+
+def request(url: str, resource_type: str = 'document') -> SimpleNamespace:
+    return SimpleNamespace(url=url, resource_type=resource_type)
+
+
+class RecordingRoute:
+    # Stands in for a Playwright route: records whether the policy blocked the request or let it through
+
+    def __init__(self, url: str, resource_type: str = 'document'):
+        self.request = request(url, resource_type)
+        self.outcome = None
+
+    def fallback(self) -> None:
+        self.outcome = ('fallback',)
+
+    def abort(self, error_code: str) -> None:
+        self.outcome = ('abort', error_code)
+
+    def fulfill(self, **response) -> None:
+        self.outcome = ('fulfill', response)
+
+
+class RecordingContext:
+
+    def __init__(self):
+        self.listeners: list[tuple] = []
+        self.routes: list[tuple] = []
+
+    def on(self, event: str, handler) -> None:
+        self.listeners.append((event, handler))
+
+    def remove_listener(self, event: str, handler) -> None:
+        self.listeners.remove((event, handler))
+
+    def route(self, pattern: str, handler) -> None:
+        self.routes.append((pattern, handler))
+
+    def unroute(self, pattern: str, handler) -> None:
+        self.routes.remove((pattern, handler))
+
+
+@pytest.fixture(autouse=True)
+def session_totals(monkeypatch):
+    monkeypatch.setattr(ResourcePolicy, '_session_totals', defaultdict(int))
+    monkeypatch.setattr(ResourcePolicy, '_observed_sizes', defaultdict(lambda: [0, 0]))
+
+
+@allure.feature("Resource Blocking")
+class TestResourcePolicy:
+
+    def test_requests_are_categorized(self):
+        policy = ResourcePolicy(set(CATEGORIES))
+        assert policy.category_of(request('https://tms.test/logo.png', 'image')) == 'image'
+        assert policy.category_of(request('https://tms.test/inter.woff2', 'font')) == 'font'
+        assert policy.category_of(request('https://maps.googleapis.com/maps/vt?pb=1', 'image')) == 'map_tiles'
+        assert policy.category_of(request('https://tile.openstreetmap.org/12/2890/1810.png', 'image')) == 'map_tiles'
+        assert policy.category_of(request('https://www.google-analytics.com/collect', 'xhr')) == 'third_party'
+        assert policy.category_of(request('https://notgoogle-analytics.com/collect', 'xhr')) is None
+        assert policy.category_of(request('https://tms.test/api/stores', 'fetch')) is None
+
+    def test_blocked_requests_are_stubbed_or_aborted_and_counted(self):
+        policy = ResourcePolicy({'image', 'third_party'})
+        stubbed, aborted, allowed = (RecordingRoute('https://tms.test/logo.png', 'image'),
+                                     RecordingRoute('https://hotjar.com/c', 'script'),
+                                     RecordingRoute('https://tms.test/inter.woff2', 'font'))
+
+        policy._handle(stubbed)
+        policy.action = 'abort'
+        policy._handle(aborted)
+        policy._handle(allowed)
+
+        assert stubbed.outcome == ('fulfill', STUB_RESPONSES['image'])
+        assert aborted.outcome == ('abort', 'blockedbyclient')
+        assert allowed.outcome == ('fallback',)
+        assert policy.stats == {'image': 1, 'third_party': 1}
+        assert ResourcePolicy.session_summary()['image']['requests'] == 1
+
+    def test_marker_categories_are_allowed_through(self):
+        policy = ResourcePolicy.from_config(allowed=('map_tiles', 'image'))
+        assert policy.blocked_categories == set(CATEGORIES) - {'map_tiles', 'image'}
+        assert not ResourcePolicy.from_config(allowed=CATEGORIES).enabled
+
+    def test_bytes_are_estimated_from_allowed_responses_of_the_category(self):
+        policy = ResourcePolicy({'image'})
+        route = RecordingRoute('https://tms.test/logo.png', 'image')
+        policy._handle(route)
+        policy._handle(route)
+        assert policy.summary() == {'image': {'requests': 2, 'estimated_bytes': None}}
+
+        for length in ('3000', '5000', 'unknown'):
+            policy._observe_size(SimpleNamespace(request=request('https://tms.test/a.png', 'image'),
+                                                 headers={'content-length': length}))
+        policy._observe_size(SimpleNamespace(request=request('https://tms.test/api/stores', 'fetch'),
+                                             headers={'content-length': '90000'}))
+        assert policy.summary() == {'image': {'requests': 2, 'estimated_bytes': 8000}}
+
+    def test_detach_removes_the_route_and_listener(self):
+        context = RecordingContext()
+        policy = ResourcePolicy({'image'})
+        policy.apply(context)
+        assert len(context.routes) == 1 and len(context.listeners) == 1
+
+        policy.detach(context)
+        assert context.routes == [] and context.listeners == []
@@ -0,0 +1,90 @@
+import json
+
+import pytest
+import allure
+from pages.create_polygon_page import CreatePolygonPage
+from pages.login_page import LoginPage
+from pages.store_details_page import StoreDetailsPage
+from utils.selector_profiler import SnapshotRecorder, load_samples, load_snapshots, rank, selector_flags
+
+
+@pytest.fixture
+def recorder(tmp_path, monkeypatch):
+    recorder = SnapshotRecorder()
+    monkeypatch.setattr(recorder, 'enabled', True)
+    monkeypatch.setattr(recorder, 'directory', tmp_path)
+    monkeypatch.setattr(recorder, 'per_page', 2)
+    monkeypatch.setattr(recorder, '_seen', set())
+    monkeypatch.setattr(recorder, '_digests', type(recorder._digests)(set))
+    monkeypatch.setattr(recorder, '_samples', type(recorder._samples)(recorder._samples.default_factory))
+    return recorder
+
+
+def row(name: str, snapshot: str, cost_ms: float, matches: int, flags: list) -> dict:
+    return {'page': 'StoreDetailsPage', 'name': name, 'selector': name.lower(), 'snapshot': snapshot,
+            'matches': matches, 'median_ms': cost_ms + 0.2, 'cost_ms': cost_ms, 'flags': flags, 'suggestions': []}
+
+
+@allure.feature("Selector Profiler")
+class TestSelectorProfiler:
+
+    def test_flags_expensive_and_fragile_selectors(self):
+        assert selector_flags(StoreDetailsPage.POLYGON_STATUS_BADGE.format(polygon_name='A', status='Active')) == [
+            'xpath', 'text predicate', 'parent traversal'
+        ]
+        assert selector_flags(StoreDetailsPage.POLYGON_INACTIVE_OPTION.format(polygon_name='A')) == [
+            'xpath', 'text predicate', 'parent traversal'
+        ]
+        assert selector_flags(StoreDetailsPage.STORE_STATUS_BADGE.format(status='Active')) == [
+            'xpath', 'text predicate', 'positional index'
+        ]
+        assert selector_flags(CreatePolygonPage.TRAVEL_TIME_TAB) == ['build-specific class']
+        assert selector_flags(LoginPage.LOGIN_BUTTON) == []
+
+    def test_recorder_strips_scripts_and_keeps_distinct_snapshots_per_page(self, recorder, tmp_path):
+        html = "<html><body><script src='app.js'></script><h4>Store Details</h4><SCRIPT>boot()</SCRIPT></body></html>"
+        assert recorder.wants('StoreDetailsPage', 'h4') and not recorder.wants('StoreDetailsPage', 'h4')
+
+        first = recorder.capture('StoreDetailsPage', html)
+        assert first.read_text(encoding='utf-8') == "<html><body><h4>Store Details</h4></body></html>"
+        assert recorder.capture('StoreDetailsPage', html) is None
+        assert recorder.capture('StoreDetailsPage', "<p>menu open</p>") is not None
+        assert recorder.capture('StoreDetailsPage', "<p>third state</p>") is None
+        assert not recorder.wants('StoreDetailsPage', 'text=Edit')
+        assert list(load_snapshots(tmp_path)) == ['StoreDetailsPage']
+
+    def test_samples_round_trip_through_save(self, recorder, tmp_path):
+        recorder.record_sample('StoreDetailsPage', 'POLYGON_HEADING', 'h4:has-text("Zone A")')
+        recorder.record_sample('StoreDetailsPage', 'POLYGON_HEADING', 'h4:has-text("Zone A")')
+        path = recorder.save()
+
+        assert json.loads(path.read_text(encoding='utf-8')) == {
+            'StoreDetailsPage': {'POLYGON_HEADING': ['h4:has-text("Zone A")']}
+        }
+        assert load_samples(tmp_path)['StoreDetailsPage']['POLYGON_HEADING'] == ['h4:has-text("Zone A")']
+
+    def test_samples_are_keyed_by_the_declaring_page(self, recorder):
+        class FakePage:
+            def locator(self, selector):
+                return selector
+
+        class BatchStoreDetailsPage(StoreDetailsPage):
+            pass
+
+        BatchStoreDetailsPage(FakePage()).locator(StoreDetailsPage.POLYGON_INACTIVE_OPTION, polygon_name='Zone A')
+        assert list(recorder._samples) == ['StoreDetailsPage']
+        assert list(recorder._samples['StoreDetailsPage']) == ['POLYGON_INACTIVE_OPTION']
+
+    def test_rank_keeps_the_costliest_snapshot_and_flags_match_counts(self):
+        report = rank([
+            row('EDIT_BUTTON', 'a.html', 0.1, 0, []),
+            row('EDIT_BUTTON', 'b.html', 0.4, 1, []),
+            row('POLYGON_INACTIVE_OPTION', 'a.html', 0.9, 2, ['xpath']),
+            row('EXPORT_DATA_OPTION', 'a.html', 0.2, 0, []),
+        ])
+
+        assert [(entry['name'], entry['snapshot'], entry['matches_seen'], entry['flags']) for entry in report] == [
+            ('POLYGON_INACTIVE_OPTION', 'a.html', [2], ['xpath', 'multiple matches']),
+            ('EDIT_BUTTON', 'b.html', [0, 1], []),
+            ('EXPORT_DATA_OPTION', 'a.html', [0], ['no match']),
+        ]
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+import allure
+from utils.step_report import format_table, load_records, main, percentile, summarize
+from utils.step_timing import StepTimer
+
+
+def record(step: str, run_id: str, duration: float, depth: int = 1, timestamp: str = None) -> dict:
+    return {'run_id': run_id, 'step': step, 'duration': duration, 'depth': depth,
+            'timestamp': timestamp or f"2026-10-{run_id[-2:]}T10:00:00"}
+
+
+def write_store(store_dir, records: list[dict]):
+    store_dir.mkdir(parents=True, exist_ok=True)
+    (store_dir / 'run_gw0.jsonl').write_text(''.join(json.dumps(item) + '\n' for item in records), encoding='utf-8')
+    return store_dir
+
+
+@allure.feature("Step Timings")
+class TestStepTimer:
+
+    def test_nested_steps_record_parent_and_depth(self, tmp_path):
+        timer = StepTimer(tmp_path, 'chromium')
+        timer.start_test('test_example')
+        timer.start_step('outer', 'Create polygon qc_20261017_101500_123_gw0_4821', {})
+        timer.start_step('inner', 'Click element', {})
+        timer.stop_step('inner', None, None, None)
+        timer.stop_step('outer', ValueError, ValueError(), None)
+
+        records = timer.finish_test()
+        assert [(item['step'], item['parent'], item['depth'], item['status']) for item in records] == [
+            ('Click element', 'Create polygon qc_{id}', 2, 'passed'),
+            ('Create polygon qc_{id}', None, 1, 'failed'),
+        ]
+        assert timer.store_path.exists()
+
+    def test_unclosed_step_does_not_corrupt_later_timings(self, tmp_path):
+        timer = StepTimer(tmp_path, 'chromium')
+        timer.start_test('test_example')
+        timer.start_step('outer', 'Outer', {})
+        timer.start_step('leaked', 'Never closed', {})
+        timer.stop_step('outer', None, None, None)
+        timer.stop_step('unknown', None, None, None)
+        timer.start_step('next', 'Next', {})
+        timer.stop_step('next', None, None, None)
+
+        assert [(item['step'], item['parent'], item['depth']) for item in timer.finish_test()] == [
+            ('Outer', None, 1),
+            ('Next', None, 1),
+        ]
+
+
+@allure.feature("Step Timings")
+class TestStepReport:
+
+    def test_percentile_interpolates_between_samples(self):
+        assert percentile([], 0.5) == 0.0
+        assert percentile([4.0], 0.95) == 4.0
+        assert percentile([3.0, 1.0, 2.0, 4.0], 0.5) == 2.5
+        assert percentile([1.0, 2.0, 3.0, 4.0, 5.0], 0.95) == pytest.approx(4.8)
+
+    def test_latest_run_is_compared_with_historical_median(self):
+        records = [
+            record('Login', 'run01', 1.0), record('Login', 'run02', 1.2), record('Login', 'run03', 2.0),
+            record('Logout', 'run01', 1.0), record('Logout', 'run02', 1.0), record('Logout', 'run03', 1.3),
+        ]
+        rows = {row['step']: row for row in summarize(records, threshold=0.25, min_delta=0.5)}
+
+        assert rows['Login']['baseline_p50'] == pytest.approx(1.1) and rows['Login']['latest_p50'] == 2.0
+        assert rows['Login']['regressed']
+        # 30% slower, but under the absolute minimum delta
+        assert not rows['Logout']['regressed']
+        assert rows['Login']['runs'] == 3 and rows['Login']['max'] == 2.0
+        assert 'REGRESSED' in format_table(list(rows.values()))
+
+    def test_single_run_has_no_baseline(self):
+        [row] = summarize([record('Login', 'run01', 1.0), record('Login', 'run01', 3.0)], 0.25, 0.5)
+        assert row['baseline_p50'] is None and not row['regressed'] and row['samples'] == 2
+
+    def test_load_records_filters_by_depth(self, tmp_path):
+        store = write_store(tmp_path / 'timings', [record('Login', 'run01', 1.0), record('Click element', 'run01', 0.2, depth=2)])
+        assert [item['step'] for item in load_records(store, max_depth=1)] == ['Login']
+        assert len(load_records(store)) == 2
+
+    def test_cli_fails_on_regression_only_when_asked(self, tmp_path, capsys):
+        store = write_store(tmp_path / 'timings', [record('Login', 'run01', 1.0), record('Login', 'run02', 3.0)])
+
+        assert main(['--store', str(store)]) == 0
+        assert main(['--store', str(store), '--fail-on-regression']) == 1
+        assert "Regression: 'Login' got 2.00s slower" in capsys.readouterr().out
+        assert main(['--store', str(tmp_path / 'empty')]) == 0
@@ -0,0 +1,120 @@
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import allure
+from playwright.sync_api import Playwright
+from services.tms_api_client import TmsApiClient
+from services.stub_server import TmsStubServer
+from utils.config_manager import ConfigManager
+from utils.store_index import StoreIndex, StoreIndexCache
+
+STORES = [
+    {'code': 'STR001', 'name': 'Andheri Fresh Store', 'status': 'Active'},
+    {'code': 'STR002', 'name': 'Bandra Grocery Hub', 'status': 'Active'},
+    {'code': 'STR003', 'name': 'Powai Digital Point', 'status': 'Inactive'},
+]
+
+
+@pytest.fixture(scope="function")
+def stub_api(playwright_instance: Playwright, tms_stub_server: TmsStubServer) -> TmsApiClient:
+    request_context = playwright_instance.request.new_context()
+
+    yield TmsApiClient(request_context, base_url=tms_stub_server.api_base_url)
+
+    request_context.dispose()
+
+
+@pytest.fixture
+def index_cache(tmp_path, monkeypatch) -> StoreIndexCache:
+    cache = StoreIndexCache()
+    monkeypatch.setattr(ConfigManager, 'store_index_path', tmp_path / 'store_index.json')
+    monkeypatch.setattr(cache, '_index', None)
+    return cache
+
+
+class CountingApi:
+
+    def __init__(self, base_url: str = 'http://tms.test/api/', live_status: dict = None):
+        self.base_url = base_url
+        self.live_status = live_status or {}
+        self.calls = 0
+        self.reads = []
+
+    def list_stores(self) -> list:
+        self.calls += 1
+        return STORES
+
+    def get_store(self, store_code: str) -> dict:
+        self.reads.append(store_code)
+        store = next(store for store in STORES if store['code'] == store_code)
+        return {**store, 'status': self.live_status.get(store_code, store['status'])}
+
+
+@allure.feature("Store Index")
+class TestStoreIndex:
+
+    def test_lookup_by_code_name_and_status(self):
+        index = StoreIndex(STORES)
+
+        assert len(index) == 3
+        assert index.get('STR002')['name'] == 'Bandra Grocery Hub'
+        assert index.by_name('powai digital point')['code'] == 'STR003'
+        assert [store['code'] for store in index.with_status('Active')] == ['STR001', 'STR002']
+        assert index.first(status='Inactive')['code'] == 'STR003'
+        assert index.first(status='Archived') is None and index.get('STR999') is None
+
+    def test_index_is_fetched_once_and_reused_from_disk(self, index_cache, tmp_path):
+        api = CountingApi()
+        assert index_cache.get(api).first()['code'] == 'STR001'
+        index_cache.get(api)
+        assert api.calls == 1
+
+        # A new session starts with an empty memory cache and reads the file written by the last one
+        index_cache._index = None
+        assert len(index_cache.get(api)) == 3 and api.calls == 1
+        assert json.loads((tmp_path / 'store_index.json').read_text(encoding='utf-8'))['base_url'] == api.base_url
+
+    def test_expired_or_foreign_index_is_refetched(self, index_cache, monkeypatch):
+        api = CountingApi()
+        index_cache.get(api)
+
+        index_cache._index = None
+        stale = time.time() - ConfigManager().store_index_ttl - 1
+        os.utime(index_cache.index_path, (stale, stale))
+        index_cache.get(api)
+        assert api.calls == 2
+
+        index_cache._index = None
+        stub = CountingApi('http://127.0.0.1:9999/api/')
+        index_cache.get(stub)
+        assert stub.calls == 1
+        index_cache.invalidate()
+        assert not index_cache.index_path.exists()
+
+    def test_concurrent_refreshes_leave_one_complete_index(self, index_cache, tmp_path):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: index_cache.record(STORES, 'http://tms.test/api/'), range(32)))
+
+        assert json.loads(index_cache.index_path.read_text(encoding='utf-8'))['stores'] == STORES
+        assert [path.name for path in tmp_path.iterdir()] == ['store_index.json']
+
+    def test_find_live_rechecks_cached_status(self, index_cache):
+        # STR001 was left Inactive by an aborted run and STR003 has been reactivated since the index was cached
+        api = CountingApi(live_status={'STR001': 'Inactive', 'STR002': 'Inactive', 'STR003': 'Active'})
+        assert index_cache.find_live(api, status='Active')['code'] == 'STR003'
+        assert api.reads == ['STR001', 'STR002', 'STR003']
+
+        api = CountingApi()
+        assert index_cache.find_live(api, status='Active')['code'] == 'STR001'
+        assert api.reads == ['STR001']
+
+    def test_index_built_from_stub_api(self, index_cache, stub_api: TmsApiClient):
+        index = index_cache.get(stub_api)
+        active = index.first(status='Active')
+
+        assert active is not None
+        assert index.get(active['code']) == active
+        assert index.by_name(active['name'].upper()) == active
@@ -0,0 +1,71 @@
+import pytest
+import allure
+from playwright.sync_api import Playwright
+from services.preconditions import Preconditions
+from services.tms_api_client import TmsApiClient
+from services.stub_server import TmsStubServer
+from utils.helpers import generate_polygon_name
+
+
+@pytest.fixture(scope="function")
+def stub_api(playwright_instance: Playwright, tms_stub_server: TmsStubServer) -> TmsApiClient:
+    request_context = playwright_instance.request.new_context()
+
+    yield TmsApiClient(request_context, base_url=tms_stub_server.api_base_url)
+
+    request_context.dispose()
+
+
+@allure.feature("Polygon Management")
+@allure.story("API Preconditions")
+class TestTmsApiClient:
+
+    @allure.title("Create, search and edit polygons over the API")
+    def test_polygon_lifecycle(self, stub_api: TmsApiClient):
+        store_code = stub_api.list_stores(status='Active')[0]['code']
+        name = generate_polygon_name('api_qc_polygon')
+
+        created = stub_api.create_qc_polygon_travel_time(store_code, name, travel_time=18, max_promise_time=15)
+        assert created['name'] == name
+        assert created['status'] == 'Active'
+
+        found = stub_api.find_polygon(store_code, name)
+        assert found is not None and found['id'] == created['id']
+
+        edited = stub_api.change_polygon_to_travel_distance(created['id'], 200)
+        assert edited['polygon']['attributes'] == {'travel_distance': 200}
+
+        assert stub_api.deactivate_polygon(created['id'])['status'] == 'Inactive'
+
+    @allure.title("Toggle store status over the API")
+    def test_store_status_toggle(self, stub_api: TmsApiClient):
+        store_code = stub_api.list_stores(status='Active')[0]['code']
+
+        assert stub_api.deactivate_store(store_code)['status'] == 'Inactive'
+        assert stub_api.activate_store(store_code)['status'] == 'Active'
+
+    @allure.title("Invalid status is rejected before any request is sent")
+    def test_invalid_status_rejected(self, stub_api: TmsApiClient):
+        with pytest.raises(ValueError):
+            stub_api.set_store_status('STR001', 'Paused')
+
+    @allure.title("Errors from the backend surface as assertion failures")
+    def test_unknown_store_raises(self, stub_api: TmsApiClient):
+        with pytest.raises(AssertionError, match="404"):
+            stub_api.get_store('UNKNOWN')
+
+    @allure.title("Preconditions seed polygons and put changed stores back")
+    def test_preconditions_seed_and_restore(self, stub_api: TmsApiClient):
+        preconditions = Preconditions(stub_api)
+        store = stub_api.list_stores(status='Active')[0]
+        assert preconditions.store_code(store['name']) == store['code']
+        assert preconditions.store_code('No such store') is None
+
+        name = preconditions.qc_polygon(store['code'], prefix='seeded_edit')
+        assert name.startswith('seeded_edit_') and stub_api.find_polygon(store['code'], name)['status'] == 'Active'
+
+        preconditions.keep_store_status(store['code'])
+        stub_api.deactivate_store(store['code'])
+        preconditions.keep_store_status(store['code'])
+        preconditions.restore()
+        assert stub_api.get_store(store['code'])['status'] == 'Active'
@@ -0,0 +1,93 @@
+import pytest
+import allure
+import allure_commons
+from utils.tracing import StepTracer
+
+
+class RecordingTracing:
+    # Stands in for BrowserContext.tracing; each saved chunk file holds its title
+
+    def __init__(self):
+        self.calls = []
+        self.title = None
+
+    def start(self, title=None, screenshots=None, snapshots=None):
+        self.calls.append('start')
+        self.title = 'Test start'
+
+    def start_chunk(self, title=None):
+        self.calls.append('start_chunk')
+        self.title = title
+
+    def stop_chunk(self, path=None):
+        self.calls.append('stop_chunk')
+        if path is not None:
+            path.write_text(self.title, encoding='utf-8')
+
+    def stop(self):
+        self.calls.append('stop')
+
+
+@pytest.fixture
+def tracer(tmp_path):
+    def create(mode='retain-on-failure'):
+        tracer = StepTracer(RecordingTracing(), tmp_path / 'traces', mode=mode, chunks_kept=2)
+        tracer.start('test')
+        allure_commons.plugin_manager.register(tracer)
+        tracers.append(tracer)
+        return tracer
+
+    tracers = []
+    yield create
+    for tracer in tracers:
+        if allure_commons.plugin_manager.is_registered(tracer):
+            allure_commons.plugin_manager.unregister(tracer)
+
+
+def run_steps(titles, failing=None):
+    for title in titles:
+        try:
+            with allure.step(title):
+                with allure.step(f"{title} detail"):
+                    if title == failing:
+                        raise AssertionError(title)
+        except AssertionError:
+            return
+
+
+@allure.feature("Tracing")
+class TestTracing:
+
+    def test_passing_test_keeps_no_chunks(self, tracer, tmp_path):
+        step_tracer = tracer()
+        run_steps(["Login", "Open store", "Create polygon"])
+        buffer_dir = step_tracer._buffer_dir
+        assert len(list(buffer_dir.iterdir())) <= 2
+
+        assert step_tracer.finish(failed=False) == []
+        assert not buffer_dir.exists() and not (tmp_path / 'traces').exists()
+        assert step_tracer.tracing.calls[-2:] == ['stop_chunk', 'stop']
+
+    def test_failing_step_keeps_its_chunk_and_the_previous_one(self, tracer):
+        step_tracer = tracer()
+        run_steps(["Login", "Open store", "Create polygon", "Verify polygon"], failing="Create polygon")
+
+        saved = step_tracer.finish(failed=True)
+        assert [path.read_text(encoding='utf-8') for path in saved] == ["Open store", "Create polygon"]
+        assert all(path.parent == step_tracer.output_dir for path in saved)
+
+    def test_failure_outside_steps_keeps_the_last_chunks(self, tracer):
+        step_tracer = tracer()
+        run_steps(["Login", "Open store"])
+
+        saved = step_tracer.finish(failed=True)
+        assert [path.read_text(encoding='utf-8') for path in saved] == ["Login", "Open store"]
+
+    def test_on_mode_keeps_every_chunk(self, tracer):
+        step_tracer = tracer(mode='on')
+        run_steps(["Login", "Open store", "Create polygon"])
+
+        saved = step_tracer.finish(failed=False)
+        assert [path.read_text(encoding='utf-8') for path in saved] == [
+            "Test start", "Login", "Open store", "Create polygon"
+        ]
@@ -0,0 +1,101 @@
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+import allure
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from pages.base_page import BasePage
+from pages.wait_strategy import ResponseWait
+
+
+class RecordingPage:
+    # Stands in for a Playwright page: records waits and answers expect_response only when told to
+
+    def __init__(self, responds: bool):
+        self.responds = responds
+        self.expected: list[str] = []
+        self.load_states: list[str] = []
+        self.waits: list[int] = []
+        self.visible = False
+
+    @contextmanager
+    def expect_response(self, predicate, timeout: int):
+        self.expected.append(timeout)
+        yield SimpleNamespace(value=SimpleNamespace(status=201))
+        if not self.responds:
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded")
+
+    def locator(self, selector: str) -> 'RecordingLocator':
+        return RecordingLocator(self)
+
+    def goto(self, url: str) -> None:
+        pass
+
+    def wait_for_load_state(self, state: str) -> None:
+        self.load_states.append(state)
+
+
+class RecordingLocator:
+
+    def __init__(self, page: RecordingPage):
+        self.page = page
+
+    def is_visible(self) -> bool:
+        return self.page.visible
+
+    def wait_for(self, state: str, timeout: int) -> None:
+        self.page.waits.append(timeout)
+        if not self.page.visible:
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded")
+
+
+class PolygonPage(BasePage):
+
+    WAIT_STRATEGIES = {
+        'create': ResponseWait('POST', 'polygons'),
+        'update': ResponseWait('PUT', 'polygon'),
+    }
+
+
+@pytest.fixture(autouse=True)
+def missed_responses(monkeypatch):
+    monkeypatch.setattr(BasePage, '_missed_responses', set())
+
+
+@allure.feature("Wait Strategy")
+class TestWaitStrategy:
+
+    def test_answered_response_skips_networkidle(self):
+        page = PolygonPage(RecordingPage(responds=True))
+        with page.expect_backend('create'):
+            pass
+        with page.expect_backend('create'):
+            pass
+        assert len(page.page.expected) == 2 and page.page.load_states == []
+
+    def test_missed_response_is_not_waited_on_again(self):
+        first = PolygonPage(RecordingPage(responds=False))
+        with first.expect_backend('create'):
+            pass
+        assert len(first.page.expected) == 1 and first.page.load_states == ['networkidle']
+
+        # A later page in the same session goes straight to networkidle for that endpoint only
+        second = PolygonPage(RecordingPage(responds=True))
+        with second.expect_backend('create'):
+            pass
+        with second.expect_backend('update'):
+            pass
+        assert len(second.page.expected) == 1 and second.page.load_states == ['networkidle']
+
+    def test_navigate_without_strategy_waits_for_load_state(self):
+        page = PolygonPage(RecordingPage(responds=True))
+        page.navigate('http://tms.test/')
+        assert page.page.expected == [] and page.page.load_states == ['networkidle']
+
+    def test_is_visible_only_waits_when_given_a_timeout(self):
+        page = PolygonPage(RecordingPage(responds=True))
+        assert not page.is_visible('h4') and page.page.waits == []
+        assert not page.is_visible('h4', timeout=5000) and page.page.waits == [5000]
+
+        page.page.visible = True
+        assert page.is_visible('h4') and page.is_visible('h4', timeout=5000)
@@ -0,0 +1,69 @@
+import pytest
+import allure
+from utils.workflow import Workflow, load_checkpoint
+
+
+class RecordingPage:
+
+    class Context:
+        def storage_state(self) -> dict:
+            return {'cookies': [{'name': 'session', 'value': 'abc'}], 'origins': []}
+
+    def __init__(self, url: str = 'https://example.test/stores/STR001'):
+        self.url = url
+        self.context = self.Context()
+        self.visited = []
+
+    def goto(self, url: str) -> None:
+        self.visited.append(url)
+
+
+def build_workflow(tmp_path, checkpoint=None, fail_at=None):
+    workflow = Workflow('test_workflow[chromium]', checkpoint_dir=tmp_path, checkpoint=checkpoint)
+    ran = []
+
+    for number, requires in ((1, ()), (2, (1,)), (3, (2,)), (4, (1,))):
+        def run_step(state: dict, number=number) -> None:
+            ran.append(number)
+            state.setdefault('created', []).append(f'polygon_{number}')
+            assert number != fail_at, f"Step {number} failed"
+        workflow.step(number, f"Step title {number}", requires=requires)(run_step)
+
+    return workflow, ran
+
+
+@allure.feature("Workflow Checkpoints")
+class TestWorkflow:
+
+    def test_failed_run_resumes_from_last_checkpoint(self, tmp_path):
+        workflow, ran = build_workflow(tmp_path, fail_at=3)
+        with pytest.raises(AssertionError):
+            workflow.run(RecordingPage())
+        assert ran == [1, 2, 3]
+
+        checkpoint = load_checkpoint(tmp_path, 'test_workflow[chromium]', resume_from=3)
+        assert checkpoint['step'] == 2
+        assert checkpoint['storage_state']['cookies'][0]['value'] == 'abc'
+
+        page = RecordingPage()
+        resumed, ran = build_workflow(tmp_path, checkpoint=checkpoint)
+        resumed.run(page, resume_from=3)
+
+        assert ran == [3, 4]
+        assert page.visited == ['https://example.test/stores/STR001']
+        assert resumed.state['created'] == ['polygon_1', 'polygon_2', 'polygon_3', 'polygon_4']
+
+    def test_resume_rejects_checkpoint_missing_dependencies(self, tmp_path):
+        workflow, _ = build_workflow(tmp_path)
+        workflow.run(RecordingPage())
+
+        checkpoint = load_checkpoint(tmp_path, 'test_workflow[chromium]', resume_from=2)
+        resumed, ran = build_workflow(tmp_path, checkpoint=checkpoint)
+        with pytest.raises(ValueError, match=r"missing steps \[2\]"):
+            resumed.run(RecordingPage(), resume_from=3)
+        assert ran == []
+
+    def test_steps_must_require_registered_steps(self, tmp_path):
+        workflow = Workflow('test_workflow', checkpoint_dir=tmp_path)
+        with pytest.raises(ValueError, match="unknown steps"):
+            workflow.step(2, "Depends on a later step", requires=(3,))(lambda state: None)
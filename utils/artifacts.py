@@ -0,0 +1,133 @@
+import hashlib
+import re
+import struct
+import threading
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_all
+from pathlib import Path
+from typing import Optional
+import allure
+from utils.config_manager import ConfigManager
+from utils.helpers import worker_path
+from utils.logger import Logger
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+ATTACHMENT_TYPES = {
+    'png': allure.attachment_type.PNG,
+    'jpeg': allure.attachment_type.JPG,
+}
+
+
+def recompress_png(data: bytes, level: int) -> bytes:
+    # Browsers encode screenshots for speed; re-deflating the image data at a higher level shrinks them losslessly
+    if not data.startswith(PNG_SIGNATURE):
+        return data
+
+    chunks, image_data = [], []
+    position = len(PNG_SIGNATURE)
+    while position < len(data):
+        length, kind = struct.unpack('>I4s', data[position:position + 8])
+        body = data[position + 8:position + 8 + length]
+        position += length + 12
+        if kind == b'IDAT':
+            if not image_data:
+                chunks.append((kind, None))
+            image_data.append(body)
+        else:
+            chunks.append((kind, body))
+
+    original = b''.join(image_data)
+    compressed = zlib.compress(zlib.decompress(original), level)
+    if len(compressed) >= len(original):
+        return data
+
+    output = [PNG_SIGNATURE]
+    for kind, body in chunks:
+        body = compressed if body is None else body
+        output.append(struct.pack('>I', len(body)) + kind + body + struct.pack('>I', zlib.crc32(kind + body)))
+    return b''.join(output)
+
+
+class ArtifactPipeline:
+    _instance: Optional['ArtifactPipeline'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ArtifactPipeline, cls).__new__(cls)
+            cls._instance._initialize_pipeline()
+        return cls._instance
+
+    def _initialize_pipeline(self) -> None:
+        config = ConfigManager()
+        self.logger = Logger()
+        self.directory = config.screenshots_path
+        self.image_format = config.screenshot_format
+        self.quality = config.screenshot_quality
+        self.scale = config.screenshot_scale
+        self.png_compression = config.png_compression_level
+        self._executor = ThreadPoolExecutor(max_workers=config.artifact_workers, thread_name_prefix='artifacts')
+        self._lock = threading.Lock()
+        self._saved: dict[str, Path] = {}
+        self._pending: list[Future] = []
+        self.duplicates = 0
+
+    def screenshot_options(self, full_page: bool = False, element: bool = False) -> dict:
+        options = {'type': self.image_format, 'scale': self.scale}
+        if self.image_format == 'jpeg':
+            options['quality'] = self.quality
+        if full_page and not element:
+            options['full_page'] = True
+        return options
+
+    def screenshot(self, page, name: str, selector: Optional[str] = None, full_page: bool = False) -> Future:
+        # Clipping to an element captures and encodes only that element's box
+        target = page.locator(selector) if selector else page
+        data = target.screenshot(**self.screenshot_options(full_page, element=selector is not None))
+        return self.publish(data, name)
+
+    def publish(self, data: bytes, name: str) -> Future:
+        # Attach from memory on the calling thread; hashing, compression and the disk write happen in the pool
+        allure.attach(data, name=name, attachment_type=ATTACHMENT_TYPES[self.image_format])
+        future = self._executor.submit(self._persist, data, name)
+        with self._lock:
+            self._pending.append(future)
+        return future
+
+    def _persist(self, data: bytes, name: str) -> Path:
+        digest = hashlib.sha256(data).hexdigest()
+        safe_name = re.sub(r'[^A-Za-z0-9_.-]+', '_', name).strip('_') or 'screenshot'
+        extension = 'jpg' if self.image_format == 'jpeg' else 'png'
+        with self._lock:
+            existing = self._saved.get(digest)
+            if existing is None:
+                path = self._saved[digest] = worker_path(self.directory) / f"{safe_name}_{digest[:16]}.{extension}"
+            else:
+                self.duplicates += 1
+        if existing is not None:
+            self.logger.debug("Screenshot '%s' is identical to %s, not saved again", name, existing)
+            return existing
+
+        try:
+            if self.image_format == 'png' and self.png_compression:
+                data = recompress_png(data, self.png_compression)
+            path.write_bytes(data)
+        except Exception:
+            # Otherwise every later identical screenshot would point at a file that was never written
+            with self._lock:
+                self._saved.pop(digest, None)
+            raise
+        self.logger.info("Screenshot saved: %s", path)
+        return path
+
+    def wait(self) -> list[Path]:
+        # Blocks until every queued screenshot is on disk
+        with self._lock:
+            pending, self._pending = self._pending, []
+        wait_all(pending)
+        paths = []
+        for future in pending:
+            if future.exception() is not None:
+                self.logger.error("Failed to save screenshot: %s", future.exception())
+            else:
+                paths.append(future.result())
+        return paths
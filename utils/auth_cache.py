@@ -0,0 +1,105 @@
+import json
+import time
+from pathlib import Path
+from typing import Optional
+from playwright.sync_api import Browser, BrowserContext
+from utils.config_manager import ConfigManager
+from utils.logger import Logger
+from utils.browser_manager import BrowserManager
+from utils.helpers import get_worker_id
+from pages.login_page import LoginPage
+from pages.home_page import HomePage
+
+
+class AuthCache:
+    _instance: Optional['AuthCache'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(AuthCache, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self) -> None:
+        self.config = ConfigManager()
+        self.logger = Logger()
+        self._state: Optional[dict] = None
+
+    @property
+    def state_path(self) -> Path:
+        return self.config.auth_state_dir / f"storage_state_{get_worker_id()}.json"
+
+    def get_storage_state(self, browser: Browser) -> dict:
+        if self._state is not None:
+            return self._state
+
+        state = self._load()
+        if state is not None and not self._probe(browser, state):
+            self.logger.info("Cached session is no longer valid, logging in again")
+            state = None
+
+        if state is None:
+            state = self._login(browser)
+
+        self._state = state
+        return state
+
+    def invalidate(self) -> None:
+        self.logger.info("Invalidating cached authenticated session")
+        self._state = None
+        self.state_path.unlink(missing_ok=True)
+
+    def _load(self) -> Optional[dict]:
+        path = self.state_path
+        if not path.exists():
+            return None
+
+        age = time.time() - path.stat().st_mtime
+        if age > self.config.auth_state_ttl:
+            self.logger.info("Cached session expired (%.0fs old, TTL %ss)", age, self.config.auth_state_ttl)
+            return None
+
+        try:
+            return json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            self.logger.warning("Could not read cached session %s: %s", path, e)
+            return None
+
+    def _new_context(self, browser: Browser, storage_state: Optional[dict] = None) -> BrowserContext:
+        context = browser.new_context(**BrowserManager.CONTEXT_OPTIONS, storage_state=storage_state)
+        context.set_default_timeout(self.config.timeout)
+        return context
+
+    def _probe(self, browser: Browser, state: dict) -> bool:
+        context = self._new_context(browser, state)
+        try:
+            page = context.new_page()
+            page.goto(self.config.base_url)
+
+            login_form = page.locator(LoginPage.EMAIL_INPUT)
+            home_nav = page.locator(HomePage.STORES_NAV)
+            login_form.or_(home_nav).first.wait_for(state='visible')
+            return home_nav.is_visible() and "/login" not in page.url
+        except Exception as e:
+            self.logger.warning("Session probe failed: %s", e)
+            return False
+        finally:
+            context.close()
+
+    def _login(self, browser: Browser) -> dict:
+        self.logger.info("Logging in once to cache session for: %s", self.config.username)
+        context = self._new_context(browser)
+        try:
+            page = context.new_page()
+            login_page = LoginPage(page)
+            login_page.navigate_to_login()
+            login_page.login(self.config.username, self.config.password)
+            page.locator(HomePage.STORES_NAV).wait_for(state='visible')
+
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            state = context.storage_state(path=self.state_path)
+        finally:
+            context.close()
+
+        self.logger.info("Cached authenticated session at: %s", self.state_path)
+        return state
@@ -0,0 +1,135 @@
+from typing import Optional
+from playwright.sync_api import Playwright, Browser, BrowserContext
+from utils.config_manager import ConfigManager
+from utils.logger import Logger
+
+
+class BrowserManager:
+    _instance: Optional['BrowserManager'] = None
+
+    CONTEXT_OPTIONS = {
+        'viewport': {"width": 1366, "height": 768},
+        'accept_downloads': True,
+        'permissions': ['geolocation'],
+        'geolocation': {
+            'latitude': 40.7128,
+            'longitude': -74.0060,
+            'accuracy': 100
+        }
+    }
+
+    BLANK_PAGE = "<!DOCTYPE html><html><head></head><body></body></html>"
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(BrowserManager, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self) -> None:
+        self.config = ConfigManager()
+        self.logger = Logger()
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._idle_contexts: list[BrowserContext] = []
+        self._disposable_contexts: set[int] = set()
+
+    @property
+    def pooling_enabled(self) -> bool:
+        return self.config.browser_pooling
+
+    def start(self, playwright: Playwright) -> None:
+        self._playwright = playwright
+        mode = "pooled" if self.pooling_enabled else "isolated"
+        self.logger.info("Browser manager started in %s mode", mode)
+
+    def launch_browser(self) -> Browser:
+        browser_type = getattr(self._playwright, self.config.browser)
+        return browser_type.launch(
+            headless=self.config.headless,
+            slow_mo=self.config.slow_mo
+        )
+
+    def get_browser(self) -> Browser:
+        if self._browser is None or not self._browser.is_connected():
+            self.logger.info("Launching pooled browser...")
+            self._browser = self.launch_browser()
+        return self._browser
+
+    def acquire_context(self, browser: Browser, storage_state: Optional[dict] = None, **overrides) -> BrowserContext:
+        if self.pooling_enabled and not overrides and self._idle_contexts:
+            context = self._idle_contexts.pop()
+            self.logger.info("Reusing pooled browser context")
+            if storage_state:
+                self.apply_storage_state(context, storage_state)
+        else:
+            context = browser.new_context(**{**self.CONTEXT_OPTIONS, **overrides}, storage_state=storage_state)
+            if overrides:
+                self._disposable_contexts.add(id(context))
+
+        context.set_default_timeout(self.config.timeout)
+        return context
+
+    def release_context(self, context: BrowserContext) -> None:
+        disposable = id(context) in self._disposable_contexts
+        self._disposable_contexts.discard(id(context))
+
+        if not self.pooling_enabled or disposable or len(self._idle_contexts) >= self.config.context_pool_size:
+            context.close()
+            return
+
+        try:
+            self._reset_context(context)
+        except Exception as e:
+            self.logger.warning("Discarding browser context that failed to reset: %s", e)
+            context.close()
+            return
+
+        self._idle_contexts.append(context)
+
+    def shutdown(self) -> None:
+        for context in self._idle_contexts:
+            context.close()
+        self._idle_contexts.clear()
+
+        if self._browser is not None:
+            self.logger.info("Closing pooled browser...")
+            self._browser.close()
+            self._browser = None
+
+    def run_on_origins(self, context: BrowserContext, origins: list, script: str, arg=None) -> None:
+        # Each origin is loaded from a locally fulfilled blank document, so no request reaches the server
+        page = context.new_page()
+        page.route("**/*", lambda route: route.fulfill(status=200, content_type="text/html", body=self.BLANK_PAGE))
+        try:
+            for origin in origins:
+                page.goto(origin)
+                page.evaluate(script, arg)
+        finally:
+            page.close()
+
+    def apply_storage_state(self, context: BrowserContext, storage_state: dict) -> None:
+        context.add_cookies(storage_state.get('cookies', []))
+        for origin in storage_state.get('origins', []):
+            self.run_on_origins(
+                context,
+                [origin['origin']],
+                "(items) => items.forEach(({ name, value }) => localStorage.setItem(name, value))",
+                origin.get('localStorage', [])
+            )
+
+    def _reset_context(self, context: BrowserContext) -> None:
+        for page in list(context.pages):
+            page.close()
+
+        origins = [origin['origin'] for origin in context.storage_state()['origins']]
+        if origins:
+            self.run_on_origins(context, origins, "() => { localStorage.clear(); sessionStorage.clear(); }")
+
+        context.unroute_all(behavior='ignoreErrors')
+        context.clear_cookies()
+        context.clear_permissions()
+        context.grant_permissions(self.CONTEXT_OPTIONS['permissions'])
+        context.set_geolocation(self.CONTEXT_OPTIONS['geolocation'])
+        context.set_extra_http_headers({})
+        context.set_offline(False)
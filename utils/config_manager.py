@@ -1,6 +1,22 @@
 import configparser
+import logging
+import os
+import re
 from pathlib import Path
 from typing import Optional
+from urllib.parse import quote
+
+ENV_PREFIX = 'TMS_'
+PROFILE_ENV = 'TMS_PROFILE'
+
+
+def parse_setting(setting: str) -> tuple[str, str, str]:
+    # "APP.slow_mo=0" -> ('APP', 'slow_mo', '0')
+    name, separator, value = setting.partition('=')
+    section, dot, key = name.strip().partition('.')
+    if not separator or not dot or not section or not key:
+        raise ValueError(f"Setting must look like SECTION.key=value: {setting!r}")
+    return section.upper(), key.strip().lower(), value.strip()
 
 
 class ConfigManager:
@@ -14,13 +30,57 @@ class ConfigManager:
         return cls._instance
     
     def _initialize_config(self) -> None:
-        self._config = configparser.ConfigParser()
-        config_path = Path(__file__).parent.parent / 'config' / 'config.ini'
-        
-        if not config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
-        
-        self._config.read(config_path)
+        config_dir = Path(__file__).parent.parent / 'config'
+        self.config_path = config_dir / 'config.ini'
+        self.profiles_path = config_dir / 'profiles.ini'
+        self.profile: Optional[str] = None
+        self.load(profile=os.environ.get(PROFILE_ENV) or None)
+
+    def load(self, profile: Optional[str] = None, overrides: Optional[list[str]] = None) -> None:
+        # Later layers win: config.ini, then the profile, then TMS_SECTION__KEY variables, then CLI settings
+        if not self.config_path.exists():
+            raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
+
+        config = configparser.ConfigParser()
+        config.read(self.config_path)
+
+        layers = []
+        if profile:
+            layers.append(self.profile_settings(profile))
+        layers.append(self.environment_settings())
+        layers.append([parse_setting(setting) for setting in overrides or []])
+        for settings in layers:
+            for section, key, value in settings:
+                if not config.has_section(section):
+                    config.add_section(section)
+                config.set(section, key, value)
+
+        self._config = config
+        self.profile = profile
+
+    def _read_profiles(self) -> configparser.ConfigParser:
+        profiles = configparser.ConfigParser()
+        profiles.read(self.profiles_path)
+        return profiles
+
+    @property
+    def profile_names(self) -> list[str]:
+        return self._read_profiles().sections()
+
+    def profile_settings(self, profile: str) -> list[tuple[str, str, str]]:
+        profiles = self._read_profiles()
+        if not profiles.has_section(profile):
+            raise ValueError(f"Unknown config profile '{profile}', expected one of: {', '.join(profiles.sections())}")
+        return [parse_setting(f"{name}={value}") for name, value in profiles.items(profile, raw=True)]
+
+    @staticmethod
+    def environment_settings() -> list[tuple[str, str, str]]:
+        settings = []
+        for name, value in sorted(os.environ.items()):
+            section, separator, key = name[len(ENV_PREFIX):].partition('__')
+            if name.startswith(ENV_PREFIX) and separator and section and key:
+                settings.append((section.upper(), key.lower(), value))
+        return settings
     
     def get(self, section: str, key: str, fallback: str = None) -> str:
         return self._config.get(section, key, fallback=fallback)
@@ -28,6 +88,9 @@ class ConfigManager:
     def get_int(self, section: str, key: str, fallback: int = None) -> int:
         return self._config.getint(section, key, fallback=fallback)
     
+    def get_float(self, section: str, key: str, fallback: float = None) -> float:
+        return self._config.getfloat(section, key, fallback=fallback)
+
     def get_boolean(self, section: str, key: str, fallback: bool = None) -> bool:
         return self._config.getboolean(section, key, fallback=fallback)
     
@@ -43,10 +106,22 @@ class ConfigManager:
     def headless(self) -> bool:
         return self.get_boolean('APP', 'headless', False)
     
+    @property
+    def slow_mo(self) -> int:
+        return self.get_int('APP', 'slow_mo', 100)
+
     @property
     def timeout(self) -> int:
         return self.get_int('APP', 'timeout', 30000)
     
+    @property
+    def browser_pooling(self) -> bool:
+        return self.get_boolean('APP', 'browser_pooling', False)
+
+    @property
+    def context_pool_size(self) -> int:
+        return self.get_int('APP', 'context_pool_size', 1)
+
     @property
     def username(self) -> str:
         return self.get('CREDENTIALS', 'username')
@@ -55,6 +130,199 @@ class ConfigManager:
     def password(self) -> str:
         return self.get('CREDENTIALS', 'password')
     
+    @property
+    def reuse_auth_session(self) -> bool:
+        return self.get_boolean('AUTH', 'reuse_session', False)
+
+    @property
+    def auth_state_ttl(self) -> int:
+        return self.get_int('AUTH', 'storage_state_ttl', 1800)
+
+    @property
+    def auth_state_dir(self) -> Path:
+        base_path = Path(__file__).parent.parent
+        return base_path / self.get('AUTH', 'storage_state_dir', '.auth')
+
+    @property
+    def store_index_enabled(self) -> bool:
+        return self.get_boolean('STORE_INDEX', 'enabled', False)
+
+    @property
+    def store_index_ttl(self) -> int:
+        return self.get_int('STORE_INDEX', 'ttl', 900)
+
+    @property
+    def store_index_path(self) -> Path:
+        base_path = Path(__file__).parent.parent
+        return base_path / self.get('STORE_INDEX', 'path', '.cache/store_index.json')
+
+    @property
+    def api_base_url(self) -> str:
+        return self.get('API', 'base_url')
+
+    def api_path(self, name: str, **params) -> str:
+        template = self.get('API', f'{name}_path')
+        if template is None:
+            raise KeyError(f"No API path configured for: {name}")
+        return template.format(**params)
+
+    def get_list(self, section: str, key: str, fallback: Optional[list] = None) -> list:
+        value = self.get(section, key)
+        if value is None:
+            return fallback if fallback is not None else []
+        return [item.strip() for item in value.split(',') if item.strip()]
+
+    def api_path_pattern(self, name: str) -> str:
+        template = re.escape(self.api_path(name, store_code='__store_code__', polygon_id='__polygon_id__'))
+        return re.sub(r'__(store_code|polygon_id)__', r'(?P<\1>[^/]+)', template)
+
+    @property
+    def checkpoints_enabled(self) -> bool:
+        return self.get_boolean('CHECKPOINTS', 'enabled', False)
+
+    @property
+    def checkpoint_dir(self) -> Path:
+        base_path = Path(__file__).parent.parent
+        return base_path / self.get('CHECKPOINTS', 'dir', '.checkpoints')
+
+    @property
+    def fanout_concurrency(self) -> int:
+        return self.get_int('FANOUT', 'concurrency', 4)
+
+    @property
+    def fanout_store_status(self) -> str:
+        return self.get('FANOUT', 'store_status', 'Active')
+
+    @property
+    def fanout_max_stores(self) -> int:
+        return self.get_int('FANOUT', 'max_stores', 0)
+
+    @property
+    def fanout_results_dir(self) -> Path:
+        base_path = Path(__file__).parent.parent
+        return base_path / self.get('FANOUT', 'results_dir', 'reports/fanout')
+
+    def store_url(self, store_code: str, base_url: Optional[str] = None) -> str:
+        template = self.get('FANOUT', 'store_url', '{base_url}stores/{store_code}')
+        return template.format(base_url=base_url or self.base_url, store_code=quote(store_code, safe=''))
+
+    @property
+    def wait_strategy(self) -> str:
+        return self.get('WAITS', 'strategy', 'response')
+
+    @property
+    def response_timeout(self) -> int:
+        return self.get_int('WAITS', 'response_timeout', 5000)
+
+    @property
+    def step_timing_enabled(self) -> bool:
+        return self.get_boolean('TIMING', 'enabled', False)
+
+    @property
+    def step_timing_dir(self) -> Path:
+        base_path = Path(__file__).parent.parent
+        return base_path / self.get('TIMING', 'store_dir', 'reports/step_timings')
+
+    @property
+    def har_mode(self) -> str:
+        return self.get('NETWORK', 'har_mode', 'off')
+
+    @property
+    def har_dir(self) -> Path:
+        base_path = Path(__file__).parent.parent
+        return base_path / self.get('NETWORK', 'har_dir', 'hars')
+
+    @property
+    def har_not_found(self) -> str:
+        return self.get('NETWORK', 'har_not_found', 'abort')
+
+    @property
+    def har_volatile_params(self) -> list:
+        return self.get_list('NETWORK', 'har_volatile_params')
+
+    @property
+    def log_format(self) -> str:
+        return self.get('LOGGING', 'format', 'text').lower()
+
+    @property
+    def log_location(self) -> bool:
+        return self.get_boolean('LOGGING', 'location', False)
+
+    @property
+    def log_file_level(self) -> int:
+        return logging.getLevelName(self.get('LOGGING', 'file_level', 'DEBUG').upper())
+
+    @property
+    def log_console_level(self) -> int:
+        return logging.getLevelName(self.get('LOGGING', 'console_level', 'INFO').upper())
+
+    @property
+    def screenshot_format(self) -> str:
+        return self.get('ARTIFACTS', 'screenshot_format', 'png').lower()
+
+    @property
+    def screenshot_quality(self) -> int:
+        return self.get_int('ARTIFACTS', 'jpeg_quality', 80)
+
+    @property
+    def screenshot_scale(self) -> str:
+        return self.get('ARTIFACTS', 'scale', 'css')
+
+    @property
+    def png_compression_level(self) -> int:
+        return self.get_int('ARTIFACTS', 'png_compression', 9)
+
+    @property
+    def artifact_workers(self) -> int:
+        return self.get_int('ARTIFACTS', 'workers', 2)
+
+    @property
+    def tracing_mode(self) -> str:
+        return self.get('TRACING', 'mode', 'off')
+
+    @property
+    def trace_chunks_kept(self) -> int:
+        return self.get_int('TRACING', 'chunks_kept', 2)
+
+    @property
+    def traces_path(self) -> Path:
+        base_path = Path(__file__).parent.parent
+        return base_path / self.get('TRACING', 'dir', 'traces')
+
+    @property
+    def selector_snapshots(self) -> bool:
+        return self.get_boolean('SELECTORS', 'snapshots', False)
+
+    @property
+    def selector_snapshot_dir(self) -> Path:
+        base_path = Path(__file__).parent.parent
+        return base_path / self.get('SELECTORS', 'snapshot_dir', 'reports/selector_snapshots')
+
+    @property
+    def selector_snapshots_per_page(self) -> int:
+        return self.get_int('SELECTORS', 'snapshots_per_page', 5)
+
+    @property
+    def selector_profile_repeat(self) -> int:
+        return self.get_int('SELECTORS', 'profile_repeat', 50)
+
+    @property
+    def export_strict(self) -> bool:
+        return self.get_boolean('EXPORT', 'strict', False)
+
+    @property
+    def export_required_columns(self) -> list[str]:
+        return [column.strip() for column in self.get('EXPORT', 'required_columns', '').split(',') if column.strip()]
+
+    @property
+    def export_name_column(self) -> str:
+        return self.get('EXPORT', 'name_column', 'Polygon Name')
+
+    @property
+    def export_history_dir(self) -> Path:
+        base_path = Path(__file__).parent.parent
+        return base_path / self.get('EXPORT', 'history_dir', 'reports/exports')
+
     @property
     def downloads_path(self) -> Path:
         base_path = Path(__file__).parent.parent
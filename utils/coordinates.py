@@ -0,0 +1,213 @@
+import itertools
+import tempfile
+from pathlib import Path
+from typing import Iterator
+import numpy as np
+from utils.helpers import worker_path
+
+LATITUDE_COLUMNS = ('latitude', 'lat')
+LONGITUDE_COLUMNS = ('longitude', 'lng', 'lon', 'long')
+LATITUDE_RANGE = (-90.0, 90.0)
+LONGITUDE_RANGE = (-180.0, 180.0)
+CHUNK_ROWS = 65536
+PRECISION = 7
+MAX_REPORTED = 5
+MAX_GRID_CELLS = 1_000_000
+MAX_SEGMENT_CELLS = 64
+
+
+class CoordinateError(ValueError):
+    pass
+
+
+def _column_indexes(header: list[str]) -> tuple[int, int] | None:
+    names = [column.strip().strip('"').lower() for column in header]
+    lat = next((names.index(name) for name in LATITUDE_COLUMNS if name in names), None)
+    lng = next((names.index(name) for name in LONGITUDE_COLUMNS if name in names), None)
+    if lat is None and lng is None:
+        return None
+    if lat is None or lng is None:
+        raise CoordinateError(f"CSV header needs both a latitude and a longitude column: {header}")
+    return lat, lng
+
+
+def iter_coordinate_chunks(csv_path: str | Path, chunk_rows: int = CHUNK_ROWS) -> Iterator[np.ndarray]:
+    # Yields (n, 2) arrays of [latitude, longitude]; only one chunk of lines is held in memory at a time
+    with open(csv_path, 'r', encoding='utf-8-sig') as file:
+        first_line = file.readline()
+        columns = _column_indexes(first_line.split(','))
+        if columns:
+            lines, row = file, 2
+        else:
+            # Files without a header are read as latitude,longitude
+            lines, row, columns = itertools.chain([first_line], file), 1, (0, 1)
+
+        while True:
+            chunk = list(itertools.islice(lines, chunk_rows))
+            if not chunk:
+                return
+            try:
+                values = np.loadtxt(chunk, delimiter=',', usecols=columns, ndmin=2, dtype=np.float64)
+            except ValueError as error:
+                raise CoordinateError(f"{csv_path}: invalid coordinates in rows {row}-{row + len(chunk) - 1}: {error}") from error
+            row += len(chunk)
+            if len(values):
+                yield values
+
+
+def load_coordinates(csv_path: str | Path, chunk_rows: int = CHUNK_ROWS) -> np.ndarray:
+    chunks = list(iter_coordinate_chunks(csv_path, chunk_rows))
+    return np.concatenate(chunks) if chunks else np.empty((0, 2))
+
+
+def _orientation(p: np.ndarray, q: np.ndarray, r: np.ndarray) -> np.ndarray:
+    return (q[:, 0] - p[:, 0]) * (r[:, 1] - p[:, 1]) - (q[:, 1] - p[:, 1]) * (r[:, 0] - p[:, 0])
+
+
+def _on_segment(p: np.ndarray, q: np.ndarray, r: np.ndarray) -> np.ndarray:
+    return (
+        (np.minimum(p[:, 0], q[:, 0]) <= r[:, 0]) & (r[:, 0] <= np.maximum(p[:, 0], q[:, 0]))
+        & (np.minimum(p[:, 1], q[:, 1]) <= r[:, 1]) & (r[:, 1] <= np.maximum(p[:, 1], q[:, 1]))
+    )
+
+
+def _candidate_pairs(starts: np.ndarray, ends: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # Buckets segment bounding boxes into a uniform grid; only segments sharing a cell are tested against each other
+    count = len(starts)
+    origin = np.minimum(starts, ends).min(axis=0)
+    span = np.maximum(starts, ends).max(axis=0) - origin
+    # Cells about twice a typical segment long keep buckets small along a dense boundary
+    size = np.maximum(2 * np.median(np.abs(ends - starts), axis=0), span / MAX_GRID_CELLS)
+    size = np.where(size > 0, size, 1.0)
+    cells = np.minimum(span // size, MAX_GRID_CELLS - 1).astype(np.int64) + 1
+
+    low = np.minimum(((np.minimum(starts, ends) - origin) // size).astype(np.int64), cells - 1)
+    high = np.minimum(((np.maximum(starts, ends) - origin) // size).astype(np.int64), cells - 1)
+    heights = high[:, 1] - low[:, 1] + 1
+    covered = (high[:, 0] - low[:, 0] + 1) * heights
+
+    # Segments spanning many cells are paired with every other segment instead of being bucketed
+    long_segments = np.flatnonzero(covered > MAX_SEGMENT_CELLS)
+    covered[long_segments] = 0
+    long_left = np.repeat(long_segments, count)
+    long_right = np.tile(np.arange(count), len(long_segments))
+
+    segment = np.repeat(np.arange(count), covered)
+    offset = np.arange(len(segment)) - np.repeat(np.cumsum(covered) - covered, covered)
+    cell_x = low[segment, 0] + offset // heights[segment]
+    cell_y = low[segment, 1] + offset % heights[segment]
+    cell = cell_x * cells[1] + cell_y
+
+    order = np.lexsort((segment, cell))
+    cell, segment = cell[order], segment[order]
+    group_starts = np.flatnonzero(np.r_[True, cell[1:] != cell[:-1]])
+    group_sizes = np.diff(np.r_[group_starts, len(cell)])
+
+    # Every member of a cell is paired with each member after it in the same cell
+    position = np.arange(len(cell)) - np.repeat(group_starts, group_sizes)
+    partners = np.repeat(group_sizes, group_sizes) - 1 - position
+    first = np.repeat(np.arange(len(cell)), partners)
+    second = first + 1 + np.arange(len(first)) - np.repeat(np.cumsum(partners) - partners, partners)
+
+    left, right = np.r_[segment[first], long_left], np.r_[segment[second], long_right]
+    left, right = left[left != right], right[left != right]
+    pairs = np.unique(np.minimum(left, right) * count + np.maximum(left, right))
+    return pairs // count, pairs % count
+
+
+def find_self_intersections(ring: np.ndarray) -> np.ndarray:
+    # Segment i joins vertex i to vertex i + 1, wrapping around; returns (k, 2) intersecting segment indexes
+    count = len(ring)
+    if count < 4:
+        return np.empty((0, 2), dtype=np.int64)
+
+    starts, ends = ring, np.roll(ring, -1, axis=0)
+    left, right = _candidate_pairs(starts, ends)
+    neighbours = (right - left == 1) | ((left == 0) & (right == count - 1))
+    left, right = left[~neighbours], right[~neighbours]
+
+    p1, q1, p2, q2 = starts[left], ends[left], starts[right], ends[right]
+    o1, o2 = _orientation(p1, q1, p2), _orientation(p1, q1, q2)
+    o3, o4 = _orientation(p2, q2, p1), _orientation(p2, q2, q1)
+
+    crossing = (np.sign(o1) * np.sign(o2) < 0) & (np.sign(o3) * np.sign(o4) < 0)
+    touching = (
+        ((o1 == 0) & _on_segment(p1, q1, p2)) | ((o2 == 0) & _on_segment(p1, q1, q2))
+        | ((o3 == 0) & _on_segment(p2, q2, p1)) | ((o4 == 0) & _on_segment(p2, q2, q1))
+    )
+    hits = crossing | touching
+    return np.column_stack((left[hits], right[hits]))
+
+
+class CoordinateReport:
+
+    def __init__(self, points: np.ndarray):
+        self.count = len(points)
+        latitudes, longitudes = points[:, 0], points[:, 1]
+        self.out_of_range = np.flatnonzero(
+            ~np.isfinite(points).all(axis=1)
+            | (latitudes < LATITUDE_RANGE[0]) | (latitudes > LATITUDE_RANGE[1])
+            | (longitudes < LONGITUDE_RANGE[0]) | (longitudes > LONGITUDE_RANGE[1])
+        )
+
+        self.closed = self.count > 1 and bool((points[0] == points[-1]).all())
+        ring = points[:-1] if self.closed else points
+
+        # Repeated consecutive vertices are harmless and dropped from the ring; repeats elsewhere make it touch itself
+        repeated = (ring == np.roll(ring, 1, axis=0)).all(axis=1) if len(ring) > 1 else np.zeros(len(ring), dtype=bool)
+        self.consecutive_duplicates = int(repeated.sum())
+        self.ring = ring[~repeated]
+
+        ordered = self.ring[np.lexsort((self.ring[:, 1], self.ring[:, 0]))]
+        repeats = (ordered[1:] == ordered[:-1]).all(axis=1)
+        self.duplicates = ordered[1:][repeats & ~np.r_[False, repeats[:-1]]]
+        self.self_intersections = (
+            find_self_intersections(self.ring) if not len(self.out_of_range) else np.empty((0, 2), dtype=np.int64)
+        )
+
+    @property
+    def errors(self) -> list[str]:
+        errors = []
+        if len(self.out_of_range):
+            errors.append(f"{len(self.out_of_range)} points outside latitude {LATITUDE_RANGE} / longitude "
+                          f"{LONGITUDE_RANGE}, first at rows {(self.out_of_range[:MAX_REPORTED] + 1).tolist()}")
+        if len(self.ring) < 3:
+            errors.append(f"Polygon needs at least 3 distinct vertices, got {len(self.ring)}")
+        if len(self.duplicates):
+            errors.append(f"{len(self.duplicates)} repeated vertices, e.g. {self.duplicates[:MAX_REPORTED].tolist()}")
+        if len(self.self_intersections):
+            errors.append(f"{len(self.self_intersections)} self-intersections between segments "
+                          f"{self.self_intersections[:MAX_REPORTED].tolist()}")
+        return errors
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+    def summary(self) -> str:
+        status = 'valid' if self.is_valid else '; '.join(self.errors)
+        return f"{self.count} points ({'closed' if self.closed else 'open'} ring): {status}"
+
+
+def validate_coordinates(points: np.ndarray) -> CoordinateReport:
+    return CoordinateReport(np.asarray(points, dtype=np.float64).reshape(-1, 2))
+
+
+def validate_coordinates_file(csv_path: str | Path) -> CoordinateReport:
+    return validate_coordinates(load_coordinates(csv_path))
+
+
+def write_normalized_csv(ring: np.ndarray, csv_path: str | Path, close_ring: bool = False) -> Path:
+    ring = np.round(np.asarray(ring, dtype=np.float64), PRECISION)
+    if close_ring and len(ring):
+        ring = np.vstack((ring, ring[:1]))
+    np.savetxt(csv_path, ring, delimiter=',', header='latitude,longitude', comments='', fmt=f'%.{PRECISION}f')
+    return Path(csv_path)
+
+
+def prepare_upload_csv(csv_path: str | Path) -> Path:
+    report = validate_coordinates_file(csv_path)
+    if not report.is_valid:
+        raise CoordinateError(f"{csv_path}: {report.summary()}")
+    upload_path = worker_path(Path(tempfile.gettempdir()) / 'polygon_coordinates') / f"{Path(csv_path).stem}_normalized.csv"
+    return write_normalized_csv(report.ring, upload_path)
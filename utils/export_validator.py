@@ -0,0 +1,228 @@
+import csv
+import hashlib
+import json
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from pathlib import Path, PurePosixPath
+from typing import Iterable, Iterator, Optional
+from utils.config_manager import ConfigManager
+from utils.helpers import write_text_atomic
+
+XLSX_SIGNATURE = b'PK\x03\x04'
+SHEET_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+RELATIONSHIP_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+PACKAGE_RELATIONSHIP_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+CELL_COLUMN = re.compile(r'[A-Z]+')
+CELL_SEPARATOR = '\x1f'
+MAX_REPORTED = 5
+
+
+class ExportError(ValueError):
+    pass
+
+
+def detect_format(export_path: str | Path) -> str:
+    with open(export_path, 'rb') as file:
+        signature = file.read(len(XLSX_SIGNATURE))
+    if signature == XLSX_SIGNATURE:
+        with zipfile.ZipFile(export_path) as archive:
+            if 'xl/workbook.xml' not in archive.namelist():
+                raise ExportError(f"Zip archive is not an XLSX workbook: {export_path}")
+        return 'xlsx'
+    return 'csv'
+
+
+def _iter_csv_rows(export_path: Path) -> Iterator[list[str]]:
+    with open(export_path, newline='', encoding='utf-8-sig') as file:
+        yield from csv.reader(file)
+
+
+def _first_sheet(archive: zipfile.ZipFile) -> str:
+    workbook = ET.fromstring(archive.read('xl/workbook.xml'))
+    sheet = workbook.find(f'{SHEET_NS}sheets/{SHEET_NS}sheet')
+    if sheet is None:
+        raise ExportError("XLSX workbook has no sheets")
+    relationship_id = sheet.get(f'{RELATIONSHIP_NS}id')
+    relationships = ET.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+    for relationship in relationships.iter(f'{PACKAGE_RELATIONSHIP_NS}Relationship'):
+        if relationship.get('Id') == relationship_id:
+            target = relationship.get('Target')
+            return target.lstrip('/') if target.startswith('/') else str(PurePosixPath('xl') / target)
+    raise ExportError(f"XLSX sheet relationship {relationship_id} not found")
+
+
+def _shared_strings(archive: zipfile.ZipFile) -> list[str]:
+    if 'xl/sharedStrings.xml' not in archive.namelist():
+        return []
+    strings = []
+    with archive.open('xl/sharedStrings.xml') as file:
+        for _, element in ET.iterparse(file):
+            if element.tag == f'{SHEET_NS}si':
+                # Rich text splits one string over several runs
+                strings.append(''.join(text.text or '' for text in element.iter(f'{SHEET_NS}t')))
+                element.clear()
+    return strings
+
+
+def _column_index(reference: str) -> int:
+    index = 0
+    for letter in CELL_COLUMN.match(reference).group():
+        index = index * 26 + ord(letter) - ord('A') + 1
+    return index - 1
+
+
+def _cell_value(cell: ET.Element, shared: list[str]) -> str:
+    kind = cell.get('t')
+    if kind == 'inlineStr':
+        return ''.join(text.text or '' for text in cell.iter(f'{SHEET_NS}t'))
+    value = cell.findtext(f'{SHEET_NS}v') or ''
+    if kind == 's' and value:
+        return shared[int(value)]
+    return value
+
+
+def _iter_xlsx_rows(export_path: Path) -> Iterator[list[str]]:
+    with zipfile.ZipFile(export_path) as archive:
+        shared = _shared_strings(archive)
+        with archive.open(_first_sheet(archive)) as file:
+            sheet_data = None
+            for event, element in ET.iterparse(file, events=('start', 'end')):
+                if event == 'start':
+                    if element.tag == f'{SHEET_NS}sheetData':
+                        sheet_data = element
+                    continue
+                if element.tag != f'{SHEET_NS}row':
+                    continue
+                row = []
+                for cell in element.iter(f'{SHEET_NS}c'):
+                    # Empty cells are left out of the sheet, so place each one by its column letter
+                    reference = cell.get('r')
+                    if reference:
+                        row.extend([''] * (_column_index(reference) - len(row)))
+                    row.append(_cell_value(cell, shared))
+                yield row
+                # Parsed rows are dropped so memory stays flat however long the sheet is
+                if sheet_data is not None:
+                    sheet_data.clear()
+
+
+def iter_export_rows(export_path: str | Path) -> Iterator[list[str]]:
+    export_path = Path(export_path)
+    rows = _iter_xlsx_rows(export_path) if detect_format(export_path) == 'xlsx' else _iter_csv_rows(export_path)
+    width = None
+    for row in rows:
+        row = [cell.strip() for cell in row]
+        if not any(row):
+            continue
+        # Sheets leave out trailing empty cells, so rows are padded to the header's width
+        width = len(row) if width is None else width
+        yield row + [''] * (width - len(row))
+
+
+def row_digest(row: list[str]) -> str:
+    return hashlib.sha1(CELL_SEPARATOR.join(row).encode('utf-8')).hexdigest()[:16]
+
+
+class ExportReport:
+
+    def __init__(self, export_path: str | Path, expected_polygons: Iterable[str] = (),
+                 required_columns: Iterable[str] = (), name_column: Optional[str] = None,
+                 previous: Optional[dict[str, str]] = None):
+        self.path = Path(export_path)
+        self.format = detect_format(self.path)
+        self.rows = 0
+        self.header: list[str] = []
+        self.index: dict[str, str] = {}
+        self.duplicate_names: list[str] = []
+        expected = set(expected_polygons)
+        # Content checksum over the parsed cells, so a CSV and an XLSX export of the same data agree
+        checksum = hashlib.sha256()
+
+        rows = iter_export_rows(self.path)
+        self.header = next(rows, [])
+        checksum.update((CELL_SEPARATOR.join(self.header) + '\n').encode('utf-8'))
+        columns = {column.casefold(): position for position, column in enumerate(self.header)}
+        self.missing_columns = [column for column in required_columns if column.casefold() not in columns]
+        name_position = columns.get(name_column.casefold()) if name_column else None
+        self.name_column = name_column
+        self.has_names = name_position is not None
+
+        for row in rows:
+            self.rows += 1
+            checksum.update((CELL_SEPARATOR.join(row) + '\n').encode('utf-8'))
+            name = row[name_position] if name_position is not None and name_position < len(row) else f"row {self.rows}"
+            expected.discard(name)
+            if name in self.index:
+                self.duplicate_names.append(name)
+                name = f"{name} #{self.rows}"
+            self.index[name] = row_digest(row)
+
+        self.checksum = checksum.hexdigest()
+        self.missing_polygons = sorted(expected)
+        # Without the name column rows are keyed "row N", which would diff as every row removed and added
+        self.diff = self._diff(previous) if previous is not None and self.has_names else None
+
+    def _diff(self, previous: dict[str, str]) -> dict[str, list[str]]:
+        return {
+            'added': sorted(name for name in self.index if name not in previous),
+            'removed': sorted(name for name in previous if name not in self.index),
+            'changed': sorted(name for name, digest in self.index.items()
+                              if name in previous and previous[name] != digest),
+        }
+
+    @property
+    def schema_errors(self) -> list[str]:
+        errors = []
+        if not self.header:
+            errors.append("Export has no header row")
+        if self.missing_columns:
+            errors.append(f"Missing columns {self.missing_columns}, header is {self.header}")
+        if self.name_column and self.header and not self.has_names:
+            errors.append(f"Name column '{self.name_column}' not in header {self.header}")
+        return errors
+
+    @property
+    def errors(self) -> list[str]:
+        errors = self.schema_errors
+        if self.missing_polygons:
+            errors.append(f"{len(self.missing_polygons)} polygons missing from export, "
+                          f"e.g. {self.missing_polygons[:MAX_REPORTED]}")
+        return errors
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+    def summary(self) -> str:
+        status = 'valid' if self.is_valid else '; '.join(self.errors)
+        changes = ''
+        if self.diff is not None:
+            changes = ', ' + ', '.join(f"{len(names)} {kind}" for kind, names in self.diff.items()) + ' since last export'
+        return f"{self.path.name} ({self.format}, {self.rows} rows, sha256 {self.checksum[:12]}{changes}): {status}"
+
+
+def history_path(history_dir: Path, key: str) -> Path:
+    return history_dir / f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', key).strip('_')}.json"
+
+
+def validate_export(export_path: str | Path, expected_polygons: Iterable[str] = (),
+                    history_key: Optional[str] = None) -> ExportReport:
+    # Rows are compared by polygon name against the per-row digests kept from the previous export with this key
+    config = ConfigManager()
+    previous_path = history_path(config.export_history_dir, history_key) if history_key else None
+    previous = None
+    if previous_path is not None and previous_path.exists():
+        previous = json.loads(previous_path.read_text(encoding='utf-8'))['rows']
+
+    report = ExportReport(
+        export_path,
+        expected_polygons=expected_polygons,
+        required_columns=config.export_required_columns,
+        name_column=config.export_name_column,
+        previous=previous,
+    )
+
+    if previous_path is not None and report.has_names:
+        write_text_atomic(previous_path, json.dumps({'checksum': report.checksum, 'rows': report.index}))
+    return report
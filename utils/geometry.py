@@ -0,0 +1,186 @@
+from functools import lru_cache
+from typing import Optional
+import numpy as np
+
+EARTH_RADIUS_M = 6_371_008.8
+DEFAULT_VERTICES = 12
+DEFAULT_RADIUS_M = 2000.0
+TILE_SIZE = 256
+MAX_MERCATOR_LATITUDE = 85.0511287798
+
+# Polygons are (n, 2) arrays of [latitude, longitude]; local planar offsets are (n, 2) arrays of [east, north] metres
+
+
+def to_local_metres(points: np.ndarray, origin: tuple[float, float]) -> np.ndarray:
+    points = np.asarray(points, dtype=np.float64)
+    latitude, longitude = np.radians(origin)
+    north = np.radians(points[..., 0]) - latitude
+    east = (np.radians(points[..., 1]) - longitude) * np.cos(latitude)
+    return np.stack((east, north), axis=-1) * EARTH_RADIUS_M
+
+
+def from_local_metres(offsets: np.ndarray, origin: tuple[float, float]) -> np.ndarray:
+    offsets = np.asarray(offsets, dtype=np.float64) / EARTH_RADIUS_M
+    latitude, longitude = np.radians(origin)
+    return np.degrees(np.stack((latitude + offsets[..., 1], longitude + offsets[..., 0] / np.cos(latitude)), axis=-1))
+
+
+def regular_polygon(vertices: int, radius: float = 1.0) -> np.ndarray:
+    angles = 2 * np.pi * np.arange(vertices) / vertices
+    return radius * np.column_stack((np.cos(angles), np.sin(angles)))
+
+
+def circle_polygon(center: tuple[float, float], radius_m: float, vertices: int = 64) -> np.ndarray:
+    # Travel-distance circle approximated by a regular polygon whose vertices lie on the circle
+    return from_local_metres(regular_polygon(vertices, radius_m), center)
+
+
+def convex_polygons(
+    center: tuple[float, float],
+    count: int,
+    vertices: int = DEFAULT_VERTICES,
+    radius_m: float = DEFAULT_RADIUS_M,
+    seed: Optional[int] = None
+) -> np.ndarray:
+    # Points on randomly stretched and rotated ellipses, visited in angle order, are always convex
+    rng = np.random.default_rng(seed)
+    angles = np.sort(rng.uniform(0, 2 * np.pi, (count, vertices)), axis=1)
+    stretch = rng.uniform(0.4, 1.0, (count, 1))
+    rotation = rng.uniform(0, np.pi, (count, 1))
+
+    east, north = radius_m * np.cos(angles), radius_m * stretch * np.sin(angles)
+    cos, sin = np.cos(rotation), np.sin(rotation)
+    return from_local_metres(np.stack((east * cos - north * sin, east * sin + north * cos), axis=-1), center)
+
+
+def concave_polygons(
+    center: tuple[float, float],
+    count: int,
+    vertices: int = DEFAULT_VERTICES,
+    radius_m: float = DEFAULT_RADIUS_M,
+    concavity: float = 0.5,
+    seed: Optional[int] = None
+) -> np.ndarray:
+    # Star-shaped around the center: one vertex per angular sector at a random radius, so edges never cross
+    rng = np.random.default_rng(seed)
+    sector = 2 * np.pi / vertices
+    angles = sector * (np.arange(vertices) + rng.uniform(0.05, 0.95, (count, vertices))) + rng.uniform(0, sector, (count, 1))
+    radii = radius_m * (1 - concavity * rng.random((count, vertices)))
+    return from_local_metres(np.stack((radii * np.cos(angles), radii * np.sin(angles)), axis=-1), center)
+
+
+def _open_ring(ring: np.ndarray) -> tuple[np.ndarray, bool]:
+    ring = np.asarray(ring, dtype=np.float64)
+    closed = len(ring) > 1 and bool((ring[0] == ring[-1]).all())
+    return (ring[:-1] if closed else ring), closed
+
+
+def _shoelace(xy: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    following = np.roll(xy, -1, axis=-2)
+    cross = xy[..., 0] * following[..., 1] - following[..., 0] * xy[..., 1]
+    return cross, xy + following
+
+
+def polygon_area(ring: np.ndarray) -> float:
+    # Square metres, on a local plane around the first vertex
+    ring, _ = _open_ring(ring)
+    cross, _ = _shoelace(to_local_metres(ring, ring[0]))
+    return float(abs(cross.sum()) / 2)
+
+
+def polygon_centroid(ring: np.ndarray) -> tuple[float, float]:
+    ring, _ = _open_ring(ring)
+    cross, sums = _shoelace(to_local_metres(ring, ring[0]))
+    centroid = (sums * cross[:, None]).sum(axis=0) / (3 * cross.sum())
+    latitude, longitude = from_local_metres(centroid, ring[0])
+    return float(latitude), float(longitude)
+
+
+def _segment_distances(points: np.ndarray, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    segment = end - start
+    length = segment @ segment
+    position = np.clip((points - start) @ segment / length, 0, 1) if length else np.zeros(len(points))
+    return np.linalg.norm(points - (start + position[:, None] * segment), axis=1)
+
+
+def simplify(ring: np.ndarray, tolerance_m: float) -> np.ndarray:
+    # Douglas-Peucker; the ring is split at its first vertex and the vertex farthest from it
+    points, closed = _open_ring(ring)
+    if len(points) <= 3:
+        return np.asarray(ring, dtype=np.float64).copy()
+
+    xy = to_local_metres(points, points[0])
+    xy = np.vstack((xy, xy[:1]))
+    count = len(points)
+    farthest = int(np.argmax(np.linalg.norm(xy[:count] - xy[0], axis=1)))
+    keep = np.zeros(count + 1, dtype=bool)
+    keep[[0, farthest, count]] = True
+
+    pending = [(0, farthest), (farthest, count)]
+    while pending:
+        start, end = pending.pop()
+        if end - start < 2:
+            continue
+        distances = _segment_distances(xy[start + 1:end], xy[start], xy[end])
+        index = int(np.argmax(distances))
+        if distances[index] > tolerance_m:
+            middle = start + 1 + index
+            keep[middle] = True
+            pending.extend(((start, middle), (middle, end)))
+
+    simplified = points[keep[:count]]
+    return np.vstack((simplified, simplified[:1])) if closed else simplified
+
+
+def screen_offsets(ring: np.ndarray, radius_px: float) -> np.ndarray:
+    # Pixel offsets from the polygon's centroid with the farthest vertex radius_px away; screen y grows downwards
+    points, _ = _open_ring(ring)
+    xy = to_local_metres(points, polygon_centroid(points))
+    xy *= radius_px / np.linalg.norm(xy, axis=1).max()
+    return np.column_stack((xy[:, 0], -xy[:, 1]))
+
+
+def mercator_pixels(points: np.ndarray, zoom: float) -> np.ndarray:
+    # Web Mercator world pixel coordinates [x, y] at the given zoom
+    points = np.asarray(points, dtype=np.float64)
+    scale = TILE_SIZE * 2.0 ** zoom
+    latitude = np.radians(np.clip(points[..., 0], -MAX_MERCATOR_LATITUDE, MAX_MERCATOR_LATITUDE))
+    x = (points[..., 1] + 180) / 360 * scale
+    y = (1 - np.log(np.tan(latitude) + 1 / np.cos(latitude)) / np.pi) / 2 * scale
+    return np.stack((x, y), axis=-1)
+
+
+class MapProjection:
+
+    def __init__(self, north: float, west: float, zoom: float, width: float, height: float):
+        self.zoom = zoom
+        self.width = width
+        self.height = height
+        self.origin = mercator_pixels((north, west), zoom)
+
+    def project(self, points: np.ndarray) -> np.ndarray:
+        # Pixel positions inside the map viewport, measured from its top-left corner
+        pixels = mercator_pixels(points, self.zoom) - self.origin
+        outside = ~((pixels >= 0) & (pixels <= (self.width, self.height))).all(axis=-1)
+        if outside.any():
+            raise ValueError(f"{int(outside.sum())} vertices fall outside the {self.width}x{self.height} map viewport "
+                             f"at zoom {self.zoom}, first at index {int(np.flatnonzero(outside)[0])}")
+        return pixels
+
+    def unproject(self, pixels: np.ndarray) -> np.ndarray:
+        world = np.asarray(pixels, dtype=np.float64) + self.origin
+        scale = TILE_SIZE * 2.0 ** self.zoom
+        longitude = world[..., 0] / scale * 360 - 180
+        latitude = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * world[..., 1] / scale))))
+        return np.stack((latitude, longitude), axis=-1)
+
+
+def centered_viewport(center: tuple[float, float], zoom: float, width: float, height: float) -> dict:
+    # Bounds of a width x height map view around center, in the form map_projection takes
+    north, west = MapProjection(center[0], center[1], zoom, width, height).unproject(np.array([-width / 2, -height / 2]))
+    return {'north': float(north), 'west': float(west), 'zoom': zoom, 'width': width, 'height': height}
+
+
+@lru_cache(maxsize=32)
+def map_projection(north: float, west: float, zoom: float, width: float, height: float) -> MapProjection:
+    return MapProjection(north, west, zoom, width, height)
@@ -0,0 +1,108 @@
+import base64
+import json
+import re
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from playwright.sync_api import BrowserContext, Route
+from utils.config_manager import ConfigManager
+from utils.logger import Logger
+from utils.helpers import UNIQUE_ID_PATTERN
+
+MODES = ('off', 'record', 'replay')
+
+# Headers that describe the original transfer rather than the body we fulfill with
+SKIPPED_RESPONSE_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+
+def har_path_for(har_dir: Path, node_id: str) -> Path:
+    return har_dir / f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', node_id).strip('_')}.har"
+
+
+def names_path_for(har_path: Path) -> Path:
+    return har_path.with_suffix('.names.json')
+
+
+def normalize_url(url: str, volatile_params: frozenset = frozenset()) -> str:
+    parts = urlsplit(url)
+    query = sorted(
+        (key, UNIQUE_ID_PATTERN.sub('{id}', value))
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in volatile_params
+    )
+    path = UNIQUE_ID_PATTERN.sub('{id}', parts.path)
+    return urlunsplit((parts.scheme, parts.netloc, path, urlencode(query), ''))
+
+
+class HarReplayer:
+
+    def __init__(self, har_path: Path):
+        self.config = ConfigManager()
+        self.logger = Logger()
+        self.har_path = har_path
+        self.volatile_params = frozenset(self.config.har_volatile_params)
+        self.not_found = self.config.har_not_found
+        self._entries: dict[tuple[str, str], deque] = defaultdict(deque)
+        self.served = 0
+        self.missed = 0
+        self._load()
+
+    def _load(self) -> None:
+        with open(self.har_path, 'r', encoding='utf-8') as file:
+            har = json.load(file)
+
+        for entry in har['log']['entries']:
+            request = entry['request']
+            key = (request['method'], normalize_url(request['url'], self.volatile_params))
+            self._entries[key].append(entry['response'])
+
+        self.logger.info("Loaded %s HAR entries from %s", sum(len(q) for q in self._entries.values()), self.har_path)
+
+    def attach(self, context: BrowserContext) -> None:
+        context.route("**/*", self._handle)
+
+    def _handle(self, route: Route) -> None:
+        request = route.request
+        key = (request.method, normalize_url(request.url, self.volatile_params))
+        responses = self._entries.get(key)
+
+        if not responses:
+            self.missed += 1
+            self.logger.debug("No HAR entry for %s %s", request.method, request.url)
+            if self.not_found == 'fallback':
+                route.fallback()
+            else:
+                route.abort()
+            return
+
+        # Repeated calls are served in recorded order; the last response keeps answering polls
+        response = responses.popleft() if len(responses) > 1 else responses[0]
+        self.served += 1
+        route.fulfill(
+            status=response['status'],
+            headers={
+                header['name']: header['value'] for header in response['headers']
+                if header['name'].lower() not in SKIPPED_RESPONSE_HEADERS
+            },
+            body=self._body(response)
+        )
+
+    @staticmethod
+    def _body(response: dict) -> bytes:
+        content = response.get('content', {})
+        text = content.get('text', '')
+        if content.get('encoding') == 'base64':
+            return base64.b64decode(text)
+        return text.encode('utf-8')
+
+
+def save_names(har_path: Path, names: dict) -> None:
+    names_path_for(har_path).write_text(json.dumps(names, indent=2), encoding='utf-8')
+
+
+def load_names(har_path: Path) -> Optional[dict]:
+    names_path = names_path_for(har_path)
+    if not names_path.exists():
+        return None
+    return json.loads(names_path.read_text(encoding='utf-8'))
@@ -1,15 +1,48 @@
+import csv
+import heapq
+import itertools
+import json
+import os
+import re
+import tempfile
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
+
+UNIQUE_ID_PATTERN = re.compile(r"\d{8}_\d{6}_\d{3}_[A-Za-z0-9]+_\d{4,}")
+LOG_TIMESTAMP_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+LOG_SUFFIXES = ('.log', '.jsonl')
+
+_id_counter = itertools.count(1)
+
+
+def get_worker_id() -> str:
+    return os.environ.get('PYTEST_XDIST_WORKER', 'master')
+
+
+def is_xdist_worker() -> bool:
+    return 'PYTEST_XDIST_WORKER' in os.environ
+
+
+def worker_path(base_path: Path) -> Path:
+    path = base_path / get_worker_id() if is_xdist_worker() else base_path
+    path.mkdir(parents=True, exist_ok=True)
+    return path
 
 
 def generate_polygon_name(prefix: str) -> str:
-    return f"{prefix}_{generate_timestamp()}"
+    return f"{prefix}_{generate_unique_id()}"
 
 
 def generate_timestamp() -> str:
     return datetime.now().strftime("%Y%m%d_%H%M%S")
 
 
+def generate_unique_id() -> str:
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
+    return f"{timestamp}_{get_worker_id()}_{next(_id_counter):04d}"
+
+
 def validate_downloaded_file(file_path: Path) -> None:
     if not file_path.exists():
         raise AssertionError(f"Downloaded file not found at: {file_path}")
@@ -20,5 +53,70 @@ def validate_downloaded_file(file_path: Path) -> None:
 
 def generate_unique_filename(original_filename: str) -> str:
     name_part, ext_part = original_filename.rsplit('.', 1) if '.' in original_filename else (original_filename, '')
-    timestamp = generate_timestamp()
-    return f"{name_part}_{timestamp}.{ext_part}" if ext_part else f"{name_part}_{timestamp}"
+    unique_id = generate_unique_id()
+    return f"{name_part}_{unique_id}.{ext_part}" if ext_part else f"{name_part}_{unique_id}"
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    # Each writer gets its own temporary file, so xdist workers refreshing the same file never rename each other's
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=path.parent, prefix=f".{path.name}.",
+                                     suffix='.tmp', delete=False) as file:
+        file.write(text)
+    try:
+        os.replace(file.name, path)
+    except OSError:
+        os.unlink(file.name)
+        raise
+
+
+def write_coordinates_csv(name: str, coordinates: list) -> Path:
+    csv_path = worker_path(Path(tempfile.gettempdir()) / 'polygon_coordinates') / f"{name}.csv"
+    with open(csv_path, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['latitude', 'longitude'])
+        writer.writerows(coordinates)
+    return csv_path
+
+
+def _read_log_records(log_file: Path) -> Iterator[tuple[str, str]]:
+    if log_file.suffix == '.jsonl':
+        with open(log_file, 'r', encoding='utf-8') as file:
+            for line in file:
+                yield json.loads(line)['timestamp'], line
+        return
+
+    record = []
+    with open(log_file, 'r', encoding='utf-8') as file:
+        for line in file:
+            if LOG_TIMESTAMP_PATTERN.match(line) and record:
+                yield record[0][:19], ''.join(record)
+                record = []
+            record.append(line)
+    if record:
+        yield record[0][:19], ''.join(record)
+
+
+def merge_worker_logs(log_dir: Path, since: float) -> Path | None:
+    worker_logs = [
+        log_file for log_file in sorted(log_dir.glob('*/test_*.*'))
+        if log_file.suffix in LOG_SUFFIXES and log_file.stat().st_mtime >= since
+    ]
+    if not worker_logs:
+        return None
+
+    merged_path = log_dir / f"test_{generate_timestamp()}_merged{worker_logs[0].suffix}"
+    with open(merged_path, 'w', encoding='utf-8') as merged:
+        for _, record in heapq.merge(*(_read_log_records(log_file) for log_file in worker_logs), key=lambda r: r[0]):
+            merged.write(record)
+    return merged_path
+
+
+def collect_worker_artifacts(base_paths: list[Path], since: float) -> dict:
+    manifest = {}
+    for base_path in base_paths:
+        for artifact in sorted(base_path.glob('*/*')):
+            if artifact.is_file() and artifact.stat().st_mtime >= since:
+                worker = artifact.parent.name
+                manifest.setdefault(base_path.name, {}).setdefault(worker, []).append(str(artifact.relative_to(base_path)))
+    return manifest
@@ -1,61 +1,189 @@
+import atexit
+import json
 import logging
+import queue
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
+import allure_commons
+from utils.config_manager import ConfigManager
+from utils.helpers import get_worker_id, worker_path
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+TEXT_FORMAT_WITH_LOCATION = '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+_test_id: ContextVar[Optional[str]] = ContextVar('log_test_id', default=None)
+_steps: ContextVar[tuple] = ContextVar('log_steps', default=())
+
+
+class LogContext(logging.Filter):
+    # Runs in the emitting thread, so records carry the test and step that were current when they were logged
+
+    def __init__(self):
+        super().__init__()
+        self.worker = get_worker_id()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        steps = _steps.get()
+        record.test_id = _test_id.get()
+        record.worker = self.worker
+        record.step = steps[-1][1] if steps else None
+        return True
+
+    def set_test(self, test_id: Optional[str]) -> None:
+        _test_id.set(test_id)
+        _steps.set(())
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        _steps.set(_steps.get() + ((uuid, str(title)),))
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        steps = _steps.get()
+        if steps and steps[-1][0] == uuid:
+            _steps.set(steps[:-1])
+
+
+class JsonFormatter(logging.Formatter):
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'timestamp': f"{self.formatTime(record, DATE_FORMAT)}.{int(record.msecs):03d}",
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'test_id': getattr(record, 'test_id', None),
+            'worker': getattr(record, 'worker', None),
+            'step': getattr(record, 'step', None),
+        }
+        if record.lineno:
+            entry['location'] = f"{record.filename}:{record.lineno}"
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class _FrameFreeLogger(logging.Logger):
+    # logging walks the stack for every record to find the caller; skip it unless the format shows the location
+    include_location = False
+
+    def findCaller(self, stack_info: bool = False, stacklevel: int = 1):
+        if self.include_location:
+            return super().findCaller(stack_info, stacklevel)
+        return '(unknown file)', 0, '(unknown function)', None
 
 
 class Logger:
     _instance: Optional['Logger'] = None
     _logger: Optional[logging.Logger] = None
-    
+    _listener: Optional[QueueListener] = None
+
     def __new__(cls, name: str = 'PlaywrightFramework'):
         if cls._instance is None:
             cls._instance = super(Logger, cls).__new__(cls)
             cls._instance._initialize_logger(name)
         return cls._instance
-    
+
     def _initialize_logger(self, name: str) -> None:
-        self._logger = logging.getLogger(name)
-        self._logger.setLevel(logging.DEBUG)
-        
-        if self._logger.handlers:
-            return
-        
-        log_dir = Path(__file__).parent.parent / 'logs'
-        log_dir.mkdir(exist_ok=True)
-        
-        log_file = log_dir / f'test_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
-        
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
+        config = ConfigManager()
+        self.log_format = config.log_format
+        self.context = LogContext()
+
+        self._logger = _FrameFreeLogger(name)
+        self._logger.parent = logging.getLogger()
+
+        # Callers only enqueue; a background thread does the disk and terminal I/O
+        self._queue = queue.Queue(-1)
+        queue_handler = QueueHandler(self._queue)
+        queue_handler.addFilter(self.context)
+        self._logger.addHandler(queue_handler)
+        self._handlers = (self._open_file_handler(), logging.StreamHandler())
+        self.apply_levels()
+        self._start_listener()
+        atexit.register(self.shutdown)
+
+    def _open_file_handler(self) -> logging.FileHandler:
+        log_dir = worker_path(Path(__file__).parent.parent / 'logs')
+        suffix = 'jsonl' if self.log_format == 'json' else 'log'
+        self.log_file = log_dir / f'test_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{suffix}'
+        file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
+        if self.log_format == 'json':
+            file_handler.setFormatter(JsonFormatter())
+        return file_handler
+
+    def _start_listener(self) -> None:
+        self._listener = QueueListener(self._queue, *self._handlers, respect_handler_level=True)
+        self._listener.start()
+
+    def _reopen_file(self, log_format: str) -> None:
+        # Logger() exists from conftest import, before --profile is applied, so a profile's format swaps the file
+        old_handler, console_handler = self._handlers
+        if self._listener is not None:
+            self._listener.stop()
+        old_handler.close()
+        old_file = self.log_file
+        self.log_format = log_format
+        self._handlers = (self._open_file_handler(), console_handler)
+        if old_file.exists() and old_file.stat().st_size == 0:
+            old_file.unlink()
+        if self._listener is not None:
+            self._start_listener()
+
+    def apply_levels(self) -> None:
+        # Levels, location and the file format follow config reloads
+        config = ConfigManager()
+        if config.log_format != self.log_format:
+            self._reopen_file(config.log_format)
+        file_handler, console_handler = self._handlers
+        self._logger.include_location = config.log_location
+        self._logger.setLevel(min(config.log_file_level, config.log_console_level))
+        file_handler.setLevel(config.log_file_level)
+        console_handler.setLevel(config.log_console_level)
+
+        text_formatter = logging.Formatter(
+            TEXT_FORMAT_WITH_LOCATION if config.log_location else TEXT_FORMAT,
+            datefmt=DATE_FORMAT
         )
-        
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
-        
-        self._logger.addHandler(file_handler)
-        self._logger.addHandler(console_handler)
-    
+        if self.log_format != 'json':
+            file_handler.setFormatter(text_formatter)
+        console_handler.setFormatter(text_formatter)
+
     def get_logger(self) -> logging.Logger:
         return self._logger
-    
-    def debug(self, message: str) -> None:
-        self._logger.debug(message)
-    
-    def info(self, message: str) -> None:
-        self._logger.info(message)
-    
-    def warning(self, message: str) -> None:
-        self._logger.warning(message)
-    
-    def error(self, message: str) -> None:
-        self._logger.error(message)
-    
-    def critical(self, message: str) -> None:
-        self._logger.critical(message)
+
+    def set_test(self, test_id: Optional[str]) -> None:
+        self.context.set_test(test_id)
+
+    def flush(self) -> None:
+        # Blocks until every queued record has been written
+        if self._listener is not None:
+            self._queue.join()
+            for handler in self._handlers:
+                handler.flush()
+
+    def shutdown(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+            for handler in self._handlers:
+                handler.close()
+
+    # Messages use %-style arguments so they are only formatted for records that pass the level check
+    def debug(self, message: str, *args) -> None:
+        self._logger.debug(message, *args, stacklevel=2)
+
+    def info(self, message: str, *args) -> None:
+        self._logger.info(message, *args, stacklevel=2)
+
+    def warning(self, message: str, *args) -> None:
+        self._logger.warning(message, *args, stacklevel=2)
+
+    def error(self, message: str, *args) -> None:
+        self._logger.error(message, *args, stacklevel=2)
+
+    def critical(self, message: str, *args) -> None:
+        self._logger.critical(message, *args, stacklevel=2)
@@ -0,0 +1,109 @@
+import base64
+import re
+from collections import defaultdict
+from urllib.parse import urlsplit
+from playwright.sync_api import BrowserContext, Route, Request, Response
+from utils.config_manager import ConfigManager
+from utils.logger import Logger
+
+CATEGORIES = ('image', 'font', 'media', 'map_tiles', 'third_party')
+
+TRANSPARENT_GIF = base64.b64decode("R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7")
+
+STUB_RESPONSES = {
+    'image': {'status': 200, 'content_type': 'image/gif', 'body': TRANSPARENT_GIF},
+    'map_tiles': {'status': 200, 'content_type': 'image/gif', 'body': TRANSPARENT_GIF},
+    'font': {'status': 200, 'content_type': 'font/woff2', 'body': b''},
+    'media': {'status': 204, 'body': b''},
+    'third_party': {'status': 204, 'body': b''},
+}
+
+
+class ResourcePolicy:
+
+    _session_totals: dict[str, int] = defaultdict(int)
+    # A blocked request never reaches the server, so its size is estimated from responses of the same
+    # category that were let through (tests marked allow_resources) earlier in the session
+    _observed_sizes: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+
+    def __init__(self, blocked_categories: set):
+        self.config = ConfigManager()
+        self.logger = Logger()
+        self.blocked_categories = set(blocked_categories)
+        self.action = self.config.get('RESOURCES', 'action', 'stub')
+        self.blocked_hosts = tuple(self.config.get_list('RESOURCES', 'blocked_hosts'))
+        self.tile_patterns = [re.compile(p) for p in self.config.get_list('RESOURCES', 'map_tile_patterns')]
+        self.stats: dict[str, int] = defaultdict(int)
+
+    @classmethod
+    def from_config(cls, allowed: tuple = ()) -> 'ResourcePolicy':
+        config = ConfigManager()
+        configured = set(config.get_list('RESOURCES', 'block_categories'))
+        unknown = configured - set(CATEGORIES)
+        if unknown:
+            raise ValueError(f"Unknown resource categories: {sorted(unknown)}. Valid: {CATEGORIES}")
+        return cls(configured - set(allowed))
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.blocked_categories)
+
+    def apply(self, context: BrowserContext) -> None:
+        context.on('response', self._observe_size)
+        if self.enabled:
+            self.logger.info("Blocking resource categories: %s", sorted(self.blocked_categories))
+            context.route("**/*", self._handle)
+
+    def detach(self, context: BrowserContext) -> None:
+        context.remove_listener('response', self._observe_size)
+        if self.enabled:
+            context.unroute("**/*", self._handle)
+
+    def category_of(self, request: Request) -> str | None:
+        url = request.url
+        if any(pattern.search(url) for pattern in self.tile_patterns):
+            return 'map_tiles'
+
+        host = urlsplit(url).hostname or ''
+        if any(host == blocked or host.endswith(f".{blocked}") for blocked in self.blocked_hosts):
+            return 'third_party'
+
+        if request.resource_type in ('image', 'font', 'media'):
+            return request.resource_type
+        return None
+
+    def _handle(self, route: Route) -> None:
+        request = route.request
+        category = self.category_of(request)
+        if category not in self.blocked_categories:
+            route.fallback()
+            return
+
+        self.stats[category] += 1
+        ResourcePolicy._session_totals[category] += 1
+        if self.action == 'abort':
+            route.abort('blockedbyclient')
+        else:
+            route.fulfill(**STUB_RESPONSES[category])
+
+    def _observe_size(self, response: Response) -> None:
+        category = self.category_of(response.request)
+        length = response.headers.get('content-length')
+        if category is not None and length and length.isdigit():
+            observed = ResourcePolicy._observed_sizes[category]
+            observed[0] += int(length)
+            observed[1] += 1
+
+    @classmethod
+    def estimated_bytes(cls, category: str, requests: int) -> int | None:
+        total, count = cls._observed_sizes.get(category, (0, 0))
+        return round(requests * total / count) if count else None
+
+    def summary(self) -> dict[str, dict]:
+        return {category: {'requests': requests, 'estimated_bytes': self.estimated_bytes(category, requests)}
+                for category, requests in self.stats.items()}
+
+    @classmethod
+    def session_summary(cls) -> dict[str, dict]:
+        return {category: {'requests': requests, 'estimated_bytes': cls.estimated_bytes(category, requests)}
+                for category, requests in cls._session_totals.items()}
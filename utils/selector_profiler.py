@@ -0,0 +1,270 @@
+import argparse
+import hashlib
+import json
+import re
+import statistics
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Optional
+from utils.config_manager import ConfigManager
+from utils.helpers import worker_path
+from utils.logger import Logger
+
+SCRIPT_TAG = re.compile(r'<script\b[^>]*>.*?</script\s*>', re.IGNORECASE | re.DOTALL)
+# CSS-module class names such as _item_1hxwt_13 change with every frontend build
+BUILD_CLASS = re.compile(r'_[a-z0-9]{5}_\d+')
+POSITIONAL_INDEX = re.compile(r'\)\[\d+\]')
+TEXT_PREDICATE = re.compile(r'normalize-space\(|text\(\)|contains\(')
+BASELINE_SELECTOR = 'html'
+
+# Testid on the element itself, or its explicit or implicit ARIA role with an accessible name
+DESCRIBE_SCRIPT = """
+    elements => elements.slice(0, 3).map(element => {
+        const tag = element.tagName.toLowerCase();
+        const type = (element.getAttribute('type') || 'text').toLowerCase();
+        const implicit = {
+            button: 'button', select: 'combobox', textarea: 'textbox',
+            h1: 'heading', h2: 'heading', h3: 'heading', h4: 'heading', h5: 'heading', h6: 'heading',
+            a: element.hasAttribute('href') ? 'link' : null,
+            img: element.hasAttribute('alt') ? 'img' : null,
+            input: {checkbox: 'checkbox', radio: 'radio', button: 'button', submit: 'button'}[type]
+                || (['text', 'email', 'password', 'search', 'tel', 'url'].includes(type) ? 'textbox' : null),
+        }[tag] || null;
+        const label = element.labels && element.labels.length ? element.labels[0].textContent : null;
+        const name = element.getAttribute('aria-label') || label || element.getAttribute('placeholder')
+            || element.getAttribute('alt') || element.textContent || '';
+        return {
+            testid: element.getAttribute('data-testid'),
+            role: element.getAttribute('role') || implicit,
+            name: name.replace(/\\s+/g, ' ').trim().slice(0, 60),
+        };
+    })
+"""
+
+
+class SnapshotRecorder:
+    # Saves DOM snapshots of each page object while tests run, for the selector profiler to replay offline
+    _instance: Optional['SnapshotRecorder'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(SnapshotRecorder, cls).__new__(cls)
+            cls._instance._initialize_recorder()
+        return cls._instance
+
+    def _initialize_recorder(self) -> None:
+        config = ConfigManager()
+        self.enabled = config.selector_snapshots
+        self.directory = config.selector_snapshot_dir
+        self.per_page = config.selector_snapshots_per_page
+        self.logger = Logger()
+        self._lock = threading.Lock()
+        self._seen: set[tuple[str, str]] = set()
+        self._digests: dict[str, set[str]] = defaultdict(set)
+        self._samples: dict[str, dict[str, list[str]]] = defaultdict(lambda: defaultdict(list))
+
+    def wants(self, page_name: str, selector) -> bool:
+        # One snapshot per page and element the page acts on, so menus and dialogs opened mid-test are covered
+        if not self.enabled:
+            return False
+        with self._lock:
+            key = (page_name, str(selector))
+            if key in self._seen or len(self._digests[page_name]) >= self.per_page:
+                return False
+            self._seen.add(key)
+            return True
+
+    def capture(self, page_name: str, html: str) -> Optional[Path]:
+        html = SCRIPT_TAG.sub('', html)
+        digest = hashlib.sha256(html.encode('utf-8')).hexdigest()[:12]
+        with self._lock:
+            if digest in self._digests[page_name] or len(self._digests[page_name]) >= self.per_page:
+                return None
+            self._digests[page_name].add(digest)
+        path = worker_path(self.directory) / f"{page_name}_{digest}.html"
+        path.write_text(html, encoding='utf-8')
+        self.logger.debug("DOM snapshot saved: %s", path)
+        return path
+
+    def record_sample(self, page_name: str, selector_name: str, selector: str) -> None:
+        # Parametrized selectors are replayed with the arguments the tests actually used
+        if not self.enabled:
+            return
+        with self._lock:
+            samples = self._samples[page_name][selector_name]
+            if selector not in samples and len(samples) < self.per_page:
+                samples.append(selector)
+
+    def save(self) -> Optional[Path]:
+        if not self.enabled or not self._samples:
+            return None
+        path = worker_path(self.directory) / 'samples.json'
+        with self._lock:
+            path.write_text(json.dumps(self._samples, indent=2), encoding='utf-8')
+        return path
+
+
+def load_snapshots(directory: Path) -> dict[str, list[Path]]:
+    snapshots = defaultdict(list)
+    for path in sorted(directory.rglob('*.html')):
+        page_name, _, _ = path.stem.rpartition('_')
+        snapshots[page_name].append(path)
+    return dict(snapshots)
+
+
+def load_samples(directory: Path) -> dict[str, dict[str, list[str]]]:
+    samples = defaultdict(lambda: defaultdict(list))
+    for path in sorted(directory.rglob('samples.json')):
+        for page_name, selectors in json.loads(path.read_text(encoding='utf-8')).items():
+            for name, values in selectors.items():
+                samples[page_name][name].extend(value for value in values if value not in samples[page_name][name])
+    return samples
+
+
+def selector_flags(selector: str) -> list[str]:
+    flags = []
+    is_xpath = selector.lstrip('(').startswith(('//', 'xpath='))
+    if is_xpath:
+        flags.append('xpath')
+        if TEXT_PREDICATE.search(selector):
+            flags.append('text predicate')
+    if '/..' in selector:
+        flags.append('parent traversal')
+    if POSITIONAL_INDEX.search(selector):
+        flags.append('positional index')
+    if BUILD_CLASS.search(selector):
+        flags.append('build-specific class')
+    return flags
+
+
+def _time_selector(page, selector: str, repeat: int) -> tuple[int, float]:
+    locator = page.locator(selector)
+    count = locator.count()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        locator.count()
+        samples.append(time.perf_counter() - start)
+    return count, statistics.median(samples) * 1000
+
+
+def _suggestions(page, selector: str, count: int, repeat: int) -> list[dict]:
+    from pages.locators import css_string
+    if count == 0:
+        return []
+    candidates = []
+    for element in page.locator(selector).evaluate_all(DESCRIBE_SCRIPT):
+        if element['testid']:
+            candidates.append(f"[data-testid={css_string(element['testid'])}]")
+        if element['role'] and element['name']:
+            candidates.append(f"role={element['role']}[name={css_string(element['name'])}]")
+
+    suggestions = []
+    for candidate in dict.fromkeys(candidates):
+        if candidate == selector:
+            continue
+        matches, median_ms = _time_selector(page, candidate, max(repeat // 5, 3))
+        # Only alternatives that still pick out the same number of elements are worth suggesting
+        if matches == count:
+            suggestions.append({'selector': candidate, 'median_ms': round(median_ms, 3)})
+    return suggestions
+
+
+def profile(snapshot_dir: Path, repeat: int) -> list[dict]:
+    from playwright.sync_api import sync_playwright
+    from pages.locators import inventory
+
+    snapshots = load_snapshots(snapshot_dir)
+    samples = load_samples(snapshot_dir)
+    rows = []
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=True)
+        try:
+            page = browser.new_page()
+            # Snapshots are replayed as static markup; stylesheets, images and fonts are never fetched
+            page.route('**/*', lambda route: route.abort())
+            for selector_row in inventory():
+                page_snapshots = snapshots.get(selector_row['page'], [])
+                if selector_row['params']:
+                    concrete = samples.get(selector_row['page'], {}).get(selector_row['name'], [])
+                else:
+                    concrete = [selector_row['selector']]
+                for path in page_snapshots:
+                    page.set_content(path.read_text(encoding='utf-8'))
+                    _, baseline_ms = _time_selector(page, BASELINE_SELECTOR, repeat)
+                    for selector in concrete:
+                        count, median_ms = _time_selector(page, selector, repeat)
+                        flags = selector_flags(selector)
+                        rows.append({
+                            'page': selector_row['page'],
+                            'name': selector_row['name'],
+                            'selector': selector,
+                            'snapshot': path.name,
+                            'matches': count,
+                            'median_ms': round(median_ms, 3),
+                            'cost_ms': round(max(median_ms - baseline_ms, 0.0), 3),
+                            'flags': flags,
+                            'suggestions': _suggestions(page, selector, count, repeat) if flags else [],
+                        })
+        finally:
+            browser.close()
+    return rank(rows)
+
+
+def rank(rows: list[dict]) -> list[dict]:
+    # One row per selector: the snapshot where it costs most, and the match counts seen across snapshots
+    ranked = {}
+    for row in rows:
+        key = (row['page'], row['name'], row['selector'])
+        best = ranked.get(key)
+        matches = (best['matches_seen'] if best else set()) | {row['matches']}
+        if best is None or row['cost_ms'] > best['cost_ms']:
+            best = {**row}
+        best['matches_seen'] = matches
+        ranked[key] = best
+
+    report = []
+    for row in ranked.values():
+        row['matches_seen'] = sorted(row.pop('matches_seen'))
+        if row['matches_seen'] == [0]:
+            row['flags'] = row['flags'] + ['no match']
+        elif max(row['matches_seen']) > 1:
+            row['flags'] = row['flags'] + ['multiple matches']
+        report.append(row)
+    return sorted(report, key=lambda row: (row['cost_ms'], len(row['flags'])), reverse=True)
+
+
+def format_table(rows: list[dict]) -> str:
+    header = f"{'Selector':<48} {'Cost ms':>8} {'Matches':>8}  Flags"
+    lines = [header, '-' * len(header)]
+    for row in rows:
+        matches = ','.join(str(count) for count in row['matches_seen'])
+        lines.append(f"{(row['page'] + '.' + row['name'])[:48]:<48} {row['cost_ms']:8.3f} {matches:>8}  {', '.join(row['flags'])}")
+        for suggestion in row['suggestions']:
+            lines.append(f"{'':<48} {suggestion['median_ms']:8.3f} {'':>8}  try {suggestion['selector']}")
+    return '\n'.join(lines)
+
+
+def main(argv: list | None = None) -> int:
+    config = ConfigManager()
+    parser = argparse.ArgumentParser(description="Replay page selectors against recorded DOM snapshots and rank their cost")
+    parser.add_argument('--snapshots', type=Path, default=config.selector_snapshot_dir,
+                        help="Directory with DOM snapshots recorded with [SELECTORS] snapshots = true")
+    parser.add_argument('--repeat', type=int, default=config.selector_profile_repeat, help="Timed lookups per selector and snapshot")
+    parser.add_argument('--json', action='store_true', help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    if not args.snapshots.exists() or not load_snapshots(args.snapshots):
+        print(f"No DOM snapshots found in {args.snapshots}, run the tests with --setting SELECTORS.snapshots=true first")
+        return 0
+
+    rows = profile(args.snapshots, args.repeat)
+    print(json.dumps(rows, indent=2) if args.json else format_table(rows))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
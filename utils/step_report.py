@@ -0,0 +1,110 @@
+import argparse
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+from utils.config_manager import ConfigManager
+
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def load_records(store_dir: Path, max_depth: int | None = None) -> list[dict]:
+    records = []
+    for store_file in sorted(store_dir.glob('*.jsonl')):
+        with open(store_file, 'r', encoding='utf-8') as file:
+            for line in file:
+                if line.strip():
+                    record = json.loads(line)
+                    if max_depth is None or record['depth'] <= max_depth:
+                        records.append(record)
+    return records
+
+
+def summarize(records: list[dict], threshold: float, min_delta: float) -> list[dict]:
+    # step -> run_id -> durations, with runs ordered by when they were first seen
+    durations = defaultdict(lambda: defaultdict(list))
+    run_order = {}
+    for record in records:
+        durations[record['step']][record['run_id']].append(record['duration'])
+        run_order[record['run_id']] = min(run_order.get(record['run_id'], record['timestamp']), record['timestamp'])
+
+    rows = []
+    for step, runs in durations.items():
+        all_durations = [duration for run in runs.values() for duration in run]
+        ordered_runs = sorted(runs, key=lambda run_id: run_order[run_id])
+        latest_p50 = percentile(runs[ordered_runs[-1]], 0.5)
+        history = [percentile(runs[run_id], 0.5) for run_id in ordered_runs[:-1]]
+        baseline = percentile(history, 0.5) if history else None
+
+        regressed = (
+            baseline is not None
+            and latest_p50 > baseline * (1 + threshold)
+            and latest_p50 - baseline >= min_delta
+        )
+        rows.append({
+            'step': step,
+            'runs': len(runs),
+            'samples': len(all_durations),
+            'p50': percentile(all_durations, 0.5),
+            'p95': percentile(all_durations, 0.95),
+            'max': max(all_durations),
+            'latest_p50': latest_p50,
+            'baseline_p50': baseline,
+            'regressed': regressed,
+        })
+
+    return sorted(rows, key=lambda row: row['p95'], reverse=True)
+
+
+def format_table(rows: list[dict]) -> str:
+    header = f"{'Step':<70} {'Runs':>5} {'p50':>8} {'p95':>8} {'Max':>8} {'Latest':>8} {'Base':>8}"
+    lines = [header, '-' * len(header)]
+    for row in rows:
+        baseline = f"{row['baseline_p50']:8.2f}" if row['baseline_p50'] is not None else f"{'-':>8}"
+        flag = '  REGRESSED' if row['regressed'] else ''
+        lines.append(
+            f"{row['step'][:70]:<70} {row['runs']:>5} {row['p50']:8.2f} {row['p95']:8.2f} "
+            f"{row['max']:8.2f} {row['latest_p50']:8.2f} {baseline}{flag}"
+        )
+    return '\n'.join(lines)
+
+
+def main(argv: list | None = None) -> int:
+    config = ConfigManager()
+    parser = argparse.ArgumentParser(description="Per-step latency report across recorded test runs")
+    parser.add_argument('--store', type=Path, default=config.step_timing_dir, help="Directory with step timing JSONL files")
+    parser.add_argument('--threshold', type=float, default=config.get_float('TIMING', 'regression_threshold', 0.25),
+                        help="Relative p50 increase over the historical p50 that counts as a regression")
+    parser.add_argument('--min-delta', type=float, default=config.get_float('TIMING', 'regression_min_delta', 0.5),
+                        help="Minimum absolute increase in seconds that counts as a regression")
+    parser.add_argument('--max-depth', type=int, default=None, help="Only include steps up to this nesting depth (1 = test steps)")
+    parser.add_argument('--json', action='store_true', help="Print the report as JSON")
+    parser.add_argument('--fail-on-regression', action='store_true', help="Exit with status 1 if any step regressed")
+    args = parser.parse_args(argv)
+
+    records = load_records(args.store, args.max_depth)
+    if not records:
+        print(f"No step timings found in {args.store}")
+        return 0
+
+    rows = summarize(records, args.threshold, args.min_delta)
+    print(json.dumps(rows, indent=2) if args.json else format_table(rows))
+
+    regressed = [row for row in rows if row['regressed']]
+    for row in regressed:
+        slower = row['latest_p50'] - row['baseline_p50']
+        print(f"Regression: '{row['step']}' got {slower:.2f}s slower (p50 {row['baseline_p50']:.2f}s -> {row['latest_p50']:.2f}s)")
+
+    return 1 if regressed and args.fail_on_regression else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,82 @@
+import contextvars
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+import allure_commons
+from utils.helpers import UNIQUE_ID_PATTERN, get_worker_id, generate_timestamp
+
+_LOCAL_RUN_ID = generate_timestamp()
+
+
+def get_run_id() -> str:
+    # xdist hands every worker of one run the same id; single-process runs fall back to the start time
+    return os.environ.get('PYTEST_XDIST_TESTRUNUID') or _LOCAL_RUN_ID
+
+
+def normalize_step_title(title: str) -> str:
+    return UNIQUE_ID_PATTERN.sub('{id}', title)
+
+
+class StepTimer:
+
+    def __init__(self, store_dir: Path, browser: str):
+        self.store_dir = store_dir
+        self.browser = browser
+        self.run_id = get_run_id()
+        self.worker = get_worker_id()
+        self.test_id: Optional[str] = None
+        # Per context rather than per timer, so coroutines running side by side each keep their own step stack
+        self._stack: contextvars.ContextVar[tuple] = contextvars.ContextVar(f'step_timer_{id(self)}', default=())
+        self._records: list[dict] = []
+
+    @property
+    def store_path(self) -> Path:
+        return self.store_dir / f"{self.run_id}_{self.worker}.jsonl"
+
+    def start_test(self, test_id: str) -> None:
+        self.test_id = test_id
+        self._stack.set(())
+        self._records.clear()
+
+    def finish_test(self) -> list[dict]:
+        records = list(self._records)
+        if records:
+            self.store_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.store_path, 'a', encoding='utf-8') as file:
+                file.writelines(json.dumps(record) + '\n' for record in records)
+        self.test_id = None
+        self._records.clear()
+        return records
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        self._stack.set(self._stack.get() + ((uuid, normalize_step_title(str(title)), time.perf_counter()),))
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        stack = self._stack.get()
+        position = next((index for index in range(len(stack) - 1, -1, -1) if stack[index][0] == uuid), None)
+        if position is None:
+            return
+
+        # Steps opened above this one were never closed; dropping them keeps every later step's parent and depth right
+        (_, title, start), stack = stack[position], stack[:position]
+        self._stack.set(stack)
+        if self.test_id is None:
+            return
+
+        self._records.append({
+            'run_id': self.run_id,
+            'worker': self.worker,
+            'browser': self.browser,
+            'test_id': self.test_id,
+            'step': title,
+            'parent': stack[-1][1] if stack else None,
+            'depth': len(stack) + 1,
+            'duration': round(time.perf_counter() - start, 4),
+            'status': 'failed' if exc_type else 'passed',
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+        })
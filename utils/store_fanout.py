@@ -0,0 +1,219 @@
+import argparse
+import asyncio
+import json
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+from urllib.parse import quote
+from playwright.async_api import Browser, APIRequestContext, async_playwright
+from utils.config_manager import ConfigManager
+from utils.logger import Logger
+from utils.browser_manager import BrowserManager
+from utils.helpers import generate_polygon_name, generate_timestamp
+from utils.step_report import percentile
+from pages.aio.login_page import LoginPage
+from pages.aio.home_page import HomePage
+from pages.aio.store_details_page import StoreDetailsPage
+from pages.aio.create_polygon_page import CreatePolygonPage
+
+
+async def login(browser: Browser) -> dict:
+    config = ConfigManager()
+    Logger().info(f"Logging in once to share the session across contexts: {config.username}")
+    context = await browser.new_context(**BrowserManager.CONTEXT_OPTIONS)
+    context.set_default_timeout(config.timeout)
+    try:
+        login_page = LoginPage(await context.new_page())
+        await login_page.navigate_to_login()
+        await login_page.login(config.username, config.password)
+        await login_page.page.locator(HomePage.STORES_NAV).wait_for(state='visible')
+        return await context.storage_state()
+    finally:
+        await context.close()
+
+
+async def collect_store_codes(
+    request: APIRequestContext,
+    status: Optional[str] = None,
+    limit: int = 0,
+    api_base_url: Optional[str] = None
+) -> list[str]:
+    config = ConfigManager()
+    url = (api_base_url or config.api_base_url).rstrip('/') + '/' + config.api_path('stores')
+    response = await request.get(url)
+    if not response.ok:
+        raise AssertionError(f"API GET {url} failed with {response.status}: {await response.text()}")
+
+    body = await response.json()
+    stores = body.get('data', body) if isinstance(body, dict) else body
+    codes = [store['code'] for store in stores if not status or store.get('status') == status]
+    return codes[:limit] if limit else codes
+
+
+class StoreFanout:
+
+    def __init__(
+        self,
+        browser: Browser,
+        storage_state: Optional[dict] = None,
+        concurrency: Optional[int] = None,
+        store_url: Optional[Callable[[str], str]] = None
+    ):
+        self.config = ConfigManager()
+        self.logger = Logger()
+        self.browser = browser
+        self.storage_state = storage_state
+        self.concurrency = concurrency or self.config.fanout_concurrency
+        self.store_url = store_url or self.config.store_url
+
+    async def run(self, store_codes: list[str]) -> list[dict]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        self.logger.info("Running polygon workflow for %s stores, %s at a time", len(store_codes), self.concurrency)
+
+        async def limited(store_code: str) -> dict:
+            async with semaphore:
+                return await self.run_store(store_code)
+
+        return await asyncio.gather(*(limited(store_code) for store_code in store_codes))
+
+    async def run_store(self, store_code: str) -> dict:
+        result = {'store_code': store_code, 'status': 'passed', 'error': None, 'polygon': None, 'steps': {}}
+        start = time.perf_counter()
+
+        context = await self.browser.new_context(**BrowserManager.CONTEXT_OPTIONS, storage_state=self.storage_state)
+        context.set_default_timeout(self.config.timeout)
+        store_details_page = StoreDetailsPage(await context.new_page())
+        try:
+            await self._workflow(store_details_page, store_code, result)
+        except Exception as e:
+            # One failing store must not stop the batch, so the error is recorded and the rest carry on
+            result['status'] = 'failed'
+            result['error'] = f"{type(e).__name__}: {e}"
+            self.logger.error("Store %s failed: %s", store_code, result['error'])
+            try:
+                await store_details_page.take_screenshot(f"fanout_{quote(store_code, safe='')}")
+            except Exception as screenshot_error:
+                self.logger.debug("Could not capture screenshot for %s: %s", store_code, screenshot_error)
+        finally:
+            await context.close()
+
+        result['duration'] = round(time.perf_counter() - start, 3)
+        self.logger.info("Store %s %s in %.2fs", store_code, result['status'], result['duration'])
+        return result
+
+    async def _workflow(self, store_details_page: StoreDetailsPage, store_code: str, result: dict) -> None:
+        create_polygon_page = CreatePolygonPage(store_details_page.page)
+        name = generate_polygon_name(f'fanout_{store_code}')
+        result['polygon'] = name
+
+        with self._step(result, 'open_store'):
+            await store_details_page.navigate(self.store_url(store_code))
+            await store_details_page.wait_for_element(StoreDetailsPage.STORE_DETAILS_HEADING)
+
+        with self._step(result, 'create'):
+            await store_details_page.click_create_polygon()
+            await create_polygon_page.create_qc_polygon_travel_time(
+                name=name,
+                travel_time=self.config.get_int('POLYGON', 'qc_travel_time', 18),
+                max_promise_time=self.config.get_int('POLYGON', 'qc_max_promise_time', 15)
+            )
+
+        with self._step(result, 'validate'):
+            await store_details_page.search_polygon(name)
+            assert await store_details_page.is_polygon_visible(name), f"Polygon '{name}' not found in list"
+
+        travel_distance = self.config.get_int('POLYGON', 'qc_travel_distance', 200)
+        with self._step(result, 'edit'):
+            await store_details_page.click_edit_polygon(name)
+            await create_polygon_page.edit_polygon_change_to_travel_distance(travel_distance)
+            await store_details_page.search_polygon(name)
+            assert await store_details_page.verify_polygon_travel_distance(name, str(travel_distance)), \
+                f"Polygon '{name}' travel distance not updated"
+
+        with self._step(result, 'deactivate'):
+            await store_details_page.set_polygon_inactive(name)
+            await store_details_page.search_polygon(name)
+            assert await store_details_page.verify_polygon_status(name, 'Inactive'), f"Polygon '{name}' is not Inactive"
+
+    @contextmanager
+    def _step(self, result: dict, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            result['steps'][name] = round(time.perf_counter() - start, 3)
+
+
+def summarize(results: list[dict]) -> dict:
+    durations = [result['duration'] for result in results]
+    failed = [result for result in results if result['status'] == 'failed']
+    step_names = dict.fromkeys(name for result in results for name in result['steps'])
+    return {
+        'stores': len(results),
+        'passed': len(results) - len(failed),
+        'failed': len(failed),
+        'p50': round(percentile(durations, 0.5), 3),
+        'p95': round(percentile(durations, 0.95), 3),
+        'steps_p50': {
+            name: round(percentile([r['steps'][name] for r in results if name in r['steps']], 0.5), 3)
+            for name in step_names
+        },
+        'failures': {result['store_code']: result['error'] for result in failed},
+    }
+
+
+def write_results(results: list[dict], results_dir: Path) -> Path:
+    results_dir.mkdir(parents=True, exist_ok=True)
+    path = results_dir / f"fanout_{generate_timestamp()}.json"
+    report = {
+        'finished': datetime.now().isoformat(timespec='seconds'),
+        'summary': summarize(results),
+        'results': results,
+    }
+    path.write_text(json.dumps(report, indent=2), encoding='utf-8')
+    return path
+
+
+async def run_fanout(concurrency: int, status: Optional[str], limit: int, store_codes: list[str]) -> list[dict]:
+    config = ConfigManager()
+    async with async_playwright() as playwright:
+        browser = await getattr(playwright, config.browser).launch(
+            headless=config.headless,
+            slow_mo=config.slow_mo
+        )
+        try:
+            storage_state = await login(browser)
+            if not store_codes:
+                context = await browser.new_context(storage_state=storage_state)
+                try:
+                    store_codes = await collect_store_codes(context.request, status=status, limit=limit)
+                finally:
+                    await context.close()
+            return await StoreFanout(browser, storage_state, concurrency).run(store_codes)
+        finally:
+            await browser.close()
+
+
+def main(argv: list | None = None) -> int:
+    config = ConfigManager()
+    parser = argparse.ArgumentParser(description="Run the polygon workflow against many stores concurrently")
+    parser.add_argument('--concurrency', type=int, default=config.fanout_concurrency, help="Stores processed at the same time")
+    parser.add_argument('--status', default=config.fanout_store_status, help="Only stores with this status (empty for all)")
+    parser.add_argument('--limit', type=int, default=config.fanout_max_stores, help="Maximum number of stores (0 for all)")
+    parser.add_argument('--store', action='append', default=[], help="Run only this store code (repeatable)")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run_fanout(args.concurrency, args.status or None, args.limit, args.store))
+    path = write_results(results, config.fanout_results_dir)
+
+    summary = summarize(results)
+    print(json.dumps(summary, indent=2))
+    print(f"Per-store results written to {path}")
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
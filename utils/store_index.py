@@ -0,0 +1,107 @@
+import json
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Optional
+from utils.config_manager import ConfigManager
+from utils.helpers import write_text_atomic
+from utils.logger import Logger
+
+
+class StoreIndex:
+
+    def __init__(self, stores: list[dict]):
+        self.stores = stores
+        self._by_code = {store['code']: store for store in stores}
+        self._by_name = {store.get('name', '').casefold(): store for store in stores}
+        self._by_status: dict[str, list[dict]] = defaultdict(list)
+        for store in stores:
+            self._by_status[store.get('status')].append(store)
+
+    def __len__(self) -> int:
+        return len(self.stores)
+
+    def get(self, code: str) -> Optional[dict]:
+        return self._by_code.get(code)
+
+    def by_name(self, name: str) -> Optional[dict]:
+        return self._by_name.get(name.casefold())
+
+    def with_status(self, status: str) -> list[dict]:
+        return list(self._by_status.get(status, []))
+
+    def first(self, status: Optional[str] = None) -> Optional[dict]:
+        stores = self._by_status.get(status, []) if status else self.stores
+        return stores[0] if stores else None
+
+
+class StoreIndexCache:
+    # Store list fetched once per session from the API and shared on disk between workers and runs until the TTL
+    _instance: Optional['StoreIndexCache'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(StoreIndexCache, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self) -> None:
+        self.config = ConfigManager()
+        self.logger = Logger()
+        self._index: Optional[StoreIndex] = None
+
+    @property
+    def index_path(self) -> Path:
+        return self.config.store_index_path
+
+    def get(self, api) -> StoreIndex:
+        if self._index is not None:
+            return self._index
+
+        stores = self._load(api.base_url)
+        if stores is None:
+            stores = api.list_stores()
+            self.record(stores, api.base_url)
+        self._index = StoreIndex(stores)
+        return self._index
+
+    def find_live(self, api, status: str) -> Optional[dict]:
+        # Workflows flip stores Inactive and back, so a cached status is only a hint and each candidate is re-read
+        index = self.get(api)
+        candidates = index.with_status(status) + [store for store in index.stores if store.get('status') != status]
+        for store in candidates:
+            live = api.get_store(store['code'])
+            if live.get('status') == status:
+                return live
+        return None
+
+    def record(self, stores: list[dict], base_url: str) -> None:
+        path = self.index_path
+        write_text_atomic(path, json.dumps({'base_url': base_url, 'stores': stores}))
+        self._index = StoreIndex(stores)
+        self.logger.info("Cached store index with %s stores at: %s", len(stores), path)
+
+    def invalidate(self) -> None:
+        self.logger.info("Invalidating cached store index")
+        self._index = None
+        self.index_path.unlink(missing_ok=True)
+
+    def _load(self, base_url: str) -> Optional[list[dict]]:
+        path = self.index_path
+        if not path.exists():
+            return None
+
+        age = time.time() - path.stat().st_mtime
+        if age > self.config.store_index_ttl:
+            self.logger.info("Cached store index expired (%.0fs old, TTL %ss)", age, self.config.store_index_ttl)
+            return None
+
+        try:
+            cached = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            self.logger.warning("Could not read cached store index %s: %s", path, e)
+            return None
+        # A run against the stub server must not pick up the live store list, or the other way round
+        if cached.get('base_url') != base_url:
+            return None
+        return cached['stores']
@@ -0,0 +1,104 @@
+import re
+import shutil
+import tempfile
+import threading
+from collections import deque
+from pathlib import Path
+import allure
+import allure_commons
+from utils.logger import Logger
+
+MODES = ('off', 'on', 'retain-on-failure')
+
+
+def trace_dir_for(traces_dir: Path, node_id: str) -> Path:
+    return traces_dir / re.sub(r'[^A-Za-z0-9_.-]+', '_', node_id).strip('_')
+
+
+class StepTracer:
+    # Records one trace chunk per top-level allure step; a chunk runs until the next top-level step starts
+
+    def __init__(self, tracing, output_dir: Path, mode: str = 'retain-on-failure', chunks_kept: int = 2):
+        self.tracing = tracing
+        self.output_dir = output_dir
+        self.mode = mode
+        self.chunks_kept = max(chunks_kept, 1)
+        self.logger = Logger()
+        self._thread = threading.get_ident()
+        self._buffer_dir = Path(tempfile.mkdtemp(prefix='traces-'))
+        # Passing chunks only live in this bounded buffer; the oldest file is deleted as each new chunk lands
+        self._buffer: deque[tuple[str, Path]] = deque()
+        self._retained: list[tuple[str, Path]] = []
+        self._stack: list[str] = []
+        self._chunk_title = 'Test start'
+        self._chunks = 0
+
+    def start(self, title: str) -> None:
+        # Starting the trace also starts the first chunk, which covers everything before the first step
+        self.tracing.start(title=title, screenshots=True, snapshots=True)
+
+    def _stop_chunk(self) -> None:
+        self._chunks += 1
+        safe_title = re.sub(r'[^A-Za-z0-9_.-]+', '_', self._chunk_title).strip('_')[:60] or 'chunk'
+        path = self._buffer_dir / f"{self._chunks:03d}_{safe_title}.zip"
+        self.tracing.stop_chunk(path=path)
+        self._buffer.append((self._chunk_title, path))
+        if self.mode != 'on':
+            while len(self._buffer) > self.chunks_kept:
+                _, evicted = self._buffer.popleft()
+                evicted.unlink(missing_ok=True)
+
+    def _start_chunk(self, title: str) -> None:
+        self._chunk_title = title
+        self.tracing.start_chunk(title=title)
+
+    def _retain_last_chunks(self) -> None:
+        # Moves the failing chunk and the one before it out of the buffer so later chunks cannot evict them
+        while self._buffer and len(self._retained) < self.chunks_kept:
+            self._retained.insert(0, self._buffer.pop())
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        # Playwright's sync API is bound to its thread, so steps from other threads are left out of the trace
+        if threading.get_ident() != self._thread:
+            return
+        self._stack.append(uuid)
+        if len(self._stack) == 1:
+            self._stop_chunk()
+            self._start_chunk(str(title))
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        if threading.get_ident() != self._thread or not self._stack or self._stack[-1] != uuid:
+            return
+        self._stack.pop()
+        if self.mode == 'retain-on-failure' and not self._stack and exc_type is not None and not self._retained:
+            self.logger.info("Step '%s' failed, keeping its trace chunk", self._chunk_title)
+            self._stop_chunk()
+            self._retain_last_chunks()
+            self._start_chunk(f"After {self._chunk_title}")
+
+    def finish(self, failed: bool) -> list[Path]:
+        try:
+            if self.mode == 'on' or (failed and not self._retained):
+                self._stop_chunk()
+                if self.mode != 'on':
+                    self._retain_last_chunks()
+            else:
+                self.tracing.stop_chunk()
+            self.tracing.stop()
+
+            if self.mode == 'on':
+                chunks = list(self._buffer)
+            else:
+                chunks = self._retained if failed else []
+            return [self._save(title, path) for title, path in chunks]
+        finally:
+            shutil.rmtree(self._buffer_dir, ignore_errors=True)
+
+    def _save(self, title: str, path: Path) -> Path:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        saved = Path(shutil.move(str(path), str(self.output_dir / path.name)))
+        allure.attach.file(str(saved), name=f"Trace - {title}", extension='zip')
+        self.logger.info("Trace chunk saved: %s", saved)
+        return saved
@@ -0,0 +1,120 @@
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+import allure
+from playwright.sync_api import Page
+from utils.logger import Logger
+
+
+def workflow_dir_for(checkpoint_dir: Path, name: str) -> Path:
+    return checkpoint_dir / re.sub(r'[^A-Za-z0-9_.-]+', '_', name).strip('_')
+
+
+class WorkflowStep:
+
+    def __init__(self, number: int, title: str, func: Callable[[dict], None], requires: tuple):
+        self.number = number
+        self.title = title
+        self.func = func
+        self.requires = requires
+
+    def __repr__(self) -> str:
+        return f"Step {self.number}: {self.title}"
+
+
+class Workflow:
+
+    def __init__(self, name: str, checkpoint_dir: Optional[Path] = None, checkpoint: Optional[dict] = None):
+        self.logger = Logger()
+        self.name = name
+        self.checkpoint_dir = workflow_dir_for(checkpoint_dir, name) if checkpoint_dir else None
+        self.checkpoint = checkpoint
+        self.steps: dict[int, WorkflowStep] = {}
+        self.state: dict = dict(checkpoint['state']) if checkpoint else {}
+        self.completed: list[int] = list(checkpoint['completed']) if checkpoint else []
+
+    def step(self, number: int, title: str, requires: tuple = ()):
+        def decorator(func: Callable[[dict], None]) -> Callable[[dict], None]:
+            if number in self.steps:
+                raise ValueError(f"Duplicate workflow step: {number}")
+            # Requirements must already be registered, so registration order is always a valid run order
+            unknown = [required for required in requires if required not in self.steps]
+            if unknown:
+                raise ValueError(f"Step {number} requires unknown steps: {unknown}")
+            self.steps[number] = WorkflowStep(number, title, func, tuple(requires))
+            return func
+        return decorator
+
+    def dependencies(self, number: int) -> set[int]:
+        pending = list(self.steps[number].requires)
+        found = set()
+        while pending:
+            required = pending.pop()
+            if required not in found:
+                found.add(required)
+                pending.extend(self.steps[required].requires)
+        return found
+
+    def run(self, page: Page, resume_from: Optional[int] = None) -> None:
+        pending = list(self.steps.values())
+
+        if resume_from is not None:
+            if resume_from not in self.steps:
+                raise ValueError(f"Unknown step to resume from: {resume_from}. Steps: {sorted(self.steps)}")
+            if self.checkpoint is None:
+                raise ValueError(f"No checkpoint to resume step {resume_from} from in {self.checkpoint_dir}")
+
+            missing = self.dependencies(resume_from) - set(self.completed)
+            if missing:
+                raise ValueError(f"Checkpoint after step {self.checkpoint['step']} is missing steps {sorted(missing)} "
+                                 f"required by step {resume_from}")
+
+            self.logger.info("Resuming '%s' at step %s from checkpoint of step %s", self.name, resume_from, self.checkpoint['step'])
+            page.goto(self.checkpoint['url'])
+            pending = pending[[step.number for step in pending].index(resume_from):]
+        else:
+            self.clear_checkpoints()
+
+        for step in pending:
+            with allure.step(str(step)):
+                step.func(self.state)
+            self.completed.append(step.number)
+            self.save_checkpoint(page, step)
+
+    def save_checkpoint(self, page: Page, step: WorkflowStep) -> None:
+        if self.checkpoint_dir is None:
+            return
+
+        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        checkpoint = {
+            'workflow': self.name,
+            'step': step.number,
+            'title': step.title,
+            'completed': self.completed,
+            'url': page.url,
+            'state': self.state,
+            'storage_state': page.context.storage_state(),
+            'saved': datetime.now().isoformat(timespec='seconds'),
+        }
+        path = self.checkpoint_dir / f"step_{step.number:02d}.json"
+        path.write_text(json.dumps(checkpoint, indent=2), encoding='utf-8')
+        self.logger.debug("Saved checkpoint after %s: %s", step, path)
+
+    def clear_checkpoints(self) -> None:
+        if self.checkpoint_dir is not None and self.checkpoint_dir.exists():
+            for path in self.checkpoint_dir.glob('step_*.json'):
+                path.unlink()
+
+
+def load_checkpoint(checkpoint_dir: Path, name: str, resume_from: int) -> Optional[dict]:
+    # The checkpoint saved right before the resumed step holds everything completed up to it
+    candidates = []
+    for path in workflow_dir_for(checkpoint_dir, name).glob('step_*.json'):
+        number = int(path.stem.split('_')[1])
+        if number < resume_from:
+            candidates.append((number, path))
+    if not candidates:
+        return None
+    return json.loads(max(candidates)[1].read_text(encoding='utf-8'))